@@ -1,31 +1,54 @@
 import os
+import io
+import atexit
+import base64
+import bisect
+import copy
+import csv
+import hashlib
+import hmac
+import queue
 import sys
 import uuid
 import json
-import ssl
+import random
 import re
-import urllib.error
-import urllib.request
+import threading
+import zlib
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
-from flask import Flask, render_template, redirect, url_for, request, flash, g, has_request_context
+import click
+from flask import Flask, Response, render_template, redirect, url_for, request, flash, g, has_app_context, has_request_context, stream_with_context
+from flask import session as flask_session
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session as FlaskSQLAlchemySession
 from flask_login import LoginManager, UserMixin, login_user, logout_user, current_user, login_required
 from flask_bcrypt import Bcrypt
+from jinja2 import FileSystemBytecodeCache
 import logging
+import logging.handlers
 import time
+from collections import OrderedDict, defaultdict, namedtuple
 from datetime import datetime, timezone
-from dotenv import load_dotenv
+from sqlalchemy import create_engine, delete, func, insert, inspect, or_, select, update
 from sqlalchemy.dialects import registry as sqlalchemy_registry
-from sqlalchemy.engine import make_url
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.orm import joinedload
-from werkzeug.exceptions import HTTPException
+from sqlalchemy.sql.dml import UpdateBase
+
 try:
-    import certifi
-except ImportError:
-    certifi = None
+    import fcntl
+except ImportError:  # Windows: dead-worker metric merges go unlocked.
+    fcntl = None
+from werkzeug.exceptions import HTTPException
+
+# ssl, http.client and certifi are only needed when syncing with HenryGD, so they are
+# imported inside HenryGDClient. Vercel injects env vars itself, so the .env
+# lookup is skipped there.
+if os.getenv('VERCEL') != '1':
+    from dotenv import load_dotenv
 
-load_dotenv()
+    load_dotenv()
 
 app = Flask(__name__)
 
@@ -84,6 +107,448 @@ if not secret_key:
 app.config['SECRET_KEY'] = secret_key
 
 
+def parse_bcrypt_log_rounds(value, default=12):
+    try:
+        rounds = int(value)
+    except (TypeError, ValueError):
+        return default
+    # bcrypt only accepts costs from 4 to 31.
+    return min(max(rounds, 4), 31)
+
+
+def parse_positive_int(value, default):
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed > 0 else default
+
+
+def parse_positive_float(value, default):
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed > 0 else default
+
+
+app.config['BCRYPT_LOG_ROUNDS'] = parse_bcrypt_log_rounds(env_value('BCRYPT_LOG_ROUNDS', '12'))
+app.config['PASSWORD_HASH_WORKERS'] = parse_positive_int(
+    env_value('PASSWORD_HASH_WORKERS'),
+    max(1, min(4, os.cpu_count() or 1)),
+)
+app.config['PASSWORD_HASH_MAX_PENDING'] = parse_positive_int(
+    env_value('PASSWORD_HASH_MAX_PENDING'),
+    app.config['PASSWORD_HASH_WORKERS'] * 8,
+)
+# How long a login waits for a queue slot before answering 503. Kept short: a full queue means
+# the workers are saturated, and a waiting request only ties up a web thread.
+app.config['PASSWORD_HASH_WAIT_SECONDS'] = parse_positive_float(env_value('PASSWORD_HASH_WAIT_SECONDS'), 0.25)
+
+
+app.config['HENRYGD_CONNECT_TIMEOUT_SECONDS'] = parse_positive_float(env_value('HENRYGD_CONNECT_TIMEOUT_SECONDS'), 5.0)
+app.config['HENRYGD_READ_TIMEOUT_SECONDS'] = parse_positive_float(env_value('HENRYGD_READ_TIMEOUT_SECONDS'), 30.0)
+app.config['HENRYGD_MAX_ATTEMPTS'] = parse_positive_int(env_value('HENRYGD_MAX_ATTEMPTS'), 3)
+app.config['HENRYGD_RETRY_BACKOFF_SECONDS'] = parse_positive_float(env_value('HENRYGD_RETRY_BACKOFF_SECONDS'), 0.5)
+# Live scores are fetched per in-progress game, LIVE_SCORES_MAX_CONCURRENCY at a time, and
+# reused for LIVE_SCORES_TTL_SECONDS across all viewers.
+app.config['LIVE_SCORES_ENABLED'] = env_value('LIVE_SCORES_ENABLED', '1') != '0'
+app.config['LIVE_SCORES_TTL_SECONDS'] = parse_positive_float(env_value('LIVE_SCORES_TTL_SECONDS'), 5.0)
+app.config['LIVE_SCORES_MAX_CONCURRENCY'] = parse_positive_int(env_value('LIVE_SCORES_MAX_CONCURRENCY'), 4)
+app.config['LIVE_SCORES_WAIT_SECONDS'] = parse_positive_float(env_value('LIVE_SCORES_WAIT_SECONDS'), 3.0)
+# Bracket payloads fetched by admin syncs are archived here for offline replay (page views
+# are not recorded). Vercel's filesystem is
+# read-only outside /tmp, so recording is opt-in there.
+app.config['HENRYGD_RECORD_DIR'] = env_value('HENRYGD_RECORD_DIR') or (
+    None if os.getenv('VERCEL') == '1' else os.path.join(app.instance_path, 'henrygd_payloads')
+)
+# Compiled template bytecode. TEMPLATE_CACHE_DIR is filled at build time by
+# `flask --app app precompile-templates` (the Vercel buildCommand runs it) and shipped with
+# the deployment; templates compiled at runtime are written to TEMPLATE_CACHE_RUNTIME_DIR
+# (instance/template_cache, or /tmp on Vercel) so the source tree is never written to.
+app.config['TEMPLATE_BYTECODE_CACHE'] = env_value('TEMPLATE_BYTECODE_CACHE', '1') != '0'
+app.config['TEMPLATE_CACHE_DIR'] = env_value('TEMPLATE_CACHE_DIR') or os.path.join(app.root_path, 'template_cache')
+app.config['TEMPLATE_CACHE_RUNTIME_DIR'] = env_value('TEMPLATE_CACHE_RUNTIME_DIR') or (
+    '/tmp/template_cache' if os.getenv('VERCEL') == '1' else os.path.join(app.instance_path, 'template_cache')
+)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja bytecode cache that reads a prebuilt directory first and writes misses to a writable one."""
+
+    def __init__(self, directory, runtime_directory=None):
+        super().__init__(directory, pattern='%s.jinja')
+        self.runtime_directory = runtime_directory or directory
+
+    def get_cache_key(self, name, filename=None):
+        # Key on the template name only: the cache is built at a different absolute path than
+        # it is served from. Jinja still discards entries whose source checksum changed.
+        return super().get_cache_key(name)
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is None and self.runtime_directory != self.directory:
+            try:
+                with open(os.path.join(self.runtime_directory, self.pattern % bucket.key), 'rb') as cache_file:
+                    bucket.load_bytecode(cache_file)
+            except OSError:
+                pass
+
+    def dump_bytecode(self, bucket):
+        path = os.path.join(self.runtime_directory, self.pattern % bucket.key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(self.runtime_directory, exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                bucket.write_bytecode(cache_file)
+            os.replace(temp_path, path)
+        except OSError:
+            # A read-only or full disk only costs a recompile on the next cold start.
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+# Prometheus metrics at /metrics, off unless METRICS_ENABLED=1 (bearer METRICS_TOKEN when set).
+# With METRICS_DIR set, each worker process writes its totals there every METRICS_FLUSH_SECONDS
+# and a scrape of any worker sums them all; without it each process reports only itself.
+app.config['METRICS_ENABLED'] = env_value('METRICS_ENABLED', '0') == '1'
+app.config['METRICS_TOKEN'] = env_value('METRICS_TOKEN') or None
+app.config['METRICS_DIR'] = env_value('METRICS_DIR') or None
+app.config['METRICS_FLUSH_SECONDS'] = parse_positive_float(env_value('METRICS_FLUSH_SECONDS'), 10.0)
+app.config['SEASON_ARCHIVE_DIR'] = env_value('SEASON_ARCHIVE_DIR') or os.path.join(app.root_path, 'seasons')
+# Admin-only request profiling (`?profile=1` or `X-Profile: 1`). Profiles are written to
+# PROFILE_DIR, at most one request at a time per process and no more often than
+# PROFILE_MIN_INTERVAL_SECONDS; only the newest PROFILE_MAX_FILES are kept.
+app.config['PROFILING_ENABLED'] = env_value('PROFILING_ENABLED', '1') != '0'
+app.config['PROFILE_DIR'] = env_value('PROFILE_DIR') or (
+    '/tmp/profiles' if os.getenv('VERCEL') == '1' else os.path.join(app.instance_path, 'profiles')
+)
+app.config['PROFILE_MIN_INTERVAL_SECONDS'] = parse_positive_float(env_value('PROFILE_MIN_INTERVAL_SECONDS'), 5.0)
+app.config['PROFILE_MAX_FILES'] = parse_positive_int(env_value('PROFILE_MAX_FILES'), 20)
+
+
+if app.config['TEMPLATE_BYTECODE_CACHE']:
+    app.jinja_env.bytecode_cache = TemplateBytecodeCache(
+        app.config['TEMPLATE_CACHE_DIR'], app.config['TEMPLATE_CACHE_RUNTIME_DIR']
+    )
+
+
+def precompile_templates(directory=None):
+    """Compile every template into ``directory`` and return ``[(name, compile_ms)]``."""
+    directory = directory or app.config['TEMPLATE_CACHE_DIR']
+    cache = TemplateBytecodeCache(directory)
+    os.makedirs(directory, exist_ok=True)
+    cache.clear()
+    env = app.jinja_env.overlay(bytecode_cache=cache, cache_size=0)
+    timings = []
+    for name in sorted(env.list_templates(extensions=('html',))):
+        started = time.perf_counter()
+        env.get_template(name)
+        timings.append((name, (time.perf_counter() - started) * 1000))
+    return timings
+
+
+@app.cli.command('precompile-templates')
+def precompile_templates_command():
+    """Compile all templates into TEMPLATE_CACHE_DIR so cold starts load bytecode instead."""
+    timings = precompile_templates()
+    for name, elapsed_ms in timings:
+        print(f"{elapsed_ms:8.1f}ms  {name}")
+    print(f"Precompiled {len(timings)} templates into {app.config['TEMPLATE_CACHE_DIR']}")
+
+
+# Static assets. Our own CSS/JS lives in static/css and static/js and is copied to
+# content-hashed names under static/dist by `flask --app app build-assets`, which also
+# vendors the third-party libraries below into static/vendor. Vercel runs it as the deploy's
+# buildCommand (vercel.json). Until a build has run, pages fall back to ?v=<hash> URLs for
+# our files and to the CDN for anything not vendored.
+STATIC_ASSET_MAX_AGE_SECONDS = 60 * 60 * 24 * 365
+STATIC_ASSET_SOURCE_DIRS = ('css', 'js')
+STATIC_ASSET_DIST_DIR = 'dist'
+STATIC_ASSET_MANIFEST = 'manifest.json'
+GOOGLE_FONTS_CSS_URL = (
+    'https://fonts.googleapis.com/css2?family=Barlow+Condensed:wght@600;700'
+    '&family=Manrope:wght@400;500;600;700;800&display=swap'
+)
+GOOGLE_FONTS_SUBSETS = ('latin', 'latin-ext')
+FONT_AWESOME_CDN_BASE = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/'
+# admin.html builds fa-check-circle/fa-times-circle from a condition, so the scan can't see them.
+FONT_AWESOME_EXTRA_ICONS = ('check-circle', 'times-circle')
+# Each library is pinned to the Subresource Integrity digest its maintainers publish, and
+# build-assets refuses to vendor bytes that don't match it. Google Fonts serves CSS that varies
+# by user agent, so it can't be pinned; subset_google_fonts_css keeps only its @font-face blocks.
+# A library without a pin is not vendored and keeps loading from its CDN.
+VENDOR_ASSETS = {
+    'fonts_css': ('vendor/fonts/fonts.css', GOOGLE_FONTS_CSS_URL, None),
+    'bootstrap_css': (
+        'vendor/bootstrap-5.1.3/bootstrap.min.css',
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css',
+        'sha384-1BmE4kWBq78iYhFldvKuhfTAU6auU8tT94WrHftjDbrCEXSU1oBoqyl2QvZ6jIW3',
+    ),
+    'bootstrap_js': (
+        'vendor/bootstrap-5.1.3/bootstrap.bundle.min.js',
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js',
+        'sha384-ka7Sk0Gln4gmtz2MlQnikT1wXgYsOg+OMhuP+IlRH9sENBO0LRn5q+8nbTov4+1p',
+    ),
+    'fontawesome_css': (
+        'vendor/fontawesome-6.0.0-beta3/css/all.min.css',
+        f'{FONT_AWESOME_CDN_BASE}css/all.min.css',
+        'sha512-Fo3rlrZj/k7ujTnHg4CGR2D7kSs0v4LLanw2qksYuRlEzO+tcaEPQogQ0KaoGN26/zrn20ImR1DfuLWnOo7aBA==',
+    ),
+    'chart_js': (
+        'vendor/chart.js-4.4.1/chart.umd.js',
+        'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js',
+        None,
+    ),
+}
+
+_asset_manifest = None
+_asset_digests = {}
+
+
+def static_file_digest(path):
+    with open(path, 'rb') as asset_file:
+        return hashlib.sha256(asset_file.read()).hexdigest()[:12]
+
+
+def load_asset_manifest():
+    """Return the build manifest ``{'files': {source: dist_name}, 'preload_fonts': [...]}``, read once per process."""
+    global _asset_manifest
+    if _asset_manifest is None:
+        try:
+            with open(os.path.join(app.static_folder, STATIC_ASSET_DIST_DIR, STATIC_ASSET_MANIFEST)) as manifest_file:
+                _asset_manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            _asset_manifest = {}
+    return _asset_manifest
+
+
+def _static_asset_digest(filename):
+    # The debug server re-hashes on every render so edits to static/css and static/js show up.
+    if app.debug or filename not in _asset_digests:
+        try:
+            _asset_digests[filename] = static_file_digest(os.path.join(app.static_folder, filename))
+        except OSError:
+            _asset_digests[filename] = None
+    return _asset_digests[filename]
+
+
+def asset_url(filename):
+    """URL for a file under static/ that changes whenever its content does, so it can be cached forever."""
+    built = None if app.debug else load_asset_manifest().get('files', {}).get(filename)
+    if built:
+        return url_for('static', filename=f'{STATIC_ASSET_DIST_DIR}/{built}')
+    digest = _static_asset_digest(filename)
+    if digest:
+        return url_for('static', filename=filename, v=digest)
+    return url_for('static', filename=filename)
+
+
+def static_url_is_immutable(response):
+    """Whether this static response is content that can never change: a hashed static/dist file,
+    or a ``?v=`` that matches the file's current digest (a stale or guessed ``v`` doesn't)."""
+    if request.endpoint != 'static' or response.status_code != 200 or not request.view_args:
+        return False
+    filename = request.view_args.get('filename', '')
+    if filename.startswith(f'{STATIC_ASSET_DIST_DIR}/'):
+        return filename[len(STATIC_ASSET_DIST_DIR) + 1:] in load_asset_manifest().get('files', {}).values()
+    version = request.args.get('v')
+    return bool(version) and version == _static_asset_digest(filename)
+
+
+def vendor_url(name):
+    local_path, cdn_url, _ = VENDOR_ASSETS[name]
+    if _static_asset_digest(local_path):
+        return asset_url(local_path)
+    return cdn_url
+
+
+def vendor_origins():
+    """Origins still serving a library that has not been vendored yet, for preconnect hints."""
+    origins = []
+    for name, (local_path, cdn_url, _) in VENDOR_ASSETS.items():
+        if _static_asset_digest(local_path):
+            continue
+        parts = urlsplit(cdn_url)
+        origin = f'{parts.scheme}://{parts.netloc}'
+        if origin not in origins:
+            origins.append(origin)
+        if name == 'fonts_css':
+            origins.append('https://fonts.gstatic.com')
+    return origins
+
+
+def preload_fonts():
+    return [url_for('static', filename=path) for path in load_asset_manifest().get('preload_fonts', [])]
+
+
+app.jinja_env.globals.update(
+    asset_url=asset_url,
+    vendor_url=vendor_url,
+    vendor_origins=vendor_origins,
+    preload_fonts=preload_fonts,
+)
+
+
+def _download(url, user_agent='Mozilla/5.0 (march-madness asset build)'):
+    import urllib.request
+
+    request_obj = urllib.request.Request(url, headers={'User-Agent': user_agent})
+    with urllib.request.urlopen(request_obj, timeout=30, context=build_henrygd_ssl_context()) as response:
+        return response.read()
+
+
+def verify_integrity(content, integrity, url):
+    """Raise unless ``content`` matches an SRI digest such as ``sha384-<base64>``."""
+    algorithm, _, expected = integrity.partition('-')
+    actual = base64.b64encode(hashlib.new(algorithm, content).digest()).decode('ascii')
+    if not hmac.compare_digest(actual, expected):
+        raise RuntimeError(f"{url} does not match its pinned digest ({algorithm}-{actual} != {integrity})")
+    return content
+
+
+def _write_static(filename, content):
+    path = os.path.join(app.static_folder, filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as static_file:
+        static_file.write(content)
+    _asset_digests.pop(filename, None)
+    return path
+
+
+def used_font_awesome_icons():
+    """Icon names referenced as ``fa-<name>`` in templates and static/js."""
+    icons = set(FONT_AWESOME_EXTRA_ICONS)
+    sources = [os.path.join(app.template_folder, name) for name in app.jinja_env.list_templates(extensions=('html',))]
+    js_dir = os.path.join(app.static_folder, 'js')
+    if os.path.isdir(js_dir):
+        sources += [os.path.join(js_dir, name) for name in os.listdir(js_dir)]
+    for source in sources:
+        with open(os.path.join(app.root_path, source), encoding='utf-8') as source_file:
+            icons.update(re.findall(r'\bfa-([a-z0-9]+(?:-[a-z0-9]+)*)', source_file.read()))
+    return icons
+
+
+# Build- and admin-only patterns are kept as strings; ``re`` compiles and caches them on first
+# use, which keeps them off the cold-start path.
+FONT_AWESOME_ICON_RULE = r'((?:\.fa-[a-z0-9-]+(?:::?before)?,?)+)\{((?:content|--fa):"[^"]*";?)\}'
+
+
+def subset_font_awesome_css(css, icons):
+    """Drop the per-icon glyph rules for icons we never use; everything else is kept verbatim."""
+    def keep_used(match):
+        selectors = [
+            selector for selector in match.group(1).split(',')
+            if selector and re.match(r'\.fa-([a-z0-9-]+?)(?:::?before)?$', selector).group(1) in icons
+        ]
+        return f"{','.join(selectors)}{{{match.group(2)}}}" if selectors else ''
+
+    return re.sub(FONT_AWESOME_ICON_RULE, keep_used, css)
+
+
+GOOGLE_FONTS_BLOCK = r'/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*\{[^}]*\})'
+
+
+def subset_google_fonts_css(css, subsets=GOOGLE_FONTS_SUBSETS):
+    """Keep only the ``/* <subset> */ @font-face {...}`` blocks for the given unicode subsets."""
+    blocks = re.findall(GOOGLE_FONTS_BLOCK, css)
+    return '\n'.join(f'/* {subset} */\n{block}' for subset, block in blocks if subset in subsets) + '\n'
+
+
+def vendor_static_assets(force=False):
+    """Download (and subset) each VENDOR_ASSETS library into static/vendor; returns the files written."""
+    written = []
+    for name, (local_path, cdn_url, integrity) in VENDOR_ASSETS.items():
+        if not force and _static_asset_digest(local_path):
+            continue
+        if integrity is None and name != 'fonts_css':
+            logger.warning("Not vendoring %s: no pinned digest; pages keep loading it from %s", name, cdn_url)
+            continue
+        try:
+            written.extend(_vendor_static_asset(name, local_path, cdn_url, integrity))
+        except OSError as exc:
+            logger.warning("Could not vendor %s (%s); pages keep loading it from %s", name, exc, cdn_url)
+    return written
+
+
+def _vendor_static_asset(name, local_path, cdn_url, integrity):
+    written = []
+    if name == 'fonts_css':
+        # Google only serves woff2 to browsers it recognises.
+        css = _download(cdn_url, 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36')
+        css = subset_google_fonts_css(css.decode('utf-8'))
+        font_dir = os.path.dirname(local_path)
+        for subset, block in re.findall(GOOGLE_FONTS_BLOCK, css):
+            for font_url in re.findall(r'url\((https://fonts\.gstatic\.com/[^)]+)\)', block):
+                # The subset prefix lets the manifest preload only the latin files.
+                font_name = f"{subset}-{hashlib.sha256(font_url.encode('utf-8')).hexdigest()[:12]}.woff2"
+                written.append(_write_static(f'{font_dir}/{font_name}', _download(font_url)))
+                css = css.replace(font_url, font_name)
+        written.append(_write_static(local_path, css.encode('utf-8')))
+    elif name == 'fontawesome_css':
+        css = verify_integrity(_download(cdn_url), integrity, cdn_url).decode('utf-8')
+        font_root = os.path.dirname(os.path.dirname(local_path))
+        for font_file in sorted(set(re.findall(r'url\(\.\./(webfonts/[^)?#]+\.woff2)', css))):
+            written.append(_write_static(f'{font_root}/{font_file}', _download(f'{FONT_AWESOME_CDN_BASE}{font_file}')))
+        written.append(_write_static(local_path, subset_font_awesome_css(css, used_font_awesome_icons()).encode('utf-8')))
+    else:
+        written.append(_write_static(local_path, verify_integrity(_download(cdn_url), integrity, cdn_url)))
+    return written
+
+
+def fingerprint_static_assets():
+    """Copy static/css and static/js to static/dist/<name>.<hash><ext> and write the manifest."""
+    global _asset_manifest
+    dist_dir = os.path.join(app.static_folder, STATIC_ASSET_DIST_DIR)
+    if os.path.isdir(dist_dir):
+        for stale in os.listdir(dist_dir):
+            os.remove(os.path.join(dist_dir, stale))
+    os.makedirs(dist_dir, exist_ok=True)
+
+    files = {}
+    for source_dir in STATIC_ASSET_SOURCE_DIRS:
+        source_root = os.path.join(app.static_folder, source_dir)
+        if not os.path.isdir(source_root):
+            continue
+        for name in sorted(os.listdir(source_root)):
+            stem, extension = os.path.splitext(name)
+            with open(os.path.join(source_root, name), 'rb') as source_file:
+                content = source_file.read()
+            built = f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{extension}"
+            with open(os.path.join(dist_dir, built), 'wb') as built_file:
+                built_file.write(content)
+            files[f'{source_dir}/{name}'] = built
+
+    font_dir = os.path.join(app.static_folder, os.path.dirname(VENDOR_ASSETS['fonts_css'][0]))
+    preload = []
+    if os.path.isdir(font_dir):
+        preload = [
+            f"{os.path.dirname(VENDOR_ASSETS['fonts_css'][0])}/{name}"
+            for name in sorted(os.listdir(font_dir)) if name.startswith('latin-') and name.endswith('.woff2')
+        ]
+    manifest = {'files': files, 'preload_fonts': preload}
+    with open(os.path.join(dist_dir, STATIC_ASSET_MANIFEST), 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    _asset_manifest = manifest
+    return manifest
+
+
+@app.cli.command('build-assets')
+@click.option('--skip-vendor', is_flag=True, help='Only fingerprint static/css and static/js (no downloads).')
+@click.option('--refresh-vendor', is_flag=True, help='Re-download vendored libraries even if present.')
+def build_assets_command(skip_vendor, refresh_vendor):
+    """Vendor third-party CSS/JS/fonts and fingerprint our own static assets."""
+    if not skip_vendor:
+        for path in vendor_static_assets(force=refresh_vendor):
+            print(f"vendored {os.path.relpath(path, app.root_path)}")
+    manifest = fingerprint_static_assets()
+    for source, built in sorted(manifest['files'].items()):
+        print(f"{source} -> {STATIC_ASSET_DIST_DIR}/{built}")
+    print(f"Fingerprinted {len(manifest['files'])} assets; {len(manifest['preload_fonts'])} fonts to preload")
+
+
 def normalize_database_url(raw_url):
     if not raw_url:
         return None
@@ -149,32 +614,288 @@ if not is_supported_url:
 
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'poolclass': NullPool}
+# SQLite (local and single-node deployments) runs in WAL mode with a connection pool so
+# pick writes don't block leaderboard reads; SQLITE_TUNING=0 restores the plain defaults.
+app.config['SQLITE_TUNING'] = env_value('SQLITE_TUNING', '1') != '0'
+app.config['SQLITE_BUSY_TIMEOUT_MS'] = parse_positive_int(env_value('SQLITE_BUSY_TIMEOUT_MS'), 5000)
+app.config['SQLITE_CACHE_SIZE_KB'] = parse_positive_int(env_value('SQLITE_CACHE_SIZE_KB'), 16384)
+app.config['SQLITE_MMAP_SIZE_BYTES'] = parse_positive_int(env_value('SQLITE_MMAP_SIZE_BYTES'), 128 * 1024 * 1024)
+app.config['SQLITE_POOL_SIZE'] = parse_positive_int(env_value('SQLITE_POOL_SIZE'), 5)
+
+
+def is_sqlite_url(url):
+    try:
+        return make_url(url).get_backend_name() == 'sqlite'
+    except Exception:
+        return False
+
+
+def build_engine_options(url):
+    if not (is_sqlite_url(url) and app.config['SQLITE_TUNING']):
+        return {'poolclass': NullPool}
+    # check_same_thread is safe to disable because the pool hands each connection to one
+    # thread at a time; Flask-SQLAlchemy swaps in StaticPool for in-memory databases.
+    return {
+        'poolclass': QueuePool,
+        'pool_size': app.config['SQLITE_POOL_SIZE'],
+        'max_overflow': app.config['SQLITE_POOL_SIZE'] * 2,
+        'connect_args': {
+            'check_same_thread': False,
+            'timeout': app.config['SQLITE_BUSY_TIMEOUT_MS'] / 1000,
+        },
+    }
+
+
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = build_engine_options(database_url)
 
 # Set up logging
 log_level_name = env_value('LOG_LEVEL', 'INFO').upper()
 log_level = getattr(logging, log_level_name, logging.INFO)
-logging.basicConfig(
-    level=log_level,
-    format='%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s',
+LOG_TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s'
+# LOG_FORMAT=json writes one JSON object per line. With LOG_ASYNC, records are handed to a
+# queue and written by a background thread (off by default on Vercel, which freezes the
+# process between invocations). LOG_SAMPLE_RATE is the fraction of successful requests whose
+# summary line is written, optionally only for the routes in LOG_SAMPLE_ROUTES; errors are
+# always written.
+app.config['LOG_FORMAT'] = 'json' if env_value('LOG_FORMAT', 'text').lower() == 'json' else 'text'
+app.config['LOG_ASYNC'] = env_value('LOG_ASYNC', '0' if os.getenv('VERCEL') == '1' else '1') != '0'
+try:
+    app.config['LOG_SAMPLE_RATE'] = min(max(float(env_value('LOG_SAMPLE_RATE', '1')), 0.0), 1.0)
+except ValueError:
+    app.config['LOG_SAMPLE_RATE'] = 1.0
+app.config['LOG_SAMPLE_ROUTES'] = frozenset(
+    route.strip() for route in (env_value('LOG_SAMPLE_ROUTES') or '').split(',') if route.strip()
 )
 logger = logging.getLogger(__name__)
 
-db = SQLAlchemy(app)
+# Optional read replica: GET requests read from DATABASE_READ_URL until they write. After a
+# write, the rest of that request and the user's next few seconds of requests stay on the
+# primary so they see their own changes despite replication lag.
+app.config['DATABASE_READ_STICKY_SECONDS'] = parse_positive_int(env_value('DATABASE_READ_STICKY_SECONDS'), 5)
+app.config['DATABASE_READ_RETRY_SECONDS'] = parse_positive_int(env_value('DATABASE_READ_RETRY_SECONDS'), 30)
+READ_REPLICA_HEALTH_CHECK_SECONDS = 5
+READ_ROUTING_METHODS = ('GET', 'HEAD')
+
+_read_engine = None
+_read_replica_checked_at = 0.0
+_read_replica_down_until = 0.0
+_read_replica_lock = threading.Lock()
+
+
+def _mark_read_replica_down(exc):
+    global _read_replica_down_until
+    _read_replica_down_until = time.monotonic() + app.config['DATABASE_READ_RETRY_SECONDS']
+    logger.warning(
+        "Read replica unavailable, using primary for %ss: %s",
+        app.config['DATABASE_READ_RETRY_SECONDS'],
+        exc,
+    )
+
+
+def _on_read_replica_error(context):
+    if context.is_disconnect or context.connection is None:
+        _mark_read_replica_down(context.original_exception)
+
+
+def configure_read_replica(url):
+    """Create (or with ``url=None`` remove) the engine GET requests read from."""
+    global _read_engine, _read_replica_checked_at, _read_replica_down_until
+    url = normalize_database_url(url)
+    if url:
+        is_supported, url_error = is_supported_sqlalchemy_url(url)
+        if not is_supported:
+            logger.warning("Ignoring invalid DATABASE_READ_URL '%s': %s", mask_database_url(url), url_error)
+            url = None
+    with _read_replica_lock:
+        if _read_engine is not None:
+            _read_engine.dispose()
+        _read_engine = create_engine(url, **build_engine_options(url)) if url else None
+        if _read_engine is not None:
+            db.event.listen(_read_engine, 'handle_error', _on_read_replica_error)
+        _read_replica_checked_at = 0.0
+        _read_replica_down_until = 0.0
+    return _read_engine
+
+
+def read_replica_available():
+    """True when a replica is configured and answered a ping in the last few seconds."""
+    global _read_replica_checked_at
+    engine = _read_engine
+    if engine is None:
+        return False
+    now = time.monotonic()
+    if now < _read_replica_down_until:
+        return False
+    if now - _read_replica_checked_at < READ_REPLICA_HEALTH_CHECK_SECONDS:
+        return True
+    try:
+        with engine.connect() as connection:
+            connection.exec_driver_sql('SELECT 1')
+    except Exception as exc:
+        _mark_read_replica_down(exc)
+        return False
+    _read_replica_checked_at = now
+    return True
+
+
+class RoutingSession(FlaskSQLAlchemySession):
+    """Sends reads in read-only GET requests to the replica and everything else to the primary."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and _read_engine is not None and has_request_context():
+            if self._flushing or isinstance(clause, UpdateBase):
+                g.db_wrote = True
+            elif _should_read_from_replica():
+                return _read_engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _should_read_from_replica():
+    if request.method not in READ_ROUTING_METHODS or g.get('db_wrote'):
+        return False
+    if flask_session.get('db_primary_until', 0) > time.time():
+        return False
+    return read_replica_available()
+
+
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
 bcrypt = Bcrypt(app)
+
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 
 
+@db.event.listens_for(Engine, 'connect')
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    if not app.config['SQLITE_TUNING'] or type(dbapi_connection).__module__ != 'sqlite3':
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        # WAL lets readers keep going while a writer commits; NORMAL only fsyncs at
+        # checkpoints, which is still crash-safe in WAL mode.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f"PRAGMA busy_timeout={app.config['SQLITE_BUSY_TIMEOUT_MS']}")
+        cursor.execute(f"PRAGMA cache_size=-{app.config['SQLITE_CACHE_SIZE_KB']}")
+        cursor.execute(f"PRAGMA mmap_size={app.config['SQLITE_MMAP_SIZE_BYTES']}")
+        cursor.execute('PRAGMA temp_store=MEMORY')
+    finally:
+        cursor.close()
+
+
 class RequestIdFilter(logging.Filter):
     def filter(self, record):
         record.request_id = getattr(g, 'request_id', '-') if has_request_context() else '-'
         return True
 
 
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per record, merging any ``request_fields`` passed through ``extra``."""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', '-'),
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'request_fields', None) or {})
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def build_log_formatter(log_format=None):
+    if (log_format or app.config['LOG_FORMAT']) == 'json':
+        return JsonLogFormatter()
+    return logging.Formatter(LOG_TEXT_FORMAT)
+
+
+class RequestQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps records structured for the writer thread's formatter.
+
+    Filters run here, on the logging thread, so the request id is captured before the
+    record leaves the request context.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def start_log_queue(handlers):
+    """Return ``(queue_handler, listener)`` writing to ``handlers`` from a background thread."""
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    queue_handler = RequestQueueHandler(log_queue)
+    queue_handler.addFilter(request_id_filter)
+    return queue_handler, listener
+
+
+def restart_log_queue(queue_handler, listener):
+    """Return a new listener on a fresh queue for a forked child; only the forking thread survives a fork."""
+    queue_handler.queue = queue.SimpleQueue()
+    new_listener = logging.handlers.QueueListener(
+        queue_handler.queue, *listener.handlers, respect_handler_level=listener.respect_handler_level
+    )
+    new_listener.start()
+    return new_listener
+
+
 request_id_filter = RequestIdFilter()
-for handler in logging.getLogger().handlers:
-    handler.addFilter(request_id_filter)
+_log_queue_handler = None
+_log_listener = None
+
+
+def _restart_log_listener_after_fork():
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener = restart_log_queue(_log_queue_handler, _log_listener)
+
+
+def _stop_log_listener():
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+def configure_logging():
+    """Install the app's log handler on the root logger unless the host already configured one."""
+    global _log_queue_handler, _log_listener
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    for handler in root.handlers:
+        handler.addFilter(request_id_filter)
+    if root.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(build_log_formatter())
+    if app.config['LOG_ASYNC']:
+        # The queue handler stamps the request id; the writer thread has no request context.
+        _log_queue_handler, _log_listener = start_log_queue([handler])
+        handler = _log_queue_handler
+        # Drain queued records on interpreter exit.
+        atexit.register(_stop_log_listener)
+    else:
+        handler.addFilter(request_id_filter)
+    root.addHandler(handler)
+
+
+configure_logging()
+if hasattr(os, 'register_at_fork'):
+    # Workers forked from a preloaded app (gunicorn --preload) restart the writer thread.
+    os.register_at_fork(after_in_child=_restart_log_listener_after_fork)
+
+
+configure_read_replica(env_value('DATABASE_READ_URL'))
 
 
 logger.info(
@@ -186,18 +907,378 @@ logger.info(
 )
 
 
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_DEFINITIONS = {
+    'march_madness_http_requests_total': ('counter', 'Responses by route, method and status.'),
+    'march_madness_http_request_duration_seconds': ('histogram', 'Request latency by route and method.'),
+    'march_madness_request_db_seconds': ('histogram', 'Database time spent by one request, by route.'),
+    'march_madness_request_db_queries_total': ('counter', 'SQL statements executed while serving requests, by route.'),
+    'march_madness_henrygd_fetch_duration_seconds': ('histogram', 'HenryGD API fetch time including retries, by outcome.'),
+    'march_madness_henrygd_fetches_total': ('counter', 'HenryGD API fetches by outcome.'),
+    'march_madness_syncs_total': ('counter', 'HenryGD tournament syncs applied.'),
+    'march_madness_sync_winners_updated_total': ('counter', 'Game winners set by HenryGD syncs.'),
+    'march_madness_sync_rounds_closed_total': ('counter', 'Rounds closed by HenryGD syncs.'),
+    'march_madness_sync_rounds_created_total': ('counter', 'Rounds created by HenryGD syncs.'),
+    'march_madness_cache_lookups_total': ('counter', 'Per-process cache lookups by cache and result (hit, stale or miss).'),
+}
+
+
+class MetricsRegistry:
+    """Process-local Prometheus counters and histograms, cheap enough for the request path.
+
+    An update is one lock and a dict write. ``flush`` writes this process's totals to
+    ``<directory>/<pid>.json`` and ``render`` sums every file there with the live totals, so a
+    scrape of any worker reports the whole deployment. As in prometheus_client's multiprocess
+    mode, an exiting worker folds its file into ``dead-workers.json`` and removes it, so its
+    counts survive without its pid file lingering; a file left by a killed worker is folded in
+    when a new process reuses its pid.
+    """
+
+    DEAD_WORKERS_FILE = 'dead-workers.json'
+
+    def __init__(self, buckets=METRICS_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._histograms = {}
+        self._last_flush = 0.0
+        self._flushing_pid = None
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] += amount
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # One count per bucket plus +Inf, then the running sum.
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            histogram[bucket] += 1
+            histogram[-1] += value
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': [[name, labels, value] for (name, labels), value in self._counters.items()],
+                'histograms': [[name, labels, list(values)] for (name, labels), values in self._histograms.items()],
+            }
+
+    def flush(self, directory, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_flush < app.config['METRICS_FLUSH_SECONDS']:
+            return
+        self._last_flush = now
+        pid = os.getpid()
+        path = os.path.join(directory, f"{pid}.json")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if self._flushing_pid != pid:
+                # First flush in this process: anything at our path belongs to a dead worker.
+                self._flushing_pid = pid
+                self.mark_process_dead(directory, pid)
+                atexit.register(self._retire, directory)
+            _write_json_atomically(path, self.snapshot())
+        except OSError:
+            logger.warning("Could not write metrics to %s", directory, exc_info=True)
+
+    def _retire(self, directory):
+        if self._flushing_pid != os.getpid():
+            return
+        try:
+            _write_json_atomically(os.path.join(directory, f"{os.getpid()}.json"), self.snapshot())
+            self.mark_process_dead(directory, os.getpid())
+        except OSError:
+            logger.warning("Could not retire metrics in %s", directory, exc_info=True)
+
+    def mark_process_dead(self, directory, pid):
+        """Fold ``<directory>/<pid>.json`` into the dead-worker totals and remove it."""
+        path = os.path.join(directory, f"{pid}.json")
+        if not os.path.exists(path):
+            return
+        dead_path = os.path.join(directory, self.DEAD_WORKERS_FILE)
+        with open(f"{dead_path}.lock", 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            snapshots = []
+            for snapshot_path in (dead_path, path):
+                try:
+                    with open(snapshot_path) as metrics_file:
+                        snapshots.append(json.load(metrics_file))
+                except (FileNotFoundError, ValueError):
+                    continue
+            counters, histograms = _merge_metric_snapshots(snapshots)
+            _write_json_atomically(dead_path, {
+                'counters': [[name, labels, value] for (name, labels), value in counters.items()],
+                'histograms': [[name, labels, values] for (name, labels), values in histograms.items()],
+            })
+            os.remove(path)
+
+    def _process_snapshots(self, directory):
+        yield self.snapshot()
+        if not directory:
+            return
+        own_file = f"{os.getpid()}.json"
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if not name.endswith('.json') or name == own_file:
+                continue
+            try:
+                with open(os.path.join(directory, name)) as metrics_file:
+                    yield json.load(metrics_file)
+            except (OSError, ValueError):
+                continue
+
+    def render(self, directory=None):
+        """Return every metric in the Prometheus text exposition format."""
+        counters, histograms = _merge_metric_snapshots(self._process_snapshots(directory))
+
+        samples = defaultdict(list)
+        for (name, labels), value in sorted(counters.items()):
+            samples[name].append((name, labels, value))
+        for (name, labels), values in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), values[:-1]):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                samples[name].append((f"{name}_bucket", labels + (('le', le),), cumulative))
+            samples[name].append((f"{name}_sum", labels, values[-1]))
+            samples[name].append((f"{name}_count", labels, cumulative))
+
+        lines = []
+        for name, (metric_type, help_text) in METRIC_DEFINITIONS.items():
+            if name not in samples:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for sample_name, labels, value in samples[name]:
+                label_text = ','.join(f'{key}="{_escape_metric_label(value)}"' for key, value in labels)
+                lines.append(f"{sample_name}{{{label_text}}} {value:g}" if label_text else f"{sample_name} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+
+def _merge_metric_snapshots(snapshots):
+    """Sum snapshots into ``(counters, histograms)`` dicts keyed by ``(name, labels)``."""
+    counters = defaultdict(float)
+    histograms = {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot['counters']:
+            counters[name, tuple(map(tuple, labels))] += value
+        for name, labels, values in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, [0] * len(values))
+            for index, value in enumerate(values):
+                merged[index] += value
+    return counters, histograms
+
+
+def _write_json_atomically(path, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as json_file:
+        json.dump(data, json_file, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+def _escape_metric_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics = MetricsRegistry()
+
+
+@db.event.listens_for(Engine, 'before_cursor_execute')
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_started'] = time.perf_counter()
+
+
+@db.event.listens_for(Engine, 'after_cursor_execute')
+def _record_query_time(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop('query_started', None)
+    if started is not None and has_request_context():
+        g.db_seconds = g.get('db_seconds', 0.0) + time.perf_counter() - started
+        g.db_queries = g.get('db_queries', 0) + 1
+
+
 @app.before_request
 def assign_request_id():
+    g.request_started = time.perf_counter()
+    g.db_seconds = 0.0
+    g.db_queries = 0
+    g.pop('cache_versions', None)
+    g.pop('current_user_is_admin', None)
     g.request_id = request.headers.get('x-request-id') or uuid.uuid4().hex[:12]
-    logger.info("Request start %s %s", request.method, request.path)
+    logger.debug("Request start %s %s", request.method, request.path)
+
+
+PROFILE_ID_PATTERN = r'^[A-Za-z0-9_-]{1,64}$'
+_profiler_lock = threading.Lock()
+_profiler_last_started = [0.0]
+
+
+def profiling_requested():
+    flag = request.args.get('profile') or request.headers.get('X-Profile')
+    return flag not in (None, '', '0')
+
+
+@app.before_request
+def start_request_profiler():
+    # Check the flag before touching current_user so ordinary requests pay nothing.
+    if not app.config['PROFILING_ENABLED'] or not profiling_requested():
+        return
+    if not current_user_is_admin():
+        return
+    if not re.match(PROFILE_ID_PATTERN, g.request_id):
+        g.request_id = uuid.uuid4().hex[:12]
+    if not _profiler_lock.acquire(blocking=False):
+        g.profile_skipped = 'busy'
+        return
+    if time.monotonic() - _profiler_last_started[0] < app.config['PROFILE_MIN_INTERVAL_SECONDS']:
+        _profiler_lock.release()
+        g.profile_skipped = 'rate-limited'
+        return
+    import cProfile
+
+    _profiler_last_started[0] = time.monotonic()
+    g.profiler = cProfile.Profile()
+    try:
+        g.profiler.enable()
+    except ValueError:
+        # Another profiler (a debugger or coverage tool) already owns the hook.
+        g.profiler = None
+        _profiler_lock.release()
+        g.profile_skipped = 'unavailable'
+
+
+def stop_request_profiler():
+    """Stop this request's profiler and write it to PROFILE_DIR; returns the profile id or None."""
+    profiler = g.pop('profiler', None)
+    if profiler is None:
+        return None
+    try:
+        profiler.disable()
+        directory = app.config['PROFILE_DIR']
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{g.request_id}.prof")
+        profiler.dump_stats(path)
+        prune_request_profiles(directory)
+        logger.info("Saved request profile %s", path)
+        return g.request_id
+    except OSError:
+        logger.warning("Could not save request profile", exc_info=True)
+        return None
+    finally:
+        _profiler_lock.release()
+
+
+def prune_request_profiles(directory, keep=None):
+    keep = keep or app.config['PROFILE_MAX_FILES']
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.prof')]
+    paths.sort(key=os.path.getmtime, reverse=True)
+    for path in paths[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+@app.teardown_request
+def release_request_profiler(error=None):
+    # after_request does not run when a response could not be built.
+    if g.get('profiler') is not None:
+        stop_request_profiler()
+
+
+@app.before_request
+def reset_read_routing():
+    g.db_wrote = False
+    g.pop('tournament', None)
+
+
+@app.after_request
+def pin_writers_to_primary(response):
+    if _read_engine is not None and g.get('db_wrote'):
+        flask_session['db_primary_until'] = time.time() + app.config['DATABASE_READ_STICKY_SECONDS']
+    return response
+
+
+@app.after_request
+def record_request_metrics(response):
+    if not app.config['METRICS_ENABLED'] or 'request_started' not in g:
+        return response
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.inc('march_madness_http_requests_total', route=route, method=request.method, status=response.status_code)
+    metrics.observe(
+        'march_madness_http_request_duration_seconds',
+        time.perf_counter() - g.request_started,
+        route=route,
+        method=request.method,
+    )
+    metrics.observe('march_madness_request_db_seconds', g.get('db_seconds', 0.0), route=route)
+    metrics.inc('march_madness_request_db_queries_total', g.get('db_queries', 0), route=route)
+    if app.config['METRICS_DIR']:
+        metrics.flush(app.config['METRICS_DIR'])
+    return response
+
+
+def request_log_sampled(status_code):
+    """Whether this request's summary line is written; errors always are."""
+    if status_code >= 400:
+        return True
+    rate = app.config['LOG_SAMPLE_RATE']
+    if rate >= 1.0:
+        return True
+    routes = app.config['LOG_SAMPLE_ROUTES']
+    if routes and (request.url_rule is None or request.url_rule.rule not in routes):
+        return True
+    return random.random() < rate
+
+
+def log_request_summary(response):
+    level = logging.ERROR if response.status_code >= 500 else logging.INFO
+    if not logger.isEnabledFor(level) or not request_log_sampled(response.status_code):
+        return
+    duration_ms = (time.perf_counter() - g.request_started) * 1000 if 'request_started' in g else None
+    fields = {
+        'method': request.method,
+        'path': request.path,
+        'route': request.url_rule.rule if request.url_rule else None,
+        'status': response.status_code,
+        'duration_ms': round(duration_ms, 1) if duration_ms is not None else None,
+        'queries': g.get('db_queries', 0),
+        'db_ms': round(g.get('db_seconds', 0.0) * 1000, 1),
+    }
+    logger.log(
+        level,
+        "Request %s %s -> %s in %sms queries=%s db=%sms",
+        fields['method'], fields['path'], fields['status'], fields['duration_ms'], fields['queries'], fields['db_ms'],
+        extra={'request_fields': fields},
+    )
 
 
 @app.after_request
 def log_response(response):
-    logger.info("Request end %s %s -> %s", request.method, request.path, response.status_code)
+    log_request_summary(response)
     response.headers['X-Request-ID'] = getattr(g, 'request_id', '-')
+    profile_id = stop_request_profiler()
+    if profile_id:
+        response.headers['X-Profile'] = url_for('admin_download_profile', profile_id=profile_id)
+    elif g.get('profile_skipped'):
+        response.headers['X-Profile'] = f"skipped: {g.profile_skipped}"
     request_path = request.path.lower()
-    if request_path.startswith('/static/') and request_path.endswith(STATIC_IMAGE_EXTENSIONS):
+    if static_url_is_immutable(response):
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_ASSET_MAX_AGE_SECONDS}, immutable'
+    elif request_path.startswith('/static/') and request_path.endswith(STATIC_IMAGE_EXTENSIONS):
         response.headers['Cache-Control'] = f'public, max-age={STATIC_IMAGE_CACHE_MAX_AGE_SECONDS}'
     return response
 
@@ -213,9 +1294,140 @@ def handle_unexpected_exception(error):
         500,
     )
 
+class PasswordHasherBusy(RuntimeError):
+    pass
+
+
+_password_hash_executor = None
+_password_hash_slots = None
+_password_hash_lock = threading.Lock()
+
+
+def _get_password_hash_executor():
+    """Create the bounded bcrypt worker pool on first use."""
+    global _password_hash_executor, _password_hash_slots
+    if _password_hash_executor is None:
+        with _password_hash_lock:
+            if _password_hash_executor is None:
+                _password_hash_slots = threading.BoundedSemaphore(app.config['PASSWORD_HASH_MAX_PENDING'])
+                from concurrent.futures import ThreadPoolExecutor
+
+                _password_hash_executor = ThreadPoolExecutor(
+                    max_workers=app.config['PASSWORD_HASH_WORKERS'],
+                    thread_name_prefix='bcrypt',
+                )
+    return _password_hash_executor, _password_hash_slots
+
+
+def run_password_task(fn, *args):
+    """Run a bcrypt call on the worker pool so bursts of logins are capped at PASSWORD_HASH_WORKERS cores.
+
+    Raises PasswordHasherBusy when PASSWORD_HASH_MAX_PENDING calls are already queued.
+    """
+    executor, slots = _get_password_hash_executor()
+    if not slots.acquire(timeout=app.config['PASSWORD_HASH_WAIT_SECONDS']):
+        raise PasswordHasherBusy('Too many logins in progress. Please try again in a moment.')
+    try:
+        return executor.submit(fn, *args).result()
+    finally:
+        slots.release()
+
+
+def _generate_password_hash(password, rounds):
+    return bcrypt.generate_password_hash(password, rounds).decode('utf-8')
+
+
+def hash_password(password):
+    return run_password_task(_generate_password_hash, password, app.config['BCRYPT_LOG_ROUNDS'])
+
+
+def hash_passwords(passwords):
+    """Hash many passwords in parallel on the worker pool, preserving order."""
+    executor, _ = _get_password_hash_executor()
+    rounds = app.config['BCRYPT_LOG_ROUNDS']
+    return list(executor.map(_generate_password_hash, passwords, [rounds] * len(passwords)))
+
+
+def bcrypt_cost(password_hash):
+    """Return the log-rounds cost encoded in a ``$2b$12$...`` hash, or None."""
+    parts = (password_hash or '').split('$')
+    if len(parts) < 4:
+        return None
+    try:
+        return int(parts[2])
+    except ValueError:
+        return None
+
+
+USER_CACHE_TTL_SECONDS = parse_positive_int(env_value('USER_CACHE_TTL_SECONDS'), 30)
+PICK_DISTRIBUTION_TTL_SECONDS = parse_positive_int(env_value('PICK_DISTRIBUTION_TTL_SECONDS'), 30)
+
+
+class CachedUser(UserMixin):
+    """Read-only snapshot of the columns the request cycle needs from the logged-in User."""
+
+    def __init__(self, id, username, fun_name, picture, is_admin):
+        self.id = id
+        self.username = username
+        self.fun_name = fun_name
+        self.picture = picture
+        self.is_admin = bool(is_admin)
+
+
+_user_snapshot_cache = {}
+
+
+def invalidate_cached_user(user_id):
+    _user_snapshot_cache.pop(user_id, None)
+
+
+def get_cached_user(user_id):
+    """Return a CachedUser from the per-process cache, querying only on a miss or expiry.
+
+    Writes in this process evict the user at once; another worker's change shows up within
+    USER_CACHE_TTL_SECONDS. Admin access is checked with current_user_is_admin(), not this snapshot.
+    """
+    now = time.monotonic()
+    entry = _user_snapshot_cache.get(user_id)
+    if entry and entry[1] > now:
+        metrics.inc('march_madness_cache_lookups_total', cache='user', result='hit')
+        return entry[0]
+    metrics.inc('march_madness_cache_lookups_total', cache='user', result='miss')
+
+    row = (
+        db.session.query(User.id, User.username, User.fun_name, User.picture, User.is_admin)
+        .filter(User.id == user_id)
+        .first()
+    )
+    if row is None:
+        _user_snapshot_cache.pop(user_id, None)
+        return None
+    snapshot = CachedUser(*row)
+    _user_snapshot_cache[user_id] = (snapshot, now + USER_CACHE_TTL_SECONDS)
+    return snapshot
+
+
+def current_user_is_admin():
+    """Read the logged-in user's admin flag from the database, once per request.
+
+    The cached snapshot may lag a revocation made on another instance, which is fine for showing
+    the admin link but not for granting admin access.
+    """
+    if not current_user.is_authenticated:
+        return False
+    if 'current_user_is_admin' not in g:
+        g.current_user_is_admin = bool(
+            db.session.execute(select(User.is_admin).where(User.id == current_user.id)).scalar()
+        )
+    return g.current_user_is_admin
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return db.session.get(User, int(user_id))
+    try:
+        return get_cached_user(int(user_id))
+    except (TypeError, ValueError):
+        return None
 
 # Models
 class User(db.Model, UserMixin):
@@ -228,10 +1440,20 @@ class User(db.Model, UserMixin):
     picture = db.Column(db.String(100), default='default.png')
 
     def set_password(self, password):
-        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password_hash = hash_password(password)
 
     def check_password(self, password):
-        return bcrypt.check_password_hash(self.password_hash, password)
+        return run_password_task(bcrypt.check_password_hash, self.password_hash, password)
+
+    def password_needs_rehash(self):
+        return bcrypt_cost(self.password_hash) != app.config['BCRYPT_LOG_ROUNDS']
+
+@db.event.listens_for(User, 'after_insert')
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def _invalidate_cached_user_on_write(mapper, connection, target):
+    invalidate_cached_user(target.id)
+
 
 class Round(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -259,6 +1481,25 @@ class Pick(db.Model):
     user = db.relationship('User', backref='picks')
     game = db.relationship('Game', back_populates='picks')
 
+PICK_UNIQUE_INDEX = db.Index('uq_pick_user_game', Pick.user_id, Pick.game_id, unique=True)
+
+@db.event.listens_for(Pick, 'after_insert')
+@db.event.listens_for(Pick, 'after_update')
+@db.event.listens_for(Pick, 'after_delete')
+def _invalidate_pick_distribution_on_write(mapper, connection, target):
+    invalidate_pick_distribution()
+    invalidate_tournament_snapshot()
+
+
+@db.event.listens_for(Round, 'after_insert')
+@db.event.listens_for(Round, 'after_update')
+@db.event.listens_for(Round, 'after_delete')
+@db.event.listens_for(Game, 'after_insert')
+@db.event.listens_for(Game, 'after_update')
+@db.event.listens_for(Game, 'after_delete')
+def _invalidate_tournament_snapshot_on_write(mapper, connection, target):
+    invalidate_tournament_snapshot()
+
 class AppSetting(db.Model):
     __tablename__ = 'app_setting'
     key = db.Column(db.String(50), primary_key=True)
@@ -319,8 +1560,250 @@ def get_team_info():
         return {}
 
 
-def team_seed(team_name, team_info):
-    """Return seed string like '(1) ' for a team, or '' if unknown."""
+# Per-process caches that must agree across workers and serverless instances are tagged with a
+# version AppSetting row (the user cache instead uses a short TTL). A request reads all the rows in one query the first time a cache needs
+# them, and a cache reloads only when its row has moved. Every ORM write to the cached tables
+# moves the row in the same transaction; bulk statements call bump_cache_version().
+TOURNAMENT_VERSION_KEY = 'tournament_version'
+CACHE_VERSION_KEYS = (TOURNAMENT_VERSION_KEY,)
+
+
+def get_cache_versions():
+    """Return ``{key: value}`` for the cache version rows, read once per request (every call outside one)."""
+    if has_request_context() and 'cache_versions' in g:
+        return g.cache_versions
+    versions = dict(
+        db.session.query(AppSetting.key, AppSetting.value).filter(AppSetting.key.in_(CACHE_VERSION_KEYS))
+    )
+    if has_request_context():
+        g.cache_versions = versions
+    return versions
+
+
+def forget_cache_versions():
+    if has_app_context():
+        g.pop('cache_versions', None)
+
+# Rounds, games and team info change a few times a day (syncs and admin saves), so each process
+# keeps one copy tagged with the `tournament_version` row.
+
+CachedRound = namedtuple('CachedRound', ['id', 'name', 'point_value', 'closed', 'closed_for_selection', 'games'])
+CachedGame = namedtuple('CachedGame', ['id', 'round_id', 'team1', 'team2', 'winner'])
+
+
+class TournamentStructure:
+    """Read-only rounds, games and team info as of one ``tournament_version``, shared across requests.
+
+    Rounds and games are namedtuples, so writes must load the ORM rows (``db.session.get``).
+    """
+
+    __slots__ = ('version', 'rounds', 'rounds_by_id', 'team_info', 'seed_labels', '_seed_labels_by_name')
+
+    def __init__(self, version, rounds, team_info):
+        self.version = version
+        self.rounds = rounds
+        self.rounds_by_id = {round_obj.id: round_obj for round_obj in rounds}
+        self.team_info = team_info
+        self.seed_labels = {
+            key: f"({info['seed']}) "
+            for key, info in team_info.items()
+            if isinstance(info, dict) and info.get('seed')
+        }
+        self._seed_labels_by_name = {}
+
+    def seed_label(self, team_name):
+        """``team_seed()`` for this version, memoised by the raw name so templates skip normalising."""
+        label = self._seed_labels_by_name.get(team_name)
+        if label is None:
+            label = self.seed_labels.get(normalize_team_name(team_name), '')
+            self._seed_labels_by_name[team_name] = label
+        return label
+
+
+_tournament_structure = None
+
+
+def invalidate_tournament_structure():
+    global _tournament_structure
+    _tournament_structure = None
+
+
+def dialect_insert(model):
+    """Return an INSERT for ``model`` that supports ``on_conflict_do_update`` on this database."""
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as _dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as _dialect_insert
+    return _dialect_insert(model)
+
+
+def bump_cache_version(executor, key):
+    """Give a cache version row a new value so every process reloads that cache.
+
+    ``executor`` is the session or connection doing the write, so the bump commits (or rolls
+    back) with it.
+    """
+    token = uuid.uuid4().hex
+    # A single upsert, so two processes bumping a key for the first time can't both INSERT.
+    statement = dialect_insert(AppSetting).values(key=key, value=token)
+    executor.execute(statement.on_conflict_do_update(index_elements=[AppSetting.key], set_={'value': token}))
+    forget_cache_versions()
+    if key == TOURNAMENT_VERSION_KEY:
+        invalidate_tournament_structure()
+
+
+def _cache_version_key_for(obj):
+    if isinstance(obj, (Round, Game)) or (isinstance(obj, AppSetting) and obj.key == 'team_info'):
+        return TOURNAMENT_VERSION_KEY
+    return None
+
+
+@db.event.listens_for(RoutingSession, 'after_flush')
+def _bump_cache_versions_on_flush(session, flush_context):
+    keys = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        key = _cache_version_key_for(obj)
+        if key and (obj not in session.dirty or session.is_modified(obj, include_collections=False)):
+            keys.add(key)
+    for key in sorted(keys):
+        bump_cache_version(session.connection(), key)
+
+
+def load_tournament_structure(version):
+    games_by_round = defaultdict(list)
+    game_rows = db.session.query(Game.id, Game.round_id, Game.team1, Game.team2, Game.winner).order_by(Game.id)
+    for row in game_rows:
+        games_by_round[row.round_id].append(CachedGame(*row))
+    rounds = tuple(
+        CachedRound(round_id, name, point_value, closed, closed_for_selection, tuple(games_by_round[round_id]))
+        for round_id, name, point_value, closed, closed_for_selection in db.session.query(
+            Round.id, Round.name, Round.point_value, Round.closed, Round.closed_for_selection
+        ).order_by(Round.id)
+    )
+    return TournamentStructure(version, rounds, get_team_info())
+
+
+def get_tournament_structure():
+    """Return this process's TournamentStructure, reloading it if the version row has moved."""
+    global _tournament_structure
+    version = get_cache_versions().get(TOURNAMENT_VERSION_KEY)
+    structure = _tournament_structure
+    if structure is not None and structure.version == version:
+        metrics.inc('march_madness_cache_lookups_total', cache='tournament', result='hit')
+        return structure
+    metrics.inc('march_madness_cache_lookups_total', cache='tournament', result='miss')
+    structure = load_tournament_structure(version)
+    _tournament_structure = structure
+    return structure
+
+
+class TournamentSnapshot:
+    """Rounds, point totals and team info for one request, each read at most once and only when used.
+
+    Get it with ``get_tournament()``. Rounds, games and team info come from the process-wide
+    TournamentStructure, so a request costs one version check instead of reloading them. Round,
+    game and pick writes drop the request's snapshot through the mapper listeners; bulk
+    statements must call ``invalidate_tournament_snapshot()``.
+    """
+
+    __slots__ = ('_structure', '_user_points')
+
+    def __init__(self):
+        self._structure = None
+        self._user_points = {}
+
+    @property
+    def structure(self):
+        if self._structure is None:
+            self._structure = get_tournament_structure()
+        return self._structure
+
+    @property
+    def rounds(self):
+        """Every round in id (tournament) order, each carrying its games in id order."""
+        return self.structure.rounds
+
+    @property
+    def closed_rounds(self):
+        return [round_obj for round_obj in self.rounds if round_obj.closed]
+
+    @property
+    def closed_round_ids(self):
+        return [round_obj.id for round_obj in self.rounds if round_obj.closed]
+
+    @property
+    def unclosed_rounds(self):
+        return [round_obj for round_obj in self.rounds if not round_obj.closed]
+
+    @property
+    def open_round(self):
+        """The first round still taking picks, or None."""
+        return next((round_obj for round_obj in self.unclosed_rounds if not round_obj.closed_for_selection), None)
+
+    @property
+    def locked_round(self):
+        """The first round whose picks are locked but whose games are not all decided, or None."""
+        return next((round_obj for round_obj in self.unclosed_rounds if round_obj.closed_for_selection), None)
+
+    def games(self, round_ids):
+        """The games of ``round_ids``, grouped in the order the ids are given."""
+        rounds_by_id = self.structure.rounds_by_id
+        return [game for round_id in round_ids if round_id in rounds_by_id for game in rounds_by_id[round_id].games]
+
+    @property
+    def team_info(self):
+        return self.structure.team_info
+
+    def seed_label(self, team_name):
+        return self.structure.seed_label(team_name)
+
+    def user_total_points(self, user_id):
+        """A user's points across closed rounds."""
+        if user_id not in self._user_points:
+            closed_round_ids = self.closed_round_ids
+            self._user_points[user_id] = (
+                db.session.query(db.func.sum(Pick.points))
+                .join(Game)
+                .filter(Pick.user_id == user_id, Game.round_id.in_(closed_round_ids))
+                .scalar() or 0
+            ) if closed_round_ids else 0
+        return self._user_points[user_id]
+
+    @property
+    def user_points(self):
+        """The signed-in user's total, or 0 when nobody is signed in."""
+        return self.user_total_points(current_user.id) if current_user.is_authenticated else 0
+
+
+def get_tournament():
+    """Return this request's TournamentSnapshot (a fresh one outside a request)."""
+    if not has_request_context():
+        return TournamentSnapshot()
+    if 'tournament' not in g:
+        g.tournament = TournamentSnapshot()
+    return g.tournament
+
+
+def invalidate_tournament_snapshot():
+    if has_app_context():
+        g.pop('tournament', None)
+
+
+def set_app_setting(key, value):
+    setting = db.session.get(AppSetting, key)
+    if setting:
+        setting.value = value
+    else:
+        db.session.add(AppSetting(key=key, value=value))
+
+
+def team_seed(team_name, team_info=None):
+    """Return seed string like '(1) ' for a team, or '' if unknown.
+
+    Without ``team_info`` the labels precomputed for the current tournament version are used.
+    """
+    if team_info is None:
+        return get_tournament().seed_label(team_name)
     info = team_info.get(normalize_team_name(team_name))
     if info and info.get('seed'):
         return f"({info['seed']}) "
@@ -365,6 +1848,13 @@ def normalize_team_name(name):
 
 
 def build_henrygd_ssl_context():
+    import ssl
+
+    try:
+        import certifi
+    except ImportError:
+        certifi = None
+
     custom_ca_bundle = os.getenv('HENRYGD_CA_BUNDLE') or os.getenv('SSL_CERT_FILE')
     if custom_ca_bundle:
         return ssl.create_default_context(cafile=custom_ca_bundle)
@@ -373,121 +1863,557 @@ def build_henrygd_ssl_context():
     return ssl.create_default_context()
 
 
+def record_henrygd_fetch(outcome, seconds):
+    metrics.inc('march_madness_henrygd_fetches_total', outcome=outcome)
+    metrics.observe('march_madness_henrygd_fetch_duration_seconds', seconds, outcome=outcome)
+
+
+class HenryGDClient:
+    """HTTP client for the HenryGD API.
+
+    Holds one SSL context and a small pool of keep-alive connections per host, so repeat
+    syncs and bracket loads skip DNS, TCP and TLS setup. Failed connections and 429/5xx
+    responses are retried up to ``max_attempts`` times with full-jitter backoff. Timing for
+    the most recent fetch is kept in ``last_timing`` and logged.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_IDLE_CONNECTIONS_PER_HOST = 4
+    HEADERS = {
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip',
+        'User-Agent': 'march-madness-sync/1.0',
+    }
+
+    def __init__(self, base_url=None, connect_timeout=None, read_timeout=None, max_attempts=None, backoff_seconds=None):
+        self.base_url = (base_url or HENRYGD_API_BASE_URL).rstrip('/')
+        self.connect_timeout = connect_timeout or app.config['HENRYGD_CONNECT_TIMEOUT_SECONDS']
+        self.read_timeout = read_timeout or app.config['HENRYGD_READ_TIMEOUT_SECONDS']
+        self.max_attempts = max_attempts or app.config['HENRYGD_MAX_ATTEMPTS']
+        self.backoff_seconds = app.config['HENRYGD_RETRY_BACKOFF_SECONDS'] if backoff_seconds is None else backoff_seconds
+        self.last_timing = None
+        self._ssl_context = None
+        self._idle_connections = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @property
+    def ssl_context(self):
+        if self._ssl_context is None:
+            self._ssl_context = build_henrygd_ssl_context()
+        return self._ssl_context
+
+    def _open_connection(self, scheme, host, port, timing):
+        import http.client
+        import socket
+
+        started = time.perf_counter()
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        timing['dns_ms'] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        sock = None
+        last_error = OSError(f"could not connect to {host}:{port}")
+        for family, socktype, proto, _, address in addresses:
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.settimeout(self.connect_timeout)
+                sock.connect(address)
+                break
+            except OSError as exc:
+                last_error = exc
+                sock.close()
+                sock = None
+        if sock is None:
+            raise last_error
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        timing['connect_ms'] = (time.perf_counter() - started) * 1000
+
+        if scheme == 'https':
+            started = time.perf_counter()
+            try:
+                sock = self.ssl_context.wrap_socket(sock, server_hostname=host)
+            except OSError:
+                sock.close()
+                raise
+            timing['tls_ms'] = (time.perf_counter() - started) * 1000
+            connection = http.client.HTTPSConnection(host, port, timeout=self.read_timeout, context=self.ssl_context)
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.read_timeout)
+        sock.settimeout(self.read_timeout)
+        connection.sock = sock
+        return connection
+
+    def _checkout(self, key):
+        with self._lock:
+            idle = self._idle_connections[key]
+            return idle.pop() if idle else None
+
+    def _checkin(self, key, connection):
+        with self._lock:
+            idle = self._idle_connections[key]
+            if len(idle) < self.MAX_IDLE_CONNECTIONS_PER_HOST:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            connections = [connection for idle in self._idle_connections.values() for connection in idle]
+            self._idle_connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _backoff(self, attempt, retry_after=None):
+        delay = random.uniform(0, self.backoff_seconds * (2 ** (attempt - 1)))
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(int(retry_after), self.read_timeout))
+        if delay:
+            time.sleep(delay)
+
+    def get_json(self, path):
+        return self.get_json_with_digest(path)[0]
+
+    def get_json_with_digest(self, path):
+        """Return ``(data, sha256_hex)``, where the digest is of the raw (decompressed) response body."""
+        import http.client
+
+        parts = urlsplit(f"{self.base_url}{path}")
+        scheme = parts.scheme or 'https'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+        target = parts.path + (f"?{parts.query}" if parts.query else '')
+        fetch_started = time.perf_counter()
+        attempt = 0
+        reconnected_stale = False
+
+        while True:
+            attempt += 1
+            connection = self._checkout(key)
+            timing = {
+                'url': f"{self.base_url}{path}",
+                'reused': connection is not None,
+                'dns_ms': 0.0,
+                'connect_ms': 0.0,
+                'tls_ms': 0.0,
+            }
+            try:
+                if connection is None:
+                    connection = self._open_connection(scheme, parts.hostname, port, timing)
+                started = time.perf_counter()
+                connection.request('GET', target, headers=self.HEADERS)
+                response = connection.getresponse()
+                body = response.read()
+                timing['transfer_ms'] = (time.perf_counter() - started) * 1000
+            except (OSError, http.client.HTTPException) as exc:
+                if connection is not None:
+                    connection.close()
+                # The server may drop an idle keep-alive connection at any time; reconnect once for free.
+                if timing['reused'] and not reconnected_stale and isinstance(exc, (ConnectionError, http.client.RemoteDisconnected)):
+                    reconnected_stale = True
+                    attempt -= 1
+                    continue
+                if attempt >= self.max_attempts:
+                    record_henrygd_fetch('network_error', time.perf_counter() - fetch_started)
+                    raise RuntimeError(f"HenryGD API network error: {exc}") from exc
+                self._backoff(attempt)
+                continue
+
+            if response.will_close or connection.sock is None:
+                connection.close()
+            else:
+                self._checkin(key, connection)
+
+            if response.status in self.RETRY_STATUSES and attempt < self.max_attempts:
+                self._backoff(attempt, response.getheader('Retry-After'))
+                continue
+            break
+
+        timing.update(status=response.status, attempts=attempt, total_ms=(time.perf_counter() - fetch_started) * 1000)
+        self.last_timing = timing
+        record_henrygd_fetch('ok' if response.status == 200 else 'http_error', timing['total_ms'] / 1000)
+        logger.info(
+            "HenryGD fetch %s status=%s attempts=%s reused=%s dns=%.1fms connect=%.1fms tls=%.1fms transfer=%.1fms total=%.1fms",
+            timing['url'], timing['status'], timing['attempts'], timing['reused'], timing['dns_ms'],
+            timing['connect_ms'], timing['tls_ms'], timing['transfer_ms'], timing['total_ms'],
+        )
+
+        if response.getheader('Content-Encoding', '').lower() == 'gzip':
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        text = body.decode('utf-8')
+        if response.status != 200:
+            raise RuntimeError(f"HenryGD API error {response.status}: {text}")
+        try:
+            return (json.loads(text) if text else {}), hashlib.sha256(body).hexdigest()
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"HenryGD API returned invalid JSON: {exc}") from exc
+
+
+_henrygd_client = None
+_henrygd_client_lock = threading.Lock()
+
+
+def get_henrygd_client():
+    """Return the process-wide HenryGD client so its connections survive across requests."""
+    global _henrygd_client
+    if _henrygd_client is None:
+        with _henrygd_client_lock:
+            if _henrygd_client is None:
+                _henrygd_client = HenryGDClient()
+    return _henrygd_client
+
+
+def fetch_henrygd_bracket(year):
+    """Return ``(payload, body_digest)``; the digest of the raw response keys ``get_bracket_model``."""
+    return get_henrygd_client().get_json_with_digest(f"/brackets/{HENRYGD_SPORT}/{HENRYGD_DIVISION}/{year}")
+
+
 def fetch_henrygd_bracket_payload(year):
-    endpoint = (
-        f"{HENRYGD_API_BASE_URL.rstrip('/')}"
-        f"/brackets/{HENRYGD_SPORT}/{HENRYGD_DIVISION}/{year}"
-    )
-    req = urllib.request.Request(
-        endpoint,
-        headers={
-            'Accept': 'application/json',
-            'User-Agent': 'march-madness-sync/1.0',
-        },
-    )
+    return fetch_henrygd_bracket(year)[0]
+
+
+HENRYGD_ARCHIVE_SUFFIX = '.json.z'
+_last_recorded_digest = {}
+
+
+def henrygd_payload_digest(payload):
+    """Return ``(canonical_json_bytes, sha256_hex)`` for a bracket payload."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return canonical, hashlib.sha256(canonical).hexdigest()
+
+
+def _archive_entries(directory):
     try:
-        with urllib.request.urlopen(req, timeout=30, context=build_henrygd_ssl_context()) as response:
-            body = response.read().decode('utf-8')
-            return json.loads(body) if body else {}
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode('utf-8')
-        raise RuntimeError(f"HenryGD API error {exc.code}: {error_body}") from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"HenryGD API network error: {exc.reason}") from exc
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"HenryGD API returned invalid JSON: {exc}") from exc
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return sorted(name for name in names if name.endswith(HENRYGD_ARCHIVE_SUFFIX))
 
 
-def build_henrygd_games_by_round(payload):
-    championships = payload.get('championships')
-    if not championships or not isinstance(championships, list):
-        raise RuntimeError("HenryGD response missing 'championships'")
-    bracket_games = championships[0].get('games') or []
-    if not isinstance(bracket_games, list):
-        raise RuntimeError("HenryGD response has invalid 'games' format")
-
-    games_by_position = {}
-    for game in bracket_games:
-        position_id = game.get('bracketPositionId')
-        if position_id is not None:
-            games_by_position[str(position_id)] = game
-
-    depth_cache = {}
-
-    def depth_for_position(position_id, trail=None):
-        if position_id in depth_cache:
-            return depth_cache[position_id]
-        game = games_by_position.get(position_id)
-        if not game:
-            return 0
-        parent_id = game.get('victorBracketPositionId')
-        if parent_id is None:
-            depth_cache[position_id] = 0
-            return 0
-        parent_key = str(parent_id)
-        if parent_key not in games_by_position:
-            depth_cache[position_id] = 0
-            return 0
-        if trail and position_id in trail:
-            depth_cache[position_id] = 0
-            return 0
-        next_trail = set(trail or set())
-        next_trail.add(position_id)
-        depth_cache[position_id] = 1 + depth_for_position(parent_key, next_trail)
-        return depth_cache[position_id]
-
-    team_info = {}  # normalized_name -> {logo, seed, name}
-    games_by_round = {}
-    for game in bracket_games:
-        position_id = game.get('bracketPositionId')
-        if position_id is None:
-            continue
-        depth = depth_for_position(str(position_id))
-        round_name = HENRYGD_DEPTH_TO_ROUND.get(depth)
-        if not round_name:
-            continue
+def _archive_entry_digest(name):
+    return name[:-len(HENRYGD_ARCHIVE_SUFFIX)].rsplit('-', 1)[-1]
+
+
+def record_henrygd_payload(payload, directory=None):
+    """Archive a payload as ``<utc timestamp>-<sha256>.json.z`` (zlib-compressed canonical JSON).
+
+    Consecutive identical payloads are stored once. Returns the new file path, or None when
+    the payload matches the most recent recording.
+    """
+    directory = directory or app.config['HENRYGD_RECORD_DIR']
+    canonical, digest = henrygd_payload_digest(payload)
+    if directory not in _last_recorded_digest:
+        entries = _archive_entries(directory)
+        _last_recorded_digest[directory] = _archive_entry_digest(entries[-1]) if entries else None
+    if _last_recorded_digest[directory] == digest:
+        return None
+
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+    path = os.path.join(directory, f"{stamp}-{digest}{HENRYGD_ARCHIVE_SUFFIX}")
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as archive_file:
+        archive_file.write(zlib.compress(canonical, 9))
+    os.replace(temp_path, path)
+    _last_recorded_digest[directory] = digest
+    return path
+
+
+def iter_recorded_henrygd_payloads(directory=None):
+    """Yield ``(file_name, payload)`` for archived payloads in the order they were fetched."""
+    directory = directory or app.config['HENRYGD_RECORD_DIR']
+    for name in _archive_entries(directory):
+        with open(os.path.join(directory, name), 'rb') as archive_file:
+            canonical = zlib.decompress(archive_file.read())
+        payload = json.loads(canonical)
+        if henrygd_payload_digest(payload)[1] != _archive_entry_digest(name):
+            raise RuntimeError(f"Recorded HenryGD payload {name} does not match its content hash")
+        yield name, payload
+
+
+def parse_score(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
-        teams = []
-        winner_name = None
-        for team in game.get('teams') or []:
-            team_name = team.get('nameShort') or team.get('nameFull') or team.get('seoname')
-            if not team_name:
+
+def bracket_position_number(position_id):
+    """A ``bracketPositionId`` as an int, or None when the payload sent something unusable."""
+    return parse_score(position_id)
+
+
+# HenryGD/NCAA gameState values for games that have tipped off but not finished.
+LIVE_GAME_STATES = frozenset({'I', 'IN_PROGRESS', 'LIVE'})
+
+
+class BracketGame:
+    """One bracket slot from a HenryGD payload."""
+
+    __slots__ = (
+        'position_id', 'parent_key', 'depth', 'round_name', 'start_time_epoch', 'teams', 'winner',
+        'contest_id', 'game_state', 'scores', 'section_id',
+    )
+
+    def __init__(self, position_id, parent_key, start_time_epoch, teams, winner, contest_id=None, game_state=None,
+                 scores=None, section_id=None):
+        self.position_id = position_id
+        self.parent_key = parent_key
+        self.depth = 0
+        self.round_name = None
+        self.start_time_epoch = start_time_epoch
+        self.teams = teams
+        self.winner = winner
+        self.contest_id = contest_id
+        self.game_state = game_state
+        self.scores = scores or [None] * len(teams)
+        self.section_id = section_id
+
+    @property
+    def is_live(self):
+        return str(self.game_state or '').upper() in LIVE_GAME_STATES and len(self.teams) >= 2
+
+    def as_dict(self):
+        return {
+            'position_id': self.position_id,
+            'start_time_epoch': self.start_time_epoch,
+            'team1': self.teams[0],
+            'team2': self.teams[1],
+            'winner': self.winner,
+        }
+
+
+class BracketModel:
+    """A HenryGD bracket parsed once and indexed by position id, round and normalized team key.
+
+    Build it through ``get_bracket_model`` so each distinct payload is parsed only once, and
+    treat it as read-only since instances are shared between callers.
+    """
+
+    __slots__ = (
+        'digest', 'bracket', 'games_by_position', 'games_by_round', 'games_by_team', 'team_info',
+        '_round_dicts', '_projection',
+    )
+
+    def __init__(self, payload, digest=None):
+        championships = payload.get('championships')
+        if not championships or not isinstance(championships, list):
+            raise RuntimeError("HenryGD response missing 'championships'")
+        bracket_games = championships[0].get('games') or []
+        if not isinstance(bracket_games, list):
+            raise RuntimeError("HenryGD response has invalid 'games' format")
+
+        self.digest = digest
+        self.bracket = championships[0]
+        self.games_by_position = {}
+        self.games_by_round = {}
+        self.games_by_team = {}
+        self.team_info = {}  # normalized_name -> {logo, seed, name}
+        self._round_dicts = None
+        self._projection = None
+
+        games = []
+        for game in bracket_games:
+            position_id = game.get('bracketPositionId')
+            if position_id is None:
                 continue
-            teams.append(team_name)
-            if team.get('isWinner'):
-                winner_name = team_name
-            # Extract logo and seed info
-            nkey = normalize_team_name(team_name)
-            if nkey and nkey not in team_info:
-                team_info[nkey] = {
-                    'logo': team.get('logoUrl', ''),
-                    'seed': team.get('seed'),
-                    'name': team_name,
-                }
+            teams = []
+            scores = []
+            winner_name = None
+            for team in game.get('teams') or []:
+                team_name = team.get('nameShort') or team.get('nameFull') or team.get('seoname')
+                if not team_name:
+                    continue
+                teams.append(team_name)
+                scores.append(parse_score(team.get('score')))
+                if team.get('isWinner'):
+                    winner_name = team_name
+                nkey = normalize_team_name(team_name)
+                if nkey and nkey not in self.team_info:
+                    self.team_info[nkey] = {
+                        'logo': team.get('logoUrl', ''),
+                        'seed': team.get('seed'),
+                        'name': team_name,
+                    }
+                elif nkey and not self.team_info[nkey]['seed']:
+                    self.team_info[nkey]['seed'] = team.get('seed')
+            parent_id = game.get('victorBracketPositionId')
+            bracket_game = BracketGame(
+                position_id,
+                str(parent_id) if parent_id is not None else None,
+                game.get('startTimeEpoch'),
+                teams,
+                winner_name,
+                contest_id=game.get('contestId'),
+                game_state=game.get('gameState'),
+                scores=scores,
+                section_id=game.get('sectionId'),
+            )
+            self.games_by_position[str(position_id)] = bracket_game
+            games.append(bracket_game)
 
-        if len(teams) < 2:
-            continue
+        self._assign_depths()
 
-        games_by_round.setdefault(round_name, []).append(
-            {
-                'position_id': position_id,
-                'start_time_epoch': game.get('startTimeEpoch'),
-                'team1': teams[0],
-                'team2': teams[1],
-                'winner': winner_name,
+        for bracket_game in games:
+            bracket_game.round_name = HENRYGD_DEPTH_TO_ROUND.get(bracket_game.depth)
+            if not bracket_game.round_name or len(bracket_game.teams) < 2:
+                continue
+            self.games_by_round.setdefault(bracket_game.round_name, []).append(bracket_game)
+            for team_name in bracket_game.teams:
+                self.games_by_team.setdefault(normalize_team_name(team_name), []).append(bracket_game)
+
+        for round_games in self.games_by_round.values():
+            round_games.sort(
+                key=lambda game: (
+                    game.start_time_epoch is None,
+                    game.start_time_epoch or 0,
+                    bracket_position_number(game.position_id) is None,
+                    bracket_position_number(game.position_id) or 0,
+                )
+            )
+
+    def _assign_depths(self):
+        """Set each game's distance from the final by walking victor links upwards iteratively.
+
+        A game whose parent is missing is a root (depth 0); a cycle is cut where it closes.
+        """
+        depths = {}
+        for position_key in self.games_by_position:
+            path = []
+            on_path = set()
+            current = position_key
+            while True:
+                if current in depths:
+                    base = depths[current]
+                    break
+                parent_key = self.games_by_position[current].parent_key
+                if parent_key is None or parent_key not in self.games_by_position:
+                    depths[current] = base = 0
+                    break
+                path.append(current)
+                on_path.add(current)
+                current = parent_key
+                if current in on_path:
+                    base = 0
+                    break
+            for key in reversed(path):
+                base += 1
+                depths[key] = base
+        for position_key, depth in depths.items():
+            self.games_by_position[position_key].depth = depth
+
+    def live_games(self):
+        return [game for round_games in self.games_by_round.values() for game in round_games if game.is_live]
+
+    def round_dicts(self):
+        """Return ``{round_name: [game dict]}`` in tip-off order (cached; do not mutate)."""
+        if self._round_dicts is None:
+            self._round_dicts = {
+                round_name: [game.as_dict() for game in round_games]
+                for round_name, round_games in self.games_by_round.items()
             }
-        )
+        return self._round_dicts
+
+    def projection(self):
+        """Return the bracket laid out for the view, with only the fields it draws (cached; do not mutate).
+
+        ``{'sections': [{'id', 'name', 'rounds': [{'label', 'slots': [{'position_id', 'matchup_key',
+        'teams': [{'name', 'key', 'seed', 'score', 'winner'}]}]}]}]}``. Regions are grouped by
+        ``sectionId`` and rounds by the hundreds digit of the position id, as HenryGD numbers them.
+        """
+        if self._projection is None:
+            rounds_by_section = {}
+            positioned_games = []
+            for game in self.games_by_position.values():
+                position_number = bracket_position_number(game.position_id)
+                if position_number is None:
+                    logger.warning("Skipping bracket game with unusable bracketPositionId %r", game.position_id)
+                else:
+                    positioned_games.append((position_number, game))
+            for position_number, game in sorted(positioned_games, key=lambda item: item[0]):
+                teams = []
+                for team_name, score in zip(game.teams, game.scores):
+                    key = normalize_team_name(team_name)
+                    teams.append({
+                        'name': team_name,
+                        'key': key,
+                        'seed': (self.team_info.get(key) or {}).get('seed'),
+                        'score': score,
+                        'winner': team_name == game.winner,
+                    })
+                slot = {
+                    'position_id': game.position_id,
+                    'matchup_key': '|'.join(sorted(team['key'] for team in teams)) if len(teams) == 2 else None,
+                    'teams': teams,
+                }
+                section_rounds = rounds_by_section.setdefault(game.section_id or 'CC', {})
+                section_rounds.setdefault(position_number // 100, []).append(slot)
+
+            self._projection = {'sections': [
+                {
+                    'id': section_id,
+                    'name': BRACKET_SECTION_NAMES[section_id],
+                    'rounds': [
+                        {
+                            'label': BRACKET_ROUND_LABELS.get(round_number, f'Round {round_number}'),
+                            'slots': rounds_by_section[section_id][round_number],
+                        }
+                        for round_number in sorted(rounds_by_section[section_id])
+                    ],
+                }
+                for section_id in BRACKET_SECTION_NAMES
+                if section_id in rounds_by_section
+            ]}
+        return self._projection
+
+
+# Display order of bracket regions, and the label for each round digit of a position id.
+BRACKET_SECTION_NAMES = {
+    'TT': 'First Four',
+    'TL': 'East',
+    'TR': 'West',
+    'BL': 'South',
+    'BR': 'Midwest',
+    'CC': 'Final Four',
+}
+BRACKET_ROUND_LABELS = {
+    1: 'First Four',
+    2: 'Round of 64',
+    3: 'Round of 32',
+    4: 'Sweet 16',
+    5: 'Elite 8',
+    6: 'Final Four',
+    7: 'Championship',
+}
+BRACKET_MODEL_CACHE_SIZE = 4
+_bracket_models = OrderedDict()
+_bracket_model_lock = threading.Lock()
+
+
+def get_bracket_model(payload, digest=None):
+    """Return the parsed model for ``payload``, parsing each distinct payload (by hash) once.
+
+    Pass the response-body ``digest`` from ``fetch_henrygd_bracket`` when there is one; without
+    it the payload is hashed as canonical JSON, which costs a full re-serialization.
+    """
+    if digest is None:
+        _, digest = henrygd_payload_digest(payload)
+    with _bracket_model_lock:
+        model = _bracket_models.get(digest)
+        if model is not None:
+            _bracket_models.move_to_end(digest)
+    metrics.inc('march_madness_cache_lookups_total', cache='bracket_model', result='miss' if model is None else 'hit')
+    if model is None:
+        model = BracketModel(payload, digest)
+        with _bracket_model_lock:
+            _bracket_models[digest] = model
+            while len(_bracket_models) > BRACKET_MODEL_CACHE_SIZE:
+                _bracket_models.popitem(last=False)
+    return model
 
-    for round_games in games_by_round.values():
-        round_games.sort(
-            key=lambda game: (
-                game.get('start_time_epoch') is None,
-                game.get('start_time_epoch') or 0,
-                game['position_id'],
-            )
-        )
 
-    return games_by_round, team_info
+def build_henrygd_games_by_round(payload):
+    model = get_bracket_model(payload)
+    return model.round_dicts(), model.team_info
 
 
 def resolve_round_winner_name(local_game, external_winner_name):
@@ -511,21 +2437,34 @@ def resolve_team_name_from_candidates(team_name, candidate_names):
     return None
 
 
-def apply_henrygd_winners_to_round(round_obj, external_games):
-    if not round_obj or not external_games:
-        return 0
+class PlannedGame:
+    """A game as it will look once a sync diff is applied; ``id`` is None for games in new rounds."""
+
+    __slots__ = ('id', 'team1', 'team2', 'winner')
+
+    def __init__(self, id, team1, team2, winner=None):
+        self.id = id
+        self.team1 = team1
+        self.team2 = team2
+        self.winner = winner
 
-    local_games = list(round_obj.games)
-    if not local_games:
-        return 0
+
+def plan_henrygd_winner_changes(games, external_games):
+    """Return ``[(game, winner)]`` for games whose HenryGD winner differs from the stored one.
+
+    Games are matched by their normalized team pair; ambiguous pairs are skipped. Nothing
+    is modified.
+    """
+    if not games or not external_games:
+        return []
 
     local_pair_map = {}
-    for game in local_games:
+    for game in games:
         pair_key = frozenset({normalize_team_name(game.team1), normalize_team_name(game.team2)})
         local_pair_map.setdefault(pair_key, []).append(game)
 
-    updated = 0
-    used_game_ids = set()
+    changes = []
+    used_games = set()
     for external_game in external_games:
         pair_key = frozenset(
             {
@@ -533,81 +2472,220 @@ def apply_henrygd_winners_to_round(round_obj, external_games):
                 normalize_team_name(external_game['team2']),
             }
         )
-        candidates = [game for game in local_pair_map.get(pair_key, []) if game.id not in used_game_ids]
+        candidates = [game for game in local_pair_map.get(pair_key, []) if id(game) not in used_games]
         if len(candidates) != 1:
             continue
 
         game = candidates[0]
-        used_game_ids.add(game.id)
+        used_games.add(id(game))
         external_winner = external_game.get('winner')
         if not external_winner:
             continue
 
         resolved_winner = resolve_round_winner_name(game, external_winner)
         if resolved_winner and game.winner != resolved_winner:
-            game.winner = resolved_winner
-            updated += 1
+            changes.append((game, resolved_winner))
 
-    return updated
+    return changes
 
 
-def sync_tournament_from_henrygd(payload=None):
-    payload = payload or fetch_henrygd_bracket_payload(app.config['TOURNAMENT_YEAR'])
+def build_henrygd_sync_diff(payload):
+    """Work out everything a sync would change without writing anything.
+
+    Rounds are walked in tournament order against an in-memory plan, so a payload that is
+    several rounds ahead of the database yields the whole chain of winners, closes and new
+    rounds. The result is what ``sync_tournament_from_henrygd`` returns as its summary:
+
+    - ``winners_updated`` / ``winner_changes``: winners set on existing or new games
+    - ``rounds_closed`` / ``rounds_created``: round names, in tournament order
+    - ``new_rounds``: point value and games for each created round
+    - ``point_changes``: ``{'id', 'points'}`` for picks whose points change
+    - ``team_info_changed``: whether the cached logos/seeds differ
+    - ``snapshot_from_round``: earliest round whose standings snapshot must be rebuilt
+    """
     external_games_by_round, team_info = build_henrygd_games_by_round(payload)
 
-    # Cache team info (logos, seeds) for use across the app
-    if team_info:
-        setting = AppSetting.query.get('team_info')
-        info_json = json.dumps(team_info)
-        if setting:
-            setting.value = info_json
-        else:
-            db.session.add(AppSetting(key='team_info', value=info_json))
-        db.session.commit()
+    rounds_by_name = {round_obj.name: round_obj for round_obj in Round.query.order_by(Round.id).all()}
+    games_by_round_id = defaultdict(list)
+    for game_id, round_id, team1, team2, winner in db.session.execute(
+        select(Game.id, Game.round_id, Game.team1, Game.team2, Game.winner).order_by(Game.id)
+    ):
+        games_by_round_id[round_id].append(PlannedGame(game_id, team1, team2, winner))
 
-    summary = {
+    diff = {
         'winners_updated': 0,
         'rounds_closed': [],
         'rounds_created': [],
+        'winner_changes': [],
+        'new_rounds': [],
+        'point_changes': [],
+        'team_info': team_info,
+        'team_info_changed': bool(team_info) and team_info != get_tournament().team_info,
+        'snapshot_from_round': None,
     }
-    rounds_by_name = {round_obj.name: round_obj for round_obj in Round.query.order_by(Round.id).all()}
 
+    planned_rounds = {}
     for index, round_name in enumerate(TOURNAMENT_ROUND_NAMES):
         round_obj = rounds_by_name.get(round_name)
-        if not round_obj and index > 0:
-            prev_round_name = TOURNAMENT_ROUND_NAMES[index - 1]
-            prev_round = rounds_by_name.get(prev_round_name)
-            if prev_round and prev_round.closed and len(prev_round.games) >= 2 and all(game.winner for game in prev_round.games):
-                calculate_points(prev_round)
-                round_obj = create_next_round(prev_round, payload=payload)
-                rounds_by_name[round_obj.name] = round_obj
-                summary['rounds_created'].append(round_obj.name)
-        if not round_obj:
-            continue
+        if round_obj:
+            planned = {
+                'id': round_obj.id,
+                'point_value': round_obj.point_value,
+                'closed': round_obj.closed,
+                'games': games_by_round_id.get(round_obj.id, []),
+            }
+        else:
+            prev_planned = planned_rounds.get(TOURNAMENT_ROUND_NAMES[index - 1]) if index > 0 else None
+            if not (
+                prev_planned
+                and prev_planned['closed']
+                and len(prev_planned['games']) >= 2
+                and all(game.winner for game in prev_planned['games'])
+            ):
+                continue
+            matchup_pairs, _ = pair_matchups(prev_planned['games'], external_games_by_round.get(round_name, []))
+            planned = {
+                'id': None,
+                'point_value': prev_planned['point_value'] * 2 if round_name != 'Championship' else prev_planned['point_value'],
+                'closed': True,
+                'games': [PlannedGame(None, team1, team2) for team1, team2 in filter(None, matchup_pairs)],
+            }
+            diff['rounds_created'].append(round_name)
+            diff['new_rounds'].append({'name': round_name, 'point_value': planned['point_value'], 'games': planned['games']})
+        planned_rounds[round_name] = planned
+
+        winner_changes = plan_henrygd_winner_changes(planned['games'], external_games_by_round.get(round_name, []))
+        for game, winner in winner_changes:
+            diff['winner_changes'].append({
+                'round': round_name,
+                'game_id': game.id,
+                'team1': game.team1,
+                'team2': game.team2,
+                'previous': game.winner,
+                'winner': winner,
+            })
+            game.winner = winner
+        diff['winners_updated'] += len(winner_changes)
+
+        if planned['games'] and all(game.winner for game in planned['games']):
+            if not planned['closed']:
+                planned['closed'] = True
+                diff['rounds_closed'].append(round_name)
+            if (winner_changes or round_name in diff['rounds_closed']) and not diff['snapshot_from_round']:
+                diff['snapshot_from_round'] = round_name
+
+    # Points are re-derived for every existing pick so stale scores are corrected too.
+    existing_games = {
+        game.id: (round_name, planned['point_value'], game.winner)
+        for round_name, planned in planned_rounds.items()
+        for game in planned['games']
+        if game.id is not None
+    }
+    if existing_games:
+        for pick_id, game_id, picked_team, wager, points in db.session.execute(
+            select(Pick.id, Pick.game_id, Pick.picked_team, Pick.wager, Pick.points)
+            .where(Pick.game_id.in_(existing_games))
+        ):
+            round_name, point_value, winner = existing_games[game_id]
+            new_points = pick_points(round_name, point_value, picked_team, winner, wager)
+            if new_points != points:
+                diff['point_changes'].append({'id': pick_id, 'points': new_points})
+
+    for new_round in diff['new_rounds']:
+        new_round['games'] = [
+            {'team1': game.team1, 'team2': game.team2, 'winner': game.winner} for game in new_round['games']
+        ]
+    return diff
+
+
+def apply_henrygd_sync_diff(diff):
+    """Apply a ``build_henrygd_sync_diff`` result in one transaction using bulk statements."""
+    try:
+        if diff['team_info_changed']:
+            set_app_setting('team_info', json.dumps(diff['team_info']))
+
+        winner_rows = [
+            {'id': change['game_id'], 'winner': change['winner']}
+            for change in diff['winner_changes']
+            if change['game_id'] is not None
+        ]
+        if winner_rows:
+            db.session.execute(update(Game), winner_rows)
+        if diff['point_changes']:
+            db.session.execute(update(Pick), diff['point_changes'])
+        if diff['rounds_closed']:
+            db.session.execute(
+                update(Round)
+                .where(Round.name.in_(diff['rounds_closed']))
+                .values(closed=True, closed_for_selection=True)
+            )
 
-        winners_updated = apply_henrygd_winners_to_round(round_obj, external_games_by_round.get(round_name, []))
-        summary['winners_updated'] += winners_updated
-        if winners_updated:
-            db.session.commit()
+        if winner_rows or diff['rounds_closed']:
+            bump_cache_version(db.session, TOURNAMENT_VERSION_KEY)
 
-        calculate_points(round_obj)
+        for new_round in diff['new_rounds']:
+            round_obj = Round(name=new_round['name'], point_value=new_round['point_value'], closed=True, closed_for_selection=True)
+            db.session.add(round_obj)
+            db.session.flush()
+            if new_round['games']:
+                db.session.execute(insert(Game), [dict(game, round_id=round_obj.id) for game in new_round['games']])
 
-        if round_obj.games and all(game.winner for game in round_obj.games):
-            if not round_obj.closed:
-                round_obj.closed = True
-                round_obj.closed_for_selection = True
-                db.session.commit()
-                summary['rounds_closed'].append(round_name)
-            has_next_round = round_name != TOURNAMENT_ROUND_NAMES[-1]
-            if has_next_round and len(round_obj.games) >= 2:
-                next_round_name = TOURNAMENT_ROUND_NAMES[index + 1]
-                if next_round_name not in rounds_by_name:
-                    next_round = create_next_round(round_obj, payload=payload)
-                    rounds_by_name[next_round.name] = next_round
-                    summary['rounds_created'].append(next_round.name)
+        if diff['snapshot_from_round']:
+            snapshot_round = Round.query.filter_by(name=diff['snapshot_from_round']).first()
+            snapshot_standings(from_round_id=snapshot_round.id)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        # Bulk UPDATEs skip the mapper listeners.
+        invalidate_tournament_snapshot()
 
-    db.session.commit()
-    return summary
+
+def sync_tournament_from_henrygd(payload=None):
+    """Fetch (unless given) and apply the bracket; fetched payloads are recorded for replay.
+
+    Page views fetch the bracket too, but only syncs are recorded, keeping disk writes off the
+    request path.
+    """
+    if payload is None:
+        payload = fetch_henrygd_bracket_payload(app.config['TOURNAMENT_YEAR'])
+        if app.config.get('HENRYGD_RECORD_DIR'):
+            try:
+                record_henrygd_payload(payload)
+            except OSError:
+                logger.warning("Could not archive HenryGD payload", exc_info=True)
+    diff = build_henrygd_sync_diff(payload)
+    apply_henrygd_sync_diff(diff)
+    metrics.inc('march_madness_syncs_total')
+    metrics.inc('march_madness_sync_winners_updated_total', diff['winners_updated'])
+    metrics.inc('march_madness_sync_rounds_closed_total', len(diff['rounds_closed']))
+    metrics.inc('march_madness_sync_rounds_created_total', len(diff['rounds_created']))
+    return diff
+
+
+def replay_henrygd_sync(directory=None, limit=None):
+    """Run the full sync once per archived payload, in recording order.
+
+    Returns ``[(file_name, elapsed_ms, summary)]`` so a whole tournament can be timed offline
+    or a bad sync reproduced from the exact payload that caused it.
+    """
+    results = []
+    for name, payload in iter_recorded_henrygd_payloads(directory):
+        if limit is not None and len(results) >= limit:
+            break
+        started = time.perf_counter()
+        summary = sync_tournament_from_henrygd(payload=payload)
+        results.append((name, (time.perf_counter() - started) * 1000, summary))
+    return results
+
+
+def pick_points(round_name, point_value, picked_team, winner, wager):
+    if not winner:
+        return 0
+    if round_name == 'Championship':
+        return wager if picked_team == winner else -wager
+    return point_value if picked_team == winner else 0
 
 
 def calculate_points(round):
@@ -615,23 +2693,17 @@ def calculate_points(round):
     game_ids = [game.id for game in games]
     picks = Pick.query.filter(Pick.game_id.in_(game_ids)).all() if game_ids else []
     for pick in picks:
-        game = pick.game
-        if not game.winner:
-            pick.points = 0
-        elif pick.picked_team == game.winner:
-            if round.name == 'Championship':
-                pick.points = pick.wager
-            else:
-                pick.points = round.point_value
-        else:
-            if round.name == 'Championship':
-                pick.points = -pick.wager
-            else:
-                pick.points = 0
+        pick.points = pick_points(round.name, round.point_value, pick.picked_team, pick.game.winner, pick.wager)
     db.session.commit()
 
 
 def get_previous_round(round_obj):
+    """Return the round before ``round_obj`` from the cached tournament structure.
+
+    The result is a read-only ``CachedRound`` (its ``games`` are ``CachedGame`` tuples), not an
+    ORM row: read winners from it, but load ``db.session.get(Round, prev_round.id)`` before
+    changing anything on the previous round.
+    """
     if not round_obj:
         return None
     try:
@@ -640,43 +2712,56 @@ def get_previous_round(round_obj):
         return None
     if round_index == 0:
         return None
-    return Round.query.filter_by(name=TOURNAMENT_ROUND_NAMES[round_index - 1]).first()
+    previous_name = TOURNAMENT_ROUND_NAMES[round_index - 1]
+    return next((round_obj for round_obj in get_tournament().rounds if round_obj.name == previous_name), None)
+
+
+def pair_matchups(prev_games, external_games=None):
+    """Pair the winners of ``prev_games`` (in id order) into next-round matchups.
+
+    HenryGD's matchups for the target round are preferred when any of them resolve to
+    previous winners; otherwise adjacent games' winners are paired. Returns
+    ``(pairs, source)`` where unresolvable slots are None.
+    """
+    prev_winners = [game.winner for game in prev_games if game.winner]
+
+    if external_games:
+        matchup_pairs = []
+        resolved_pair_count = 0
+        for external_game in external_games:
+            team1 = resolve_team_name_from_candidates(external_game['team1'], prev_winners)
+            team2 = resolve_team_name_from_candidates(external_game['team2'], prev_winners)
+            if team1 and team2 and normalize_team_name(team1) != normalize_team_name(team2):
+                matchup_pairs.append((team1, team2))
+                resolved_pair_count += 1
+            else:
+                matchup_pairs.append(None)
+        if resolved_pair_count:
+            return matchup_pairs, 'henrygd'
+
+    matchup_pairs = []
+    for index in range(0, len(prev_games), 2):
+        team1 = prev_games[index].winner
+        team2 = prev_games[index + 1].winner if index + 1 < len(prev_games) else None
+        if team1 and team2 and normalize_team_name(team1) != normalize_team_name(team2):
+            matchup_pairs.append((team1, team2))
+        else:
+            matchup_pairs.append(None)
+    return matchup_pairs, 'local'
 
 
 def build_matchup_pairs_from_previous_round(prev_round, target_round_name, payload=None):
     prev_games = Game.query.filter_by(round_id=prev_round.id).order_by(Game.id).all()
-    prev_winners = [game.winner for game in prev_games if game.winner]
 
+    external_games = []
     if payload:
         try:
             external_games_by_round, _ = build_henrygd_games_by_round(payload)
             external_games = external_games_by_round.get(target_round_name, [])
         except Exception:
-            external_games = []
-
-        if external_games:
-            matchup_pairs = []
-            resolved_pair_count = 0
-            for external_game in external_games:
-                team1 = resolve_team_name_from_candidates(external_game['team1'], prev_winners)
-                team2 = resolve_team_name_from_candidates(external_game['team2'], prev_winners)
-                if team1 and team2 and normalize_team_name(team1) != normalize_team_name(team2):
-                    matchup_pairs.append((team1, team2))
-                    resolved_pair_count += 1
-                else:
-                    matchup_pairs.append(None)
-            if resolved_pair_count:
-                return matchup_pairs, 'henrygd'
+            external_games = []
 
-    matchup_pairs = []
-    for index in range(0, len(prev_games), 2):
-        team1 = prev_games[index].winner
-        team2 = prev_games[index + 1].winner if index + 1 < len(prev_games) else None
-        if team1 and team2 and normalize_team_name(team1) != normalize_team_name(team2):
-            matchup_pairs.append((team1, team2))
-        else:
-            matchup_pairs.append(None)
-    return matchup_pairs, 'local'
+    return pair_matchups(prev_games, external_games)
 
 
 def sync_round_matchups(round_obj, payload=None):
@@ -744,8 +2829,107 @@ def create_next_round(current_round, payload=None):
     db.session.commit()
     return next_round
 
+STANDINGS_SNAPSHOT_KEY_PREFIX = 'standings:'
+
+
+def snapshot_standings(from_round_id=None):
+    """Store cumulative standings after each closed round as compact AppSetting rows.
+
+    Each snapshot is a JSON list of ``[user_id, rank, points]`` in rank order, keyed by
+    round id. Snapshots for rounds before ``from_round_id`` are left untouched.
+    The caller is responsible for committing.
+    """
+    closed_rounds = Round.query.filter_by(closed=True).order_by(Round.id).all()
+    if not closed_rounds:
+        return []
+    users = db.session.query(User.id, User.fun_name).all()
+    round_points = {}
+    for round_id, user_id, points in (
+        db.session.query(Game.round_id, Pick.user_id, db.func.sum(Pick.points))
+        .join(Pick.game)
+        .filter(Game.round_id.in_([round_obj.id for round_obj in closed_rounds]))
+        .group_by(Game.round_id, Pick.user_id)
+    ):
+        round_points.setdefault(round_id, {})[user_id] = points or 0
+
+    totals = {user.id: 0 for user in users}
+    saved_round_ids = []
+    for round_obj in closed_rounds:
+        for user_id, points in round_points.get(round_obj.id, {}).items():
+            if user_id in totals:
+                totals[user_id] += points
+        if from_round_id and round_obj.id < from_round_id:
+            continue
+
+        ordered = sorted(users, key=lambda u: (-totals[u.id], (u.fun_name or '').lower()))
+        rows = []
+        for position, user in enumerate(ordered, start=1):
+            if rows and totals[user.id] == rows[-1][2]:
+                rank = rows[-1][1]
+            else:
+                rank = position
+            rows.append([user.id, rank, totals[user.id]])
+        set_app_setting(f'{STANDINGS_SNAPSHOT_KEY_PREFIX}{round_obj.id}', json.dumps(rows, separators=(',', ':')))
+        saved_round_ids.append(round_obj.id)
+    return saved_round_ids
+
+
+def drop_standings_snapshot(round_id):
+    """Delete the stored standings for a round that was reopened. The caller commits."""
+    db.session.execute(delete(AppSetting).where(AppSetting.key == f'{STANDINGS_SNAPSHOT_KEY_PREFIX}{round_id}'))
+
+
+def load_standings_history():
+    """Return ``{round_id: [[user_id, rank, points], ...]}`` for every stored snapshot."""
+    settings = AppSetting.query.filter(AppSetting.key.like(f'{STANDINGS_SNAPSHOT_KEY_PREFIX}%')).all()
+    history = {}
+    for setting in settings:
+        try:
+            round_id = int(setting.key[len(STANDINGS_SNAPSHOT_KEY_PREFIX):])
+            history[round_id] = json.loads(setting.value)
+        except (ValueError, TypeError):
+            continue
+    return dict(sorted(history.items()))
+
+
+def get_rank_movement(history, round_id=None):
+    """Return ``{user_id: places_gained}`` between ``round_id`` (default: latest) and the snapshot before it."""
+    round_ids = list(history)
+    if round_id not in history:
+        round_id = round_ids[-1] if round_ids else None
+    position = round_ids.index(round_id) if round_id is not None else 0
+    if position == 0:
+        return {}
+    previous_ranks = {user_id: rank for user_id, rank, _ in history[round_ids[position - 1]]}
+    return {
+        user_id: previous_ranks[user_id] - rank
+        for user_id, rank, _ in history[round_id]
+        if user_id in previous_ranks
+    }
+
+
+def build_standings_chart_data(history, closed_rounds, users):
+    """Shape stored snapshots into per-user point and rank series for the standings chart."""
+    round_names = {round_obj.id: round_obj.name for round_obj in closed_rounds}
+    round_ids = [round_id for round_id in history if round_id in round_names]
+    series = {
+        user.id: {'id': user.id, 'name': user.fun_name or user.username, 'points': [], 'ranks': []}
+        for user in users
+    }
+    for round_id in round_ids:
+        snapshot = {user_id: (rank, points) for user_id, rank, points in history[round_id]}
+        for user_id, user_series in series.items():
+            rank, points = snapshot.get(user_id, (None, None))
+            user_series['ranks'].append(rank)
+            user_series['points'].append(points)
+    return {
+        'rounds': [{'id': round_id, 'name': round_names[round_id]} for round_id in round_ids],
+        'users': list(series.values()),
+    }
+
+
 def get_users_with_points():
-    closed_round_ids = [r.id for r in Round.query.filter_by(closed=True).all()]
+    closed_round_ids = get_tournament().closed_round_ids
     points_subquery = db.session.query(
         Pick.user_id,
         db.func.sum(Pick.points).label('total_points')
@@ -758,17 +2942,549 @@ def get_users_with_points():
     return sorted(users, key=lambda u: (-u.points, u.fun_name.lower()))
 
 
-def build_leaderboard_pick_data(users):
-    closed_rounds = Round.query.filter_by(closed=True).order_by(Round.id.desc()).all()
+StandingRow = namedtuple('StandingRow', ['id', 'username', 'fun_name', 'picture', 'points', 'rank', 'dense_rank'])
+SQLITE_WINDOW_FUNCTION_VERSION = (3, 25, 0)
+
+
+def supports_window_functions():
+    if db.engine.dialect.name != 'sqlite':
+        return True
+    import sqlite3
+
+    return sqlite3.sqlite_version_info >= SQLITE_WINDOW_FUNCTION_VERSION
+
+
+def _ranked_standings_subquery():
+    totals = (
+        select(Pick.user_id, func.sum(Pick.points).label('total_points'))
+        .join(Game, Pick.game_id == Game.id)
+        .join(Round, Game.round_id == Round.id)
+        .where(Round.closed.is_(True))
+        .group_by(Pick.user_id)
+        .subquery()
+    )
+    points = func.coalesce(totals.c.total_points, 0)
+    return (
+        select(
+            User.id,
+            User.username,
+            User.fun_name,
+            User.picture,
+            points.label('points'),
+            func.rank().over(order_by=points.desc()).label('rank'),
+            func.dense_rank().over(order_by=points.desc()).label('dense_rank'),
+            func.rank().over(order_by=points.asc()).label('bottom_rank'),
+            func.max(points).over().label('max_points'),
+            func.min(points).over().label('min_points'),
+        )
+        .outerjoin(totals, User.id == totals.c.user_id)
+        .subquery()
+    )
+
+
+def _standing_columns(standings):
+    return [getattr(standings.c, field) for field in StandingRow._fields]
+
+
+def _ranked_standings_fallback():
+    rows = []
+    for position, user in enumerate(get_users_with_points(), start=1):
+        if rows and rows[-1].points == user.points:
+            rank, dense_rank = rows[-1].rank, rows[-1].dense_rank
+        else:
+            rank, dense_rank = position, (rows[-1].dense_rank + 1 if rows else 1)
+        rows.append(StandingRow(user.id, user.username, user.fun_name, user.picture, user.points, rank, dense_rank))
+    return rows
+
+
+def get_ranked_standings():
+    """Return every user's closed-round total with competition and dense ranks, best first."""
+    if not supports_window_functions():
+        return _ranked_standings_fallback()
+    standings = _ranked_standings_subquery()
+    rows = db.session.execute(
+        select(*_standing_columns(standings)).order_by(standings.c.points.desc(), func.lower(standings.c.fun_name))
+    ).all()
+    return [StandingRow(*row) for row in rows]
+
+
+def get_leader_and_trailer_groups():
+    """Return ``(winners, losers)``: users tied for first and for last, or two empty lists when all are tied."""
+    if not supports_window_functions():
+        rows = _ranked_standings_fallback()
+        if not rows or rows[0].points == rows[-1].points:
+            return [], []
+        return (
+            [row for row in rows if row.points == rows[0].points],
+            [row for row in rows if row.points == rows[-1].points],
+        )
+
+    standings = _ranked_standings_subquery()
+    rows = db.session.execute(
+        select(*_standing_columns(standings), standings.c.bottom_rank)
+        .where(
+            or_(standings.c.rank == 1, standings.c.bottom_rank == 1),
+            standings.c.max_points != standings.c.min_points,
+        )
+        .order_by(standings.c.points.desc(), func.lower(standings.c.fun_name))
+    ).all()
+    winners = [StandingRow(*row[:-1]) for row in rows if row.rank == 1]
+    losers = [StandingRow(*row[:-1]) for row in rows if row.bottom_rank == 1]
+    return winners, losers
+
+
+# Finished seasons are frozen by `flask --app app archive-season` into SEASON_ARCHIVE_DIR as
+# <year>.json.z (zlib-compressed JSON), plus all_time.json.z rebuilt from every archive.
+# The /seasons pages read only these files, so they keep working once TOURNAMENT_YEAR
+# and DATABASE_URL move on to the next tournament.
+SEASON_ARCHIVE_FORMAT = 1
+SEASON_ARCHIVE_SUFFIX = '.json.z'
+ALL_TIME_ARCHIVE_NAME = f'all_time{SEASON_ARCHIVE_SUFFIX}'
+_season_archive_cache = {}
+
+
+def build_season_archive(year):
+    """Freeze the live database's tournament into a JSON-ready dict.
+
+    Rows are stored as compact lists: rounds ``[id, name, point_value]``, games
+    ``[id, round_id, team1, team2, winner]`` and picks ``[user_id, game_id, picked_team,
+    wager, points]``. Standings are final, with each user's points per round.
+    """
+    rounds = Round.query.filter_by(closed=True).order_by(Round.id).all()
+    round_ids = [round_obj.id for round_obj in rounds]
+    games = db.session.execute(
+        select(Game.id, Game.round_id, Game.team1, Game.team2, Game.winner)
+        .where(Game.round_id.in_(round_ids))
+        .order_by(Game.round_id, Game.id)
+    ).all()
+    picks = db.session.execute(
+        select(Pick.user_id, Pick.game_id, Pick.picked_team, Pick.wager, Pick.points)
+        .join(Game, Pick.game_id == Game.id)
+        .where(Game.round_id.in_(round_ids))
+        .order_by(Pick.user_id, Pick.game_id)
+    ).all()
+    round_points = defaultdict(dict)
+    for round_id, user_id, points in db.session.execute(
+        select(Game.round_id, Pick.user_id, func.sum(Pick.points))
+        .join(Pick, Pick.game_id == Game.id)
+        .where(Game.round_id.in_(round_ids))
+        .group_by(Game.round_id, Pick.user_id)
+    ):
+        round_points[user_id][round_id] = points or 0
+
+    champion_round = next((round_obj for round_obj in rounds if round_obj.name == 'Championship'), None)
+    champion_game = next((game for game in games if champion_round and game.round_id == champion_round.id), None)
+    return {
+        'format': SEASON_ARCHIVE_FORMAT,
+        'year': year,
+        'archived_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'champion': champion_game.winner if champion_game else None,
+        'rounds': [[round_obj.id, round_obj.name, round_obj.point_value] for round_obj in rounds],
+        'games': [list(game) for game in games],
+        'picks': [list(pick) for pick in picks],
+        'standings': [
+            {
+                'user_id': row.id,
+                'username': row.username,
+                'fun_name': row.fun_name,
+                'picture': row.picture,
+                'points': row.points,
+                'rank': row.rank,
+                'round_points': [round_points[row.id].get(round_id, 0) for round_id in round_ids],
+            }
+            for row in get_ranked_standings()
+        ],
+    }
+
+
+def season_archive_unfinished_reason():
+    """Return why the live tournament can't be archived yet, or None once the Championship is decided."""
+    championship = Round.query.filter_by(name='Championship').first()
+    if championship is None:
+        return 'the Championship round has not been created'
+    if not championship.closed:
+        return 'the Championship round is still open'
+    if Game.query.filter(Game.round_id == championship.id, Game.winner.is_(None)).count():
+        return 'the Championship game has no winner'
+    return None
+
+
+def _write_season_file(directory, name, data):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as archive_file:
+        archive_file.write(zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'), 9))
+    os.replace(temp_path, path)
+    return path
+
+
+def load_season_file(name, directory=None):
+    """Decode an archive file, reusing the parsed copy until the file changes; None if missing."""
+    path = os.path.join(directory or app.config['SEASON_ARCHIVE_DIR'], name)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    entry = _season_archive_cache.get(path)
+    if entry and entry[0] == mtime:
+        return entry[1]
+    with open(path, 'rb') as archive_file:
+        data = json.loads(zlib.decompress(archive_file.read()))
+    _season_archive_cache[path] = (mtime, data)
+    return data
+
+
+def archived_season_years(directory=None):
+    try:
+        names = os.listdir(directory or app.config['SEASON_ARCHIVE_DIR'])
+    except FileNotFoundError:
+        return []
+    years = [
+        int(name[:-len(SEASON_ARCHIVE_SUFFIX)])
+        for name in names
+        if name.endswith(SEASON_ARCHIVE_SUFFIX) and name[:-len(SEASON_ARCHIVE_SUFFIX)].isdigit()
+    ]
+    return sorted(years, reverse=True)
+
+
+def build_all_time_standings(archives):
+    """Combine season archives into one row per username: seasons, titles, best finish and points."""
+    rows = {}
+    for archive in sorted(archives, key=lambda archive: archive['year']):
+        for standing in archive['standings']:
+            row = rows.setdefault(standing['username'], {
+                'username': standing['username'],
+                'seasons': 0,
+                'titles': 0,
+                'best_rank': None,
+                'total_points': 0,
+                'ranks': {},
+            })
+            # The latest season's display name and photo win.
+            row['fun_name'] = standing['fun_name']
+            row['picture'] = standing['picture']
+            row['seasons'] += 1
+            row['titles'] += standing['rank'] == 1
+            row['best_rank'] = min(row['best_rank'] or standing['rank'], standing['rank'])
+            row['total_points'] += standing['points']
+            row['ranks'][str(archive['year'])] = standing['rank']
+    return sorted(
+        rows.values(),
+        key=lambda row: (-row['titles'], -row['total_points'], (row['fun_name'] or row['username']).lower()),
+    )
+
+
+def archive_season(year=None, directory=None):
+    """Write ``<year>.json.z`` for the live tournament and rebuild ``all_time.json.z``; returns both paths."""
+    year = year or app.config['TOURNAMENT_YEAR']
+    directory = directory or app.config['SEASON_ARCHIVE_DIR']
+    season_path = _write_season_file(directory, f'{year}{SEASON_ARCHIVE_SUFFIX}', build_season_archive(year))
+    archives = [load_season_file(f'{archived_year}{SEASON_ARCHIVE_SUFFIX}', directory)
+                for archived_year in archived_season_years(directory)]
+    all_time = {
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'years': sorted((archive['year'] for archive in archives), reverse=True),
+        'champions': {str(archive['year']): archive['champion'] for archive in archives},
+        'standings': build_all_time_standings(archives),
+    }
+    return season_path, _write_season_file(directory, ALL_TIME_ARCHIVE_NAME, all_time)
+
+
+@app.cli.command('archive-season')
+@click.option('--year', type=int, default=None, help='Season to label the archive with (default: TOURNAMENT_YEAR).')
+@click.option('--force', is_flag=True, help='Archive even if the Championship has not been decided.')
+def archive_season_command(year, force):
+    """Freeze this tournament's rounds, games, picks and standings into SEASON_ARCHIVE_DIR."""
+    reason = season_archive_unfinished_reason()
+    if reason and not force:
+        raise click.ClickException(f"Not archiving: {reason}. Use --force to archive anyway.")
+    season_path, all_time_path = archive_season(year)
+    print(f"Archived season to {season_path} ({os.path.getsize(season_path)} bytes)")
+    print(f"Rebuilt all-time standings in {all_time_path}")
+
+
+_pick_distribution_cache = {}
+_pick_distribution_version = 0
+
+
+def invalidate_pick_distribution():
+    global _pick_distribution_version
+    _pick_distribution_version += 1
+    _pick_distribution_cache.clear()
+
+
+def get_pick_distribution(round_obj):
+    """Return ``{game_id: {'total': n, 'shares': {normalized_team: {'team', 'count', 'percent'}}}}`` for a round.
+
+    One GROUP BY over the round's picks, cached per process until a pick is written here, the
+    tournament version row moves (another worker locked, closed or edited a round), or
+    ``PICK_DISTRIBUTION_TTL_SECONDS`` passes.
+    """
+    now = time.monotonic()
+    key = (round_obj.id, bool(round_obj.closed_for_selection), bool(round_obj.closed))
+    versions = (_pick_distribution_version, get_cache_versions().get(TOURNAMENT_VERSION_KEY))
+    entry = _pick_distribution_cache.get(key)
+    if entry and entry[0] == versions and entry[1] > now:
+        metrics.inc('march_madness_cache_lookups_total', cache='pick_distribution', result='hit')
+        return entry[2]
+    metrics.inc('march_madness_cache_lookups_total', cache='pick_distribution', result='miss')
+
+    rows = (
+        db.session.query(Pick.game_id, Pick.picked_team, func.count(Pick.id))
+        .join(Game, Pick.game_id == Game.id)
+        .filter(Game.round_id == round_obj.id)
+        .group_by(Pick.game_id, Pick.picked_team)
+        .all()
+    )
+    distribution = {}
+    for game_id, picked_team, count in rows:
+        game_shares = distribution.setdefault(game_id, {'total': 0, 'shares': {}})
+        game_shares['total'] += count
+        share = game_shares['shares'].setdefault(
+            normalize_team_name(picked_team), {'team': picked_team, 'count': 0, 'percent': 0}
+        )
+        share['count'] += count
+    for game_shares in distribution.values():
+        for share in game_shares['shares'].values():
+            share['percent'] = round(100 * share['count'] / game_shares['total'])
+
+    _pick_distribution_cache[key] = (versions, now + PICK_DISTRIBUTION_TTL_SECONDS, distribution)
+    return distribution
+
+
+def pick_share(distribution, game_id, team_name):
+    """Return the ``{'team', 'count', 'percent'}`` share of ``team_name`` in one game, or None if nobody picked it."""
+    game_shares = distribution.get(game_id)
+    if not game_shares:
+        return None
+    return game_shares['shares'].get(normalize_team_name(team_name))
+
+
+def build_bracket_pick_shares():
+    """Map ``"team1|team2"`` (normalized, sorted) to ``{normalized_team: percent}`` for every locked round."""
+    shares = {}
+    tournament = get_tournament()
+    locked_rounds = [round_obj for round_obj in tournament.rounds if round_obj.closed_for_selection]
+    if not locked_rounds:
+        return shares
+    distributions = {round_obj.id: get_pick_distribution(round_obj) for round_obj in locked_rounds}
+    for game in tournament.games(distributions):
+        game_shares = distributions[game.round_id].get(game.id)
+        if not game_shares:
+            continue
+        matchup_key = '|'.join(sorted((normalize_team_name(game.team1), normalize_team_name(game.team2))))
+        shares[matchup_key] = {team: share['percent'] for team, share in game_shares['shares'].items()}
+    return shares
+
+
+LiveScore = namedtuple('LiveScore', ['position_id', 'team1', 'team2', 'score1', 'score2', 'period', 'clock', 'state'])
+LIVE_SCORES_FAILURE_BACKOFF_SECONDS = 60
+# A refresh running longer than this is presumed lost (e.g. a frozen serverless instance) and retried.
+LIVE_SCORES_REFRESH_TIMEOUT_SECONDS = 120
+
+_live_scores = {'expires_at': 0.0, 'scores': [], 'loaded': False, 'refresh_started': None}
+_live_scores_lock = threading.Lock()
+# Notified whenever a refresh stores scores, so a first viewer can wait briefly for them.
+_live_scores_refreshed = threading.Condition(_live_scores_lock)
+_live_scores_executor = None
+
+
+def live_score_leader(score):
+    if score.score1 is None or score.score2 is None or score.score1 == score.score2:
+        return None
+    return score.team1 if score.score1 > score.score2 else score.team2
+
+
+def parse_live_game(bracket_game, data):
+    """Build a LiveScore from a ``/game/<contestId>`` response, falling back to the bracket's own scores.
+
+    Scores are matched to the bracket's team order by normalized name.
+    """
+    team1, team2 = bracket_game.teams[:2]
+    scores = {normalize_team_name(team1): bracket_game.scores[0], normalize_team_name(team2): bracket_game.scores[1]}
+    contest = data or {}
+    if isinstance(contest.get('contests'), list) and contest['contests']:
+        contest = contest['contests'][0]
+    for team in contest.get('teams') or []:
+        names = team.get('names') or {}
+        team_name = team.get('nameShort') or names.get('short') or team.get('nameFull') or team.get('seoname')
+        team_key = normalize_team_name(team_name)
+        if team_key in scores and parse_score(team.get('score')) is not None:
+            scores[team_key] = parse_score(team.get('score'))
+    return LiveScore(
+        position_id=bracket_game.position_id,
+        team1=team1,
+        team2=team2,
+        score1=scores[normalize_team_name(team1)],
+        score2=scores[normalize_team_name(team2)],
+        period=contest.get('currentPeriod'),
+        clock=contest.get('contestClock'),
+        state=contest.get('gameState') or bracket_game.game_state,
+    )
+
+
+def fetch_live_game(client, bracket_game):
+    data = None
+    if bracket_game.contest_id is not None:
+        try:
+            data = client.get_json(f"/game/{bracket_game.contest_id}")
+        except RuntimeError as exc:
+            logger.warning("Live score fetch failed for contest %s: %s", bracket_game.contest_id, exc)
+    return parse_live_game(bracket_game, data)
+
+
+def _get_live_scores_executor():
+    global _live_scores_executor
+    if _live_scores_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _live_scores_executor = ThreadPoolExecutor(
+            max_workers=app.config['LIVE_SCORES_MAX_CONCURRENCY'],
+            thread_name_prefix='live-scores',
+        )
+    return _live_scores_executor
+
+
+def refresh_live_scores(model=None):
+    """Fetch every in-progress game concurrently and return their LiveScores in bracket order.
+
+    Games still outstanding after LIVE_SCORES_WAIT_SECONDS use the bracket payload's scores.
+    """
+    from concurrent.futures import wait
+
+    if model is None:
+        model = get_bracket_model(*fetch_henrygd_bracket(app.config['TOURNAMENT_YEAR']))
+    games = model.live_games()
+    if not games:
+        return []
+    client = get_henrygd_client()
+    futures = [_get_live_scores_executor().submit(fetch_live_game, client, game) for game in games]
+    done, _ = wait(futures, timeout=app.config['LIVE_SCORES_WAIT_SECONDS'])
+    return [future.result() if future in done else parse_live_game(game, None) for future, game in zip(futures, games)]
+
+
+def live_games_possible():
+    """Live scores only matter while a locked round still has games without a winner."""
+    return db.session.execute(
+        select(Game.id)
+        .join(Round, Game.round_id == Round.id)
+        .where(Round.closed_for_selection.is_(True), Game.winner.is_(None))
+        .limit(1)
+    ).first() is not None
+
+
+def _store_refreshed_live_scores(model):
+    try:
+        scores = refresh_live_scores(model)
+        ttl = app.config['LIVE_SCORES_TTL_SECONDS']
+    except Exception:
+        logger.warning("Live score refresh failed", exc_info=True)
+        scores = []
+        ttl = LIVE_SCORES_FAILURE_BACKOFF_SECONDS
+    with _live_scores_lock:
+        _live_scores.update(expires_at=time.monotonic() + ttl, scores=scores, loaded=True, refresh_started=None)
+        _live_scores_refreshed.notify_all()
+    return scores
+
+
+def _refresh_live_scores_in_background(model):
+    with app.app_context():
+        _store_refreshed_live_scores(model)
+
+
+def get_live_scores(model=None):
+    """Return cached LiveScores, refreshing them at most once per TTL for all viewers.
+
+    Every fetch runs on one background thread; an expired cache keeps being served meanwhile.
+    Before the first load finishes (e.g. on a cold start), a viewer waits at most
+    LIVE_SCORES_WAIT_SECONDS and then renders without live scores. The lock is never held
+    during network I/O.
+    """
+    if not app.config['LIVE_SCORES_ENABLED']:
+        return []
+    if _live_scores['expires_at'] > time.monotonic():
+        metrics.inc('march_madness_cache_lookups_total', cache='live_scores', result='hit')
+        return _live_scores['scores']
+    if not live_games_possible():
+        return []
+    now = time.monotonic()
+    with _live_scores_lock:
+        if _live_scores['expires_at'] > now:
+            metrics.inc('march_madness_cache_lookups_total', cache='live_scores', result='hit')
+            return _live_scores['scores']
+        refresh_started = _live_scores['refresh_started']
+        refreshing = refresh_started is not None and now - refresh_started < LIVE_SCORES_REFRESH_TIMEOUT_SECONDS
+        if not refreshing:
+            _live_scores['refresh_started'] = now
+    metrics.inc('march_madness_cache_lookups_total', cache='live_scores', result='stale' if refreshing else 'miss')
+    if not refreshing:
+        threading.Thread(
+            target=_refresh_live_scores_in_background, args=(model,), name='live-scores-refresh', daemon=True
+        ).start()
+    with _live_scores_refreshed:
+        if not _live_scores['loaded']:
+            _live_scores_refreshed.wait_for(lambda: _live_scores['loaded'], app.config['LIVE_SCORES_WAIT_SECONDS'])
+        return _live_scores['scores']
+
+
+def project_live_standings(standings, live_scores):
+    """Project standings as if every live game ended with its current leader winning.
+
+    Returns ``{user_id: {'live_points', 'provisional_points', 'provisional_rank'}}``, or {}
+    when no live game has a leader.
+    """
+    leaders = {}
+    for score in live_scores:
+        leader = live_score_leader(score)
+        if leader:
+            leaders[frozenset({normalize_team_name(score.team1), normalize_team_name(score.team2)})] = leader
+    if not leaders:
+        return {}
+
+    live_games = {}
+    for game_id, team1, team2, round_name, point_value in db.session.execute(
+        select(Game.id, Game.team1, Game.team2, Round.name, Round.point_value)
+        .join(Round, Game.round_id == Round.id)
+        .where(Game.winner.is_(None))
+    ):
+        leader = leaders.get(frozenset({normalize_team_name(team1), normalize_team_name(team2)}))
+        resolved_leader = resolve_winner_name_for_matchup(team1, team2, leader) if leader else None
+        if resolved_leader:
+            live_games[game_id] = (round_name, point_value, resolved_leader)
+
+    live_points = defaultdict(int)
+    if live_games:
+        for user_id, game_id, picked_team, wager in db.session.execute(
+            select(Pick.user_id, Pick.game_id, Pick.picked_team, Pick.wager).where(Pick.game_id.in_(live_games))
+        ):
+            round_name, point_value, leader = live_games[game_id]
+            live_points[user_id] += pick_points(round_name, point_value, picked_team, leader, wager or 0)
+
+    projected = sorted(
+        ((user.points + live_points[user.id], user.id) for user in standings),
+        key=lambda row: -row[0],
+    )
+    result = {}
+    for position, (points, user_id) in enumerate(projected, start=1):
+        previous = projected[position - 2] if position > 1 else None
+        rank = result[previous[1]]['provisional_rank'] if previous and previous[0] == points else position
+        result[user_id] = {'live_points': live_points[user_id], 'provisional_points': points, 'provisional_rank': rank}
+    return result
+
+
+def build_leaderboard_pick_data(users, as_of_round_id=None):
+    """Return ``(closed_rounds, picks_by_user)``, newest round first; ``as_of_round_id`` drops later rounds."""
+    closed_rounds = [
+        round_obj for round_obj in get_tournament().closed_rounds[::-1]
+        if as_of_round_id is None or round_obj.id <= as_of_round_id
+    ]
     leaderboard_picks = {user.id: {} for user in users}
     if not closed_rounds or not users:
         return closed_rounds, leaderboard_picks
 
-    closed_round_ids = [round_obj.id for round_obj in closed_rounds]
-    games = Game.query.filter(Game.round_id.in_(closed_round_ids)).order_by(Game.round_id.desc(), Game.id).all()
-    games_by_round = {round_obj.id: [] for round_obj in closed_rounds}
-    for game in games:
-        games_by_round.setdefault(game.round_id, []).append(game)
+    games = [game for round_obj in closed_rounds for game in round_obj.games]
+    games_by_round = {round_obj.id: round_obj.games for round_obj in closed_rounds}
 
     game_ids = [game.id for game in games]
     user_ids = [user.id for user in users]
@@ -819,39 +3535,455 @@ def build_leaderboard_pick_data(users):
 
     return closed_rounds, leaderboard_picks
 
+class PickSaveError(ValueError):
+    """A single-pick autosave was rejected; ``status`` is the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+SQLITE_RETURNING_VERSION = (3, 35, 0)
+_pick_upsert_available = None
+
+
+def pick_upsert_available():
+    """Whether autosave can use INSERT ... ON CONFLICT ... RETURNING; checked once per process.
+
+    That needs ``uq_pick_user_game`` (``flask migrate-pick-index`` adds it to older databases)
+    and, on SQLite, 3.35+ for RETURNING. Otherwise picks are saved with a select-then-write.
+    """
+    global _pick_upsert_available
+    if _pick_upsert_available is None:
+        available = True
+        if db.engine.dialect.name == 'sqlite':
+            import sqlite3
+
+            available = sqlite3.sqlite_version_info >= SQLITE_RETURNING_VERSION
+        if available:
+            available = any(index['name'] == PICK_UNIQUE_INDEX.name for index in inspect(db.engine).get_indexes('pick'))
+        _pick_upsert_available = available
+    return _pick_upsert_available
+
+
+def migrate_pick_unique_index():
+    """Delete duplicate picks, keeping the newest row per user and game, then create ``uq_pick_user_game``.
+
+    Returns the number of rows deleted. Safe to re-run.
+    """
+    global _pick_upsert_available
+    newest_ids = select(func.max(Pick.id)).group_by(Pick.user_id, Pick.game_id)
+    try:
+        deleted = db.session.execute(
+            delete(Pick).where(Pick.id.not_in(newest_ids)).execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    PICK_UNIQUE_INDEX.create(db.engine, checkfirst=True)
+    _pick_upsert_available = None
+    invalidate_pick_distribution()
+    return deleted
+
+
+@app.cli.command('migrate-pick-index')
+def migrate_pick_index_command():
+    """Remove duplicate picks and add the unique (user_id, game_id) index pick autosave upserts against."""
+    deleted = migrate_pick_unique_index()
+    print(f"Removed {deleted} duplicate pick(s); {PICK_UNIQUE_INDEX.name} is in place")
+
+
+def _pick_upsert(values, update_columns):
+    statement = dialect_insert(Pick).values(**values)
+    return statement.on_conflict_do_update(
+        index_elements=[Pick.user_id, Pick.game_id],
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+
+
+def _save_pick_without_upsert(user_id, game_id, values):
+    pick = Pick.query.filter_by(user_id=user_id, game_id=game_id).order_by(Pick.id.desc()).first()
+    if pick is None:
+        if 'picked_team' not in values:
+            return None
+        pick = Pick(user_id=user_id, game_id=game_id, **values)
+        db.session.add(pick)
+    else:
+        for column, value in values.items():
+            setattr(pick, column, value)
+    db.session.flush()
+    return pick
+
+
+def save_single_pick(user_id, game_id, picked_team=None, wager=None):
+    """Upsert one user's pick and/or Championship wager for an open game and return the saved state.
+
+    The team is written with a single INSERT ... ON CONFLICT DO UPDATE against ``uq_pick_user_game``
+    (or a select-then-write when ``pick_upsert_available()`` is false); a wager on its own only
+    updates an existing pick. Raises PickSaveError for invalid input.
+    """
+    if picked_team is None and wager is None:
+        raise PickSaveError('Send picked_team and/or wager')
+    row = (
+        db.session.query(Game.team1, Game.team2, Round.name, Round.closed, Round.closed_for_selection)
+        .join(Round, Game.round_id == Round.id)
+        .filter(Game.id == game_id)
+        .first()
+    )
+    if row is None:
+        raise PickSaveError('Unknown game', status=404)
+    team1, team2, round_name, closed, closed_for_selection = row
+    if closed or closed_for_selection:
+        raise PickSaveError('Picks are locked for this round', status=409)
+    if picked_team is not None and picked_team not in (team1, team2):
+        raise PickSaveError(f'Picked team must be {team1} or {team2}')
+
+    values = {}
+    if picked_team is not None:
+        values['picked_team'] = picked_team
+    if wager is not None:
+        if round_name != 'Championship':
+            raise PickSaveError('Wagers are only allowed in the Championship')
+        closed_round_ids = select(Round.id).where(Round.closed.is_(True))
+        available = db.session.query(func.sum(Pick.points)).join(Game).filter(
+            Pick.user_id == user_id, Game.round_id.in_(closed_round_ids)
+        ).scalar() or 0
+        values['wager'] = max(0, min(parse_non_negative_int(wager), available))
+
+    try:
+        if not pick_upsert_available():
+            saved = _save_pick_without_upsert(user_id, game_id, values)
+        else:
+            if picked_team is not None:
+                statement = _pick_upsert({'user_id': user_id, 'game_id': game_id, **values}, list(values))
+            else:
+                statement = update(Pick).where(Pick.user_id == user_id, Pick.game_id == game_id).values(**values)
+            saved = db.session.execute(statement.returning(Pick.picked_team, Pick.wager)).first()
+        if saved is None:
+            raise PickSaveError('Pick a team before setting a wager', status=409)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    invalidate_pick_distribution()
+    return {'game_id': game_id, 'picked_team': saved.picked_team, 'wager': saved.wager or 0}
+
+
+PICK_IMPORT_CHUNK_SIZE = 500
+PICK_IMPORT_MATCHUP_SEPARATOR = r'(?i)\s+(?:vs\.?|v\.?|@)\s+'
+
+
+def _normalize_import_row(row):
+    return {
+        str(key).strip().lower(): (value.strip() if isinstance(value, str) else value)
+        for key, value in row.items()
+        if key is not None
+    }
+
+
+def iter_pick_import_rows(upload):
+    """Yield (line_number, row) pairs from an uploaded CSV, NDJSON or JSON array file.
+
+    CSV and NDJSON are read one line at a time so large uploads never sit in memory.
+    Undecodable NDJSON lines are yielded as a row with an ``_error`` key.
+    """
+    filename = (upload.filename or '').lower()
+    stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+    try:
+        if filename.endswith('.csv') or upload.mimetype == 'text/csv':
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, _normalize_import_row(row)
+            return
+
+        for line_number, line in enumerate(stream, start=1):
+            text = line.strip()
+            if not text:
+                continue
+            if text.startswith('['):
+                # A plain JSON array can only be decoded as a whole.
+                rows = json.loads(text + stream.read())
+                if not isinstance(rows, list):
+                    raise ValueError('JSON upload must be an array of pick objects')
+                for index, row in enumerate(rows, start=1):
+                    if isinstance(row, dict):
+                        yield index, _normalize_import_row(row)
+                    else:
+                        yield index, {'_error': 'Row is not a JSON object'}
+                return
+            try:
+                row = json.loads(text)
+            except json.JSONDecodeError as exc:
+                yield line_number, {'_error': f'Invalid JSON: {exc.msg}'}
+                continue
+            if isinstance(row, dict):
+                yield line_number, _normalize_import_row(row)
+            else:
+                yield line_number, {'_error': 'Row is not a JSON object'}
+    finally:
+        stream.detach()
+
+
+def _resolve_import_game(row, games_by_id, games_by_matchup):
+    game_ref = row.get('game_id') or row.get('matchup') or row.get('game') or ''
+    if isinstance(game_ref, int) or str(game_ref).isdigit():
+        game = games_by_id.get(int(game_ref))
+        if not game:
+            return None, f'Game {game_ref} is not in an open round'
+        return game, None
+
+    matchup = game_ref
+    if matchup:
+        teams = re.split(PICK_IMPORT_MATCHUP_SEPARATOR, str(matchup))
+    else:
+        teams = [row.get('team1'), row.get('team2')]
+    if len(teams) != 2 or not all(teams):
+        return None, 'Row needs a game id, a "Team A vs Team B" matchup, or team1/team2 columns'
+
+    matchup_key = frozenset(normalize_team_name(team) for team in teams)
+    candidates = games_by_matchup.get(matchup_key, [])
+    if not candidates:
+        return None, f'No open game matches {teams[0]} vs {teams[1]}'
+    if len(candidates) > 1:
+        return None, f'Matchup {teams[0]} vs {teams[1]} is ambiguous; use a game id'
+    return candidates[0], None
+
+
+def _flush_pick_import_chunk(pending, summary):
+    if not pending:
+        return
+    user_ids = {user_id for user_id, _ in pending}
+    game_ids = {game_id for _, game_id in pending}
+    existing_ids = {
+        (user_id, game_id): pick_id
+        for pick_id, user_id, game_id in db.session.query(Pick.id, Pick.user_id, Pick.game_id).filter(
+            Pick.user_id.in_(user_ids),
+            Pick.game_id.in_(game_ids),
+        )
+    }
+
+    updates = []
+    inserts = []
+    for (user_id, game_id), values in pending.items():
+        pick_id = existing_ids.get((user_id, game_id))
+        if pick_id:
+            updates.append({'id': pick_id, **values})
+        else:
+            inserts.append({'user_id': user_id, 'game_id': game_id, **values})
+
+    if updates:
+        db.session.execute(update(Pick), updates)
+    if inserts:
+        db.session.execute(insert(Pick), inserts)
+    invalidate_pick_distribution()
+    summary['updated'] += len(updates)
+    summary['inserted'] += len(inserts)
+    pending.clear()
+
+
+def import_picks_from_rows(rows, chunk_size=PICK_IMPORT_CHUNK_SIZE):
+    """Validate and upsert imported picks in chunks inside a single transaction.
+
+    Invalid rows are collected in ``summary['errors']`` instead of aborting the batch.
+    """
+    tournament = get_tournament()
+    rounds_by_id = {round_obj.id: round_obj for round_obj in tournament.unclosed_rounds}
+    games = tournament.games(rounds_by_id)
+    games_by_id = {game.id: game for game in games}
+    games_by_matchup = {}
+    for game in games:
+        matchup_key = frozenset({normalize_team_name(game.team1), normalize_team_name(game.team2)})
+        games_by_matchup.setdefault(matchup_key, []).append(game)
+
+    users_by_name = {
+        username.lower(): user_id
+        for user_id, username in db.session.query(User.id, User.username)
+    }
+    closed_round_ids = tournament.closed_round_ids
+    points_by_user = dict(
+        db.session.query(Pick.user_id, db.func.sum(Pick.points))
+        .join(Game)
+        .filter(Game.round_id.in_(closed_round_ids))
+        .group_by(Pick.user_id)
+        .all()
+    ) if closed_round_ids else {}
+
+    summary = {'rows': 0, 'inserted': 0, 'updated': 0, 'errors': []}
+    pending = {}
+    try:
+        for line_number, row in rows:
+            summary['rows'] += 1
+            if row.get('_error'):
+                summary['errors'].append({'line': line_number, 'message': row['_error']})
+                continue
+
+            username = str(row.get('username') or '').strip()
+            user_id = users_by_name.get(username.lower())
+            if not user_id:
+                summary['errors'].append({'line': line_number, 'message': f'Unknown user "{username}"'})
+                continue
+
+            game, error = _resolve_import_game(row, games_by_id, games_by_matchup)
+            if error:
+                summary['errors'].append({'line': line_number, 'message': error})
+                continue
+
+            picked_team = resolve_winner_name_for_matchup(
+                game.team1,
+                game.team2,
+                row.get('picked_team') or row.get('pick') or row.get('team'),
+            )
+            if not picked_team:
+                summary['errors'].append({
+                    'line': line_number,
+                    'message': f'Picked team must be {game.team1} or {game.team2}',
+                })
+                continue
+
+            values = {'picked_team': picked_team}
+            if rounds_by_id[game.round_id].name == 'Championship':
+                wager = parse_non_negative_int(row.get('wager'), default=0)
+                values['wager'] = max(0, min(wager, points_by_user.get(user_id) or 0))
+            pending[(user_id, game.id)] = values
+            if len(pending) >= chunk_size:
+                _flush_pick_import_chunk(pending, summary)
+
+        _flush_pick_import_chunk(pending, summary)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return summary
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+EXPORT_YIELD_PER = 500
+PICK_EXPORT_COLUMNS = ['username', 'round', 'game_id', 'game', 'picked_team', 'winner', 'points', 'wager']
+STANDINGS_EXPORT_COLUMNS = ['round', 'rank', 'username', 'fun_name', 'round_points', 'total_points']
+
+
+def iter_export_lines(columns, rows, export_format):
+    """Serialize row tuples one line at a time as CSV (with header) or NDJSON."""
+    if export_format == 'ndjson':
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row))) + '\n'
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_pick_export_rows(round_id=None, user_id=None):
+    query = (
+        db.session.query(
+            User.username,
+            Round.name,
+            Game.id,
+            Game.team1,
+            Game.team2,
+            Pick.picked_team,
+            Game.winner,
+            Pick.points,
+            Pick.wager,
+        )
+        .join(Pick.user)
+        .join(Pick.game)
+        .join(Game.round)
+        .order_by(Round.id, Game.id, User.username)
+    )
+    if round_id:
+        query = query.filter(Game.round_id == round_id)
+    if user_id:
+        query = query.filter(Pick.user_id == user_id)
+
+    # yield_per streams through a server-side cursor on Postgres.
+    for username, round_name, game_id, team1, team2, picked_team, winner, points, wager in query.yield_per(EXPORT_YIELD_PER):
+        yield (username, round_name, game_id, f'{team1} vs {team2}', picked_team, winner or '', points or 0, wager or 0)
+
+
+def iter_standings_export_rows(round_id=None, user_id=None):
+    """Yield per-round standings with competition ranks on cumulative closed-round points.
+
+    Only one round's worth of users is held in memory at a time.
+    """
+    users = db.session.query(User.id, User.username, User.fun_name).order_by(User.id).all()
+    cumulative = {user.id: 0 for user in users}
+    for round_obj in get_tournament().closed_rounds:
+        round_points = dict(
+            db.session.query(Pick.user_id, db.func.sum(Pick.points))
+            .join(Game)
+            .filter(Game.round_id == round_obj.id)
+            .group_by(Pick.user_id)
+            .all()
+        )
+        for user in users:
+            cumulative[user.id] += round_points.get(user.id) or 0
+
+        if round_id and round_obj.id != round_id:
+            continue
+
+        standings = sorted(users, key=lambda u: (-cumulative[u.id], (u.fun_name or '').lower()))
+        rank = 0
+        previous_total = None
+        for position, user in enumerate(standings, start=1):
+            if cumulative[user.id] != previous_total:
+                rank = position
+                previous_total = cumulative[user.id]
+            if user_id and user.id != user_id:
+                continue
+            yield (round_obj.name, rank, user.username, user.fun_name, round_points.get(user.id) or 0, cumulative[user.id])
+
+        if round_id:
+            break
+
+
+def build_export_response(name, columns, rows, export_format):
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    return Response(
+        stream_with_context(iter_export_lines(columns, rows, export_format)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={name}.{extension}'},
+    )
+
 # Context Processor for Navbar Points
 app.jinja_env.globals['team_seed'] = team_seed
 app.jinja_env.globals['normalize_team_name'] = normalize_team_name
+app.jinja_env.globals['pick_share'] = pick_share
 
 @app.context_processor
 def inject_user_points():
-    tournament_year = app.config['TOURNAMENT_YEAR']
-    ti = get_team_info()
-    if current_user.is_authenticated:
-        closed_round_ids = [r.id for r in Round.query.filter_by(closed=True).all()]
-        total_points = db.session.query(db.func.sum(Pick.points)).join(Game).filter(Pick.user_id == current_user.id, Game.round_id.in_(closed_round_ids)).scalar() or 0
-        return {'user_points': total_points, 'tournament_year': tournament_year, 'team_info': ti}
-    return {'user_points': 0, 'tournament_year': tournament_year, 'team_info': ti}
+    # Templates read rounds and team info through `tournament`, so pages that don't show
+    # them don't load them.
+    tournament = get_tournament()
+    return {
+        'user_points': tournament.user_points,
+        'tournament_year': app.config['TOURNAMENT_YEAR'],
+        'tournament': tournament,
+    }
 
 # Routes
 @app.route('/')
 def home():
     if current_user.is_authenticated:
         return redirect(url_for('dashboard'))
-    current_round = Round.query.filter_by(closed=False).order_by(Round.id).first()
-    return render_template('home.html', current_round=current_round)
+    unclosed_rounds = get_tournament().unclosed_rounds
+    return render_template('home.html', current_round=unclosed_rounds[0] if unclosed_rounds else None)
 
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    users = get_users_with_points()
-    winners = []
-    losers = []
-    if users and users[0].points != users[-1].points:
-        top_pts = users[0].points
-        bot_pts = users[-1].points
-        winners = [u for u in users if u.points == top_pts]
-        losers = [u for u in users if u.points == bot_pts]
+    winners, losers = get_leader_and_trailer_groups()
     return render_template('dashboard.html', winners=winners, losers=losers)
 
 @app.route('/login', methods=['GET', 'POST'])
@@ -862,7 +3994,19 @@ def login():
         username = request.form['username']
         password = request.form['password']
         user = User.query.filter_by(username=username).first()
-        if user and user.check_password(password):
+        try:
+            password_ok = user is not None and user.check_password(password)
+        except PasswordHasherBusy as exc:
+            flash(str(exc), 'warning')
+            return render_template('login.html'), 503
+        if password_ok:
+            if user.password_needs_rehash():
+                try:
+                    user.set_password(password)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Password rehash failed for user_id=%s", user.id)
             login_user(user)
             return redirect(url_for('dashboard'))
         else:
@@ -878,18 +4022,24 @@ def logout():
 @app.route('/pick', methods=['GET', 'POST'])
 @login_required
 def pick():
-    current_round = Round.query.filter_by(closed=False, closed_for_selection=False).order_by(Round.id).first()
+    tournament = get_tournament()
+    current_round = tournament.open_round
     
     if not current_round:
-        flash('No open rounds available for picks', 'warning')
-        return redirect(url_for('home'))
+        locked_round = tournament.locked_round
+        if not locked_round:
+            flash('No open rounds available for picks', 'warning')
+            return redirect(url_for('home'))
+        games = locked_round.games
+        picks = Pick.query.filter(Pick.user_id == current_user.id, Pick.game_id.in_([g.id for g in games])).all()
+        return render_template('pick.html', games=games, existing_picks={pick.game_id: pick for pick in picks},
+                               current_round=locked_round, locked=True,
+                               pick_distribution=get_pick_distribution(locked_round))
 
-    games = Game.query.filter_by(round_id=current_round.id).all()
+    games = current_round.games
     picks = Pick.query.filter(Pick.user_id == current_user.id, Pick.game_id.in_([g.id for g in games])).all()
     existing_picks = {pick.game_id: pick for pick in picks}
-    
-    closed_round_ids = [r.id for r in Round.query.filter_by(closed=True).all()]
-    user_total_points = db.session.query(db.func.sum(Pick.points)).join(Game).filter(Pick.user_id == current_user.id, Game.round_id.in_(closed_round_ids)).scalar() or 0
+    user_total_points = tournament.user_points
 
     error_game_id = None
     wager = 0
@@ -930,75 +4080,76 @@ def pick():
 
     return render_template('pick.html', games=games, existing_picks=existing_picks, current_round=current_round, user_points=user_total_points, error_game_id=None, wager=0)
 
+@app.route('/api/picks', methods=['POST'])
+@login_required
+def autosave_pick():
+    data = request.get_json(silent=True) or {}
+    try:
+        game_id = int(data.get('game_id'))
+    except (TypeError, ValueError):
+        return {'error': 'game_id is required'}, 400
+    try:
+        return save_single_pick(current_user.id, game_id, data.get('picked_team'), data.get('wager'))
+    except PickSaveError as exc:
+        return {'error': str(exc)}, exc.status
+
 @app.route('/view_picks')
 @login_required
 def view_picks():
     start_time = time.time()
-    closed_rounds = Round.query.filter_by(closed=True).order_by(Round.id.desc()).all()
-    logger.debug(f"Fetched closed rounds in {time.time() - start_time:.3f} seconds")
+    tournament = get_tournament()
+    closed_rounds = tournament.closed_rounds[::-1]
     if not closed_rounds:
         flash('No closed rounds available to view picks', 'warning')
         return redirect(url_for('home'))
 
-    start_time = time.time()
-    users = User.query.all()
-    logger.debug(f"Fetched users in {time.time() - start_time:.3f} seconds")
-
-    start_time = time.time()
-    closed_round_ids = [round.id for round in closed_rounds]
-    games = Game.query.filter(Game.round_id.in_(closed_round_ids)).all()
-    game_ids = [game.id for game in games]
-    logger.debug(f"Fetched games in {time.time() - start_time:.3f} seconds")
-
-    start_time = time.time()
-    picks = Pick.query.options(joinedload(Pick.user), joinedload(Pick.game)).filter(Pick.game_id.in_(game_ids)).all()
-    logger.debug(f"Fetched picks with joinedload in {time.time() - start_time:.3f} seconds")
-
-    start_time = time.time()
-    picks_by_game = {}
+    # Rounds and games come from the tournament snapshot; only users and picks are read here.
+    users = db.session.execute(select(User.id, User.username).order_by(User.id)).all()
+    games_by_round = {round.id: list(round.games) for round in closed_rounds}
+    game_ids = [game.id for round_games in games_by_round.values() for game in round_games]
+    picks = db.session.execute(
+        select(Pick.game_id, Pick.user_id, Pick.picked_team, Pick.wager, Pick.points, User.username)
+        .join(User, Pick.user_id == User.id)
+        .where(Pick.game_id.in_(game_ids))
+        .order_by(Pick.id)
+    ).all()
+    logger.debug(f"Fetched users and picks in {time.time() - start_time:.3f} seconds")
+
+    picks_by_game = defaultdict(list)
+    points_by_pick = {}
     for pick in picks:
-        if pick.game_id not in picks_by_game:
-            picks_by_game[pick.game_id] = []
         picks_by_game[pick.game_id].append(pick)
-
-    games_by_round = {round.id: [g for g in games if g.round_id == round.id] for round in closed_rounds}
-    for round_id, round_games in games_by_round.items():
-        logger.debug(f"Round {round_id} has {len(round_games)} games")
+        points_by_pick[pick.user_id, pick.game_id] = pick.points or 0
 
     points_by_user_game = {}
     user_totals_by_round = {}
     for round in closed_rounds:
         points_by_user_game[round.id] = {}
-        user_totals_by_round[round.id] = {}
+        totals = {}
         for user in users:
-            points_by_user_game[round.id][user.id] = {}
-            total = 0
-            for game in games_by_round[round.id]:
-                pick = next((p for p in picks_by_game.get(game.id, []) if p.user_id == user.id), None)
-                points = pick.points if pick else 0
-                points_by_user_game[round.id][user.id][game.id] = points
-                total += points
-            user_totals_by_round[round.id][user.id] = total
-            user.points = total
-
-    for round_id in user_totals_by_round:
-        user_totals = [(user, user_totals_by_round[round_id][user.id]) for user in users]
-        user_totals_by_round[round_id] = sorted(user_totals, key=lambda x: x[1], reverse=True)
+            user_points = {game.id: points_by_pick.get((user.id, game.id), 0) for game in games_by_round[round.id]}
+            points_by_user_game[round.id][user.id] = user_points
+            totals[user.id] = sum(user_points.values())
+        user_totals_by_round[round.id] = sorted(
+            ((user, totals[user.id]) for user in users), key=lambda x: x[1], reverse=True
+        )
 
-    logger.debug(f"Processed data for view_picks in {time.time() - start_time:.3f} seconds")
+    pick_distributions = {round.id: get_pick_distribution(round) for round in closed_rounds}
     return render_template('view_picks.html', closed_rounds=closed_rounds, users=users,
-                          games_by_round=games_by_round, points_by_user_game=points_by_user_game,
-                          user_totals_by_round=user_totals_by_round)
+                          games_by_round=games_by_round, picks_by_game=picks_by_game,
+                          points_by_user_game=points_by_user_game,
+                          user_totals_by_round=user_totals_by_round, pick_distributions=pick_distributions)
 
 @app.route('/admin', methods=['GET', 'POST'])
 @login_required
 def admin():
-    if not current_user.is_admin:
+    if not current_user_is_admin():
         flash('Access denied', 'danger')
         return redirect(url_for('home'))
-    all_rounds = Round.query.order_by(Round.id).all()
+    tournament = get_tournament()
+    all_rounds = tournament.rounds
     selected_round_id = request.args.get('round_id', type=int) or (all_rounds[-1].id if all_rounds else None)
-    selected_round = db.session.get(Round, selected_round_id) if selected_round_id else None
+    selected_round = tournament.structure.rounds_by_id.get(selected_round_id) if selected_round_id else None
 
     # Check if the user is Chris for the prank
     is_chris = current_user.username.lower() == 'chris'
@@ -1030,8 +4181,11 @@ def admin():
                         else:
                             flash(f'Invalid teams selected for {game.team1} vs {game.team2}', 'danger')
                 
+                was_closed = selected_round.closed
                 selected_round.closed = request.form.get('closed') == 'on'
                 selected_round.closed_for_selection = selected_round.closed
+                if was_closed and not selected_round.closed:
+                    drop_standings_snapshot(selected_round.id)
                 try:
                     points = int(request.form.get('point_value', 2))
                     if points > 0:
@@ -1047,6 +4201,7 @@ def admin():
                             selected_round.closed_for_selection = True
                             db.session.commit()
                             calculate_points(selected_round)
+                            snapshot_standings(from_round_id=selected_round.id)
                             next_round = create_next_round(selected_round)
                             flash(f'Next round ({next_round_name}) created', 'success')
                             return redirect(url_for('admin', round_id=next_round.id))
@@ -1057,22 +4212,27 @@ def admin():
                 
                 db.session.commit()
                 calculate_points(selected_round)
+                if selected_round.closed:
+                    snapshot_standings(from_round_id=selected_round.id)
+                    db.session.commit()
                 flash(f'{selected_round.name} saved successfully', 'success')
         return redirect(url_for('admin', round_id=selected_round.id if selected_round else selected_round_id))
     
     prev_round = get_previous_round(selected_round)
     prev_winners = [game.winner for game in prev_round.games if game.winner] if prev_round else []
     
-    users = User.query.all()
     users_with_picks = []
     if selected_round:
-        games = Game.query.filter_by(round_id=selected_round.id).all()
-        game_ids = [game.id for game in games]
-        for user in users:
-            user_picks = Pick.query.filter_by(user_id=user.id).filter(Pick.game_id.in_(game_ids)).count()
+        game_ids = [game.id for game in selected_round.games]
+        pick_counts = dict(db.session.execute(
+            select(Pick.user_id, func.count(Pick.id))
+            .where(Pick.game_id.in_(game_ids))
+            .group_by(Pick.user_id)
+        ).all())
+        for user in db.session.execute(select(User.id, User.username).order_by(User.id)):
             users_with_picks.append({
                 'username': user.username,
-                'has_picks': user_picks == len(games)
+                'has_picks': pick_counts.get(user.id, 0) == len(game_ids)
             })
 
     return render_template('admin.html', all_rounds=all_rounds, selected_round=selected_round, prev_winners=prev_winners, users_with_picks=users_with_picks, is_chris=is_chris, last_sync=get_last_sync())
@@ -1080,7 +4240,7 @@ def admin():
 @app.route('/admin_sync_henrygd', methods=['POST'])
 @login_required
 def admin_sync_henrygd():
-    if not current_user.is_admin:
+    if not current_user_is_admin():
         flash('Access denied', 'danger')
         return redirect(url_for('home'))
 
@@ -1113,7 +4273,7 @@ def admin_sync_henrygd():
 @app.route('/admin_sync_matchups', methods=['POST'])
 @login_required
 def admin_sync_matchups():
-    if not current_user.is_admin:
+    if not current_user_is_admin():
         flash('Access denied', 'danger')
         return redirect(url_for('home'))
 
@@ -1166,30 +4326,29 @@ def sync_results():
 @app.route('/admin_submit_picks', methods=['GET', 'POST'])
 @login_required
 def admin_submit_picks():
-    if not current_user.is_admin:
+    if not current_user_is_admin():
         flash('Access denied', 'danger')
         return redirect(url_for('home'))
     
-    all_open_rounds = Round.query.filter_by(closed=False).order_by(Round.id).all()
+    all_open_rounds = get_tournament().unclosed_rounds
     selected_round_id = request.form.get('round_id', type=int) or request.args.get('round_id', type=int) or (all_open_rounds[0].id if all_open_rounds else None)
     open_round_ids = {round_obj.id for round_obj in all_open_rounds}
     if selected_round_id not in open_round_ids:
         selected_round_id = all_open_rounds[0].id if all_open_rounds else None
-    current_round = db.session.get(Round, selected_round_id) if selected_round_id else None
-    users = User.query.all()
+    current_round = get_tournament().structure.rounds_by_id.get(selected_round_id) if selected_round_id else None
+    users = db.session.execute(select(User.id, User.username).order_by(User.id)).all()
     
     if not current_round:
         flash('No open rounds available for picks', 'warning')
         return redirect(url_for('admin'))
     
-    games = Game.query.filter_by(round_id=current_round.id).all()
+    games = current_round.games
     selected_user_id = request.form.get('user_id', type=int) if request.method == 'POST' else request.args.get('user_id', type=int)
     selected_user = db.session.get(User, selected_user_id) if selected_user_id else None
     
     selected_user_points = 0
     if selected_user:
-        closed_round_ids = [r.id for r in Round.query.filter_by(closed=True).all()]
-        selected_user_points = db.session.query(db.func.sum(Pick.points)).join(Game).filter(Pick.user_id == selected_user.id, Game.round_id.in_(closed_round_ids)).scalar() or 0
+        selected_user_points = get_tournament().user_total_points(selected_user.id)
 
     existing_picks = {}
     if selected_user:
@@ -1207,7 +4366,7 @@ def admin_submit_picks():
                     wager = parse_non_negative_int(request.form.get('wager', 0), default=0) if current_round.name == 'Championship' else 0
                     break
                 else:
-                    existing_pick = Pick.query.filter_by(user_id=selected_user.id, game_id=game.id).first()
+                    existing_pick = existing_picks.get(game.id)
                     if existing_pick:
                         existing_pick.picked_team = picked_team
                         if current_round.name == 'Championship':
@@ -1237,41 +4396,188 @@ def admin_submit_picks():
     
     return render_template('admin_submit_picks.html', all_open_rounds=all_open_rounds, current_round=current_round, games=games, users=users, existing_picks=existing_picks, selected_user_id=selected_user_id, selected_user=selected_user, selected_user_points=selected_user_points)
 
+@app.route('/admin_import_picks', methods=['GET', 'POST'])
+@login_required
+def admin_import_picks():
+    if not current_user_is_admin():
+        flash('Access denied', 'danger')
+        return redirect(url_for('home'))
+
+    summary = None
+    if request.method == 'POST':
+        upload = request.files.get('picks_file')
+        if not upload or not upload.filename:
+            flash('Choose a CSV or JSON file to import', 'warning')
+            return redirect(url_for('admin_import_picks'))
+        try:
+            summary = import_picks_from_rows(iter_pick_import_rows(upload))
+        except Exception as exc:
+            logger.exception("Pick import failed")
+            flash(f'Pick import failed: {exc}', 'danger')
+            return redirect(url_for('admin_import_picks'))
+        flash(
+            f"Pick import complete: {summary['inserted']} pick(s) created, "
+            f"{summary['updated']} pick(s) updated, "
+            f"{len(summary['errors'])} row(s) rejected.",
+            'warning' if summary['errors'] else 'success',
+        )
+
+    return render_template('admin_import_picks.html', summary=summary)
+
+@app.route('/admin_export_picks')
+@login_required
+def admin_export_picks():
+    if not current_user_is_admin():
+        flash('Access denied', 'danger')
+        return redirect(url_for('home'))
+
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        flash(f'Unsupported export format: {export_format}', 'warning')
+        return redirect(url_for('admin'))
+    rows = iter_pick_export_rows(
+        round_id=request.args.get('round_id', type=int),
+        user_id=request.args.get('user_id', type=int),
+    )
+    return build_export_response('picks', PICK_EXPORT_COLUMNS, rows, export_format)
+
+@app.route('/admin_export_standings')
+@login_required
+def admin_export_standings():
+    if not current_user_is_admin():
+        flash('Access denied', 'danger')
+        return redirect(url_for('home'))
+
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        flash(f'Unsupported export format: {export_format}', 'warning')
+        return redirect(url_for('admin'))
+    rows = iter_standings_export_rows(
+        round_id=request.args.get('round_id', type=int),
+        user_id=request.args.get('user_id', type=int),
+    )
+    return build_export_response('standings', STANDINGS_EXPORT_COLUMNS, rows, export_format)
+
+@app.route('/metrics')
+def prometheus_metrics():
+    if not app.config['METRICS_ENABLED']:
+        return Response('Not Found', status=404, mimetype='text/plain')
+    token = app.config['METRICS_TOKEN']
+    if token:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f"Bearer {token}"):
+            return Response('Unauthorized', status=401, mimetype='text/plain')
+    return Response(metrics.render(app.config['METRICS_DIR']), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/admin_profiles/<profile_id>')
+@login_required
+def admin_download_profile(profile_id):
+    if not current_user_is_admin():
+        flash('Access denied', 'danger')
+        return redirect(url_for('home'))
+    if not re.match(PROFILE_ID_PATTERN, profile_id):
+        return Response('Unknown profile', status=404, mimetype='text/plain')
+    path = os.path.join(app.config['PROFILE_DIR'], f"{profile_id}.prof")
+    if not os.path.exists(path):
+        return Response('Unknown profile', status=404, mimetype='text/plain')
+
+    if request.args.get('format') == 'text':
+        import pstats
+
+        report = io.StringIO()
+        pstats.Stats(path, stream=report).sort_stats('cumulative').print_stats(60)
+        return Response(report.getvalue(), mimetype='text/plain')
+    with open(path, 'rb') as profile_file:
+        data = profile_file.read()
+    return Response(
+        data,
+        mimetype='application/octet-stream',
+        headers={'Content-Disposition': f'attachment; filename={profile_id}.prof'},
+    )
+
 @app.route('/bracket')
 @login_required
 def bracket():
     try:
-        payload = fetch_henrygd_bracket_payload(app.config['TOURNAMENT_YEAR'])
-        championships = payload.get('championships', [])
-        if not championships:
+        payload, body_digest = fetch_henrygd_bracket(app.config['TOURNAMENT_YEAR'])
+        if not payload.get('championships'):
             flash('No bracket data available yet.', 'warning')
             return redirect(url_for('home'))
-        bracket_data = championships[0]
+        model = get_bracket_model(payload, body_digest)
     except Exception as exc:
         logger.exception("Failed to fetch bracket data")
         flash(f'Could not load bracket: {exc}', 'danger')
         return redirect(url_for('home'))
-    ti = get_team_info()
-    return render_template('bracket.html', bracket_data=bracket_data, team_info_data=ti)
+    live_scores = {}
+    for score in get_live_scores(model):
+        team_scores = {
+            normalize_team_name(team): value
+            for team, value in ((score.team1, score.score1), (score.team2, score.score2))
+            if value is not None
+        }
+        live_scores[score.position_id] = {'period': score.period, 'clock': score.clock, 'scores': team_scores}
+    return render_template('bracket.html', bracket=model.projection(), live_scores=live_scores,
+                           pick_shares=build_bracket_pick_shares())
 
 @app.route('/leaderboard')
 def leaderboard():
-    users = get_users_with_points()
-    ranks = []
-    for i, user in enumerate(users):
-        if i == 0 or user.points != users[i - 1].points:
-            ranks.append(i + 1)
-        else:
-            ranks.append(ranks[-1])
-    closed_rounds, leaderboard_picks = build_leaderboard_pick_data(users)
+    standings_history = load_standings_history()
+    as_of_round_id = request.args.get('as_of', type=int)
+    if as_of_round_id not in standings_history:
+        as_of_round_id = None
+
+    if as_of_round_id:
+        # Plain rows, not User instances: assigning points to ORM objects would be flushed
+        # as an UPDATE by the next query on this read-only page.
+        users_by_id = {
+            row.id: row for row in db.session.execute(select(User.id, User.username, User.fun_name, User.picture))
+        }
+        users = []
+        dense_ranks = {}
+        for user_id, rank, points in standings_history[as_of_round_id]:
+            user = users_by_id.get(user_id)
+            if user:
+                dense_rank = dense_ranks.setdefault(points, len(dense_ranks) + 1)
+                users.append(StandingRow(user.id, user.username, user.fun_name, user.picture, points, rank, dense_rank))
+        ranks = [user.rank for user in users]
+    else:
+        users = get_ranked_standings()
+        ranks = [user.rank for user in users]
+    closed_rounds, leaderboard_picks = build_leaderboard_pick_data(users, as_of_round_id)
+    live_scores = [] if as_of_round_id else get_live_scores()
     return render_template(
         'leaderboard.html',
         users=users,
         ranks=ranks,
+        live_scores=live_scores,
+        live_standings=project_live_standings(users, live_scores),
         closed_rounds=closed_rounds,
         leaderboard_picks=leaderboard_picks,
         last_sync=get_last_sync(),
+        as_of_round_id=as_of_round_id,
+        rank_movement=get_rank_movement(standings_history, as_of_round_id),
+        standings_history=build_standings_chart_data(standings_history, get_tournament().closed_rounds, users),
+        has_archived_seasons=bool(archived_season_years()),
     )
 
+@app.route('/seasons')
+def seasons():
+    all_time = load_season_file(ALL_TIME_ARCHIVE_NAME) or {'years': [], 'champions': {}, 'standings': []}
+    return render_template('seasons.html', all_time=all_time)
+
+@app.route('/seasons/<int:year>')
+def season_leaderboard(year):
+    archive = load_season_file(f'{year}{SEASON_ARCHIVE_SUFFIX}')
+    if archive is None:
+        flash(f'No archived season for {year}.', 'warning')
+        return redirect(url_for('seasons'))
+    return render_template('season_leaderboard.html', archive=archive)
+
+@app.route('/standings_history')
+def standings_history():
+    history = load_standings_history()
+    closed_rounds = get_tournament().closed_rounds[::-1]
+    users = User.query.order_by(User.id).all()
+    return build_standings_chart_data(history, closed_rounds, users)
+
 if __name__ == '__main__':
     app.run(debug=True)
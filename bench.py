@@ -0,0 +1,396 @@
+import argparse
+import compileall
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+# Benchmarks that write (replay) reset their database, so default to a scratch SQLite file
+# rather than whatever .env points at.
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.gettempdir(), 'mm_bench.db')}")
+
+from app import (  # noqa: E402
+    Game,
+    Pick,
+    Round,
+    User,
+    app,
+    bcrypt,
+    build_henrygd_games_by_round,
+    db,
+    get_ranked_standings,
+    hash_password,
+    iter_recorded_henrygd_payloads,
+    replay_henrygd_sync,
+    run_password_task,
+)
+
+
+def bench_bcrypt(args):
+    """Report password verifications (logins) per second per core at each bcrypt cost."""
+    workers = app.config['PASSWORD_HASH_WORKERS']
+    cores = min(workers, os.cpu_count() or 1)
+    print(f"bcrypt login benchmark: workers={workers} cores={cores} seconds_per_cost={args.seconds}")
+    print(f"{'cost':>4} {'ms/login':>9} {'logins/s':>9} {'logins/s/core':>14}")
+    for cost in args.costs:
+        password_hash = bcrypt.generate_password_hash('benchmark-password', cost).decode('utf-8')
+        completed = 0
+        deadline = time.perf_counter() + args.seconds
+        started = time.perf_counter()
+        # Drive the pool from more request threads than workers, like a login rush.
+        with ThreadPoolExecutor(max_workers=workers * 2) as clients:
+            while time.perf_counter() < deadline:
+                batch = [
+                    clients.submit(run_password_task, bcrypt.check_password_hash, password_hash, 'benchmark-password')
+                    for _ in range(workers * 2)
+                ]
+                completed += sum(1 for future in batch if future.result())
+        elapsed = time.perf_counter() - started
+        rate = completed / elapsed
+        print(f"{cost:>4} {elapsed / completed * 1000 * cores:>9.1f} {rate:>9.1f} {rate / cores:>14.1f}")
+
+
+# Modules only the HenryGD sync, local .env loading or the request profiler need; importing
+# the Vercel entry point must not pull them in. (ssl and http.client arrive with werkzeug.)
+COLDSTART_DEFERRED_MODULES = ('certifi', 'dotenv', 'urllib.request', 'cProfile', 'pstats')
+# Default budgets, enforced by the test suite: the median `import index` time, and the median
+# self time of the app module body (routes, models and config, excluding dependencies).
+COLDSTART_MAX_MS = 1500.0
+COLDSTART_APP_MAX_MS = 60.0
+COLDSTART_CHILD_CODE = """
+import json, sys, time
+baseline = set(sys.modules)
+started = time.perf_counter()
+import index
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({'elapsed_ms': elapsed_ms, 'new_modules': sorted(set(sys.modules) - baseline)}))
+"""
+
+
+def _parse_importtime(stderr):
+    """Return [(depth, self_us, cumulative_us, module)] from ``python -X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def _run_coldstart_child():
+    env = dict(os.environ, VERCEL='1', LOG_LEVEL='WARNING')
+    env.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.gettempdir(), 'mm_coldstart_bench.db')}")
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', COLDSTART_CHILD_CODE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), _parse_importtime(result.stderr)
+
+
+def bench_coldstart(args):
+    """Time ``import index`` in fresh interpreters and break the cost down by import."""
+    # The deploy ships bytecode (see vercel.json), so measure with it rather than timing a
+    # recompile of app.py whenever the source is newer than its .pyc.
+    root = os.path.dirname(os.path.abspath(__file__))
+    for name in ('index.py', 'app.py'):
+        compileall.compile_file(os.path.join(root, name), quiet=1)
+    runs = [_run_coldstart_child() for _ in range(args.runs)]
+    elapsed = [summary['elapsed_ms'] for summary, _ in runs]
+    median_ms = statistics.median(elapsed)
+    _, imports = runs[-1]
+    index_rows = [position for position, row in enumerate(imports) if row[3] == 'index' and row[0] == 0]
+    if index_rows:
+        # importtime lists children before their parent; keep only the ``import index`` subtree.
+        end = index_rows[0]
+        start = end
+        while start > 0 and imports[start - 1][0] > 0:
+            start -= 1
+        imports = imports[start:end + 1]
+
+    print(f"cold start (import index, VERCEL=1): runs={args.runs} median={median_ms:.1f}ms "
+          f"min={min(elapsed):.1f}ms max={max(elapsed):.1f}ms")
+    app_self_ms = [
+        row[1] / 1000 for _, run_imports in runs for row in run_imports if row[3] == 'app' and row[0] == 1
+    ]
+    app_median_ms = statistics.median(app_self_ms) if app_self_ms else None
+    if app_self_ms:
+        print(f"  app module body: median {app_median_ms:.1f}ms self (max {max(app_self_ms):.1f}ms)")
+    top_level = sorted((row for row in imports if row[0] <= 2), key=lambda row: -row[2])[:args.top]
+    print(f"  {'cumulative ms':>13} {'self ms':>8}  module")
+    for depth, self_us, cumulative_us, name in top_level:
+        print(f"  {cumulative_us / 1000:>13.1f} {self_us / 1000:>8.1f}  {'  ' * depth}{name}")
+
+    failures = []
+    new_modules = set(runs[-1][0]['new_modules'])
+    eager = [name for name in COLDSTART_DEFERRED_MODULES if name in new_modules]
+    if eager:
+        failures.append(f"deferred modules imported at cold start: {', '.join(eager)}")
+    if args.max_ms and median_ms > args.max_ms:
+        failures.append(f"median cold start {median_ms:.1f}ms exceeds budget {args.max_ms:.1f}ms")
+    if args.max_app_ms and app_median_ms is not None and app_median_ms > args.max_app_ms:
+        failures.append(f"median app module body {app_median_ms:.1f}ms exceeds budget {args.max_app_ms:.1f}ms")
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+TEMPLATES_CHILD_CODE = """
+import json, time
+from app import app
+timings = {}
+for name in sorted(app.jinja_env.list_templates(extensions=('html',))):
+    started = time.perf_counter()
+    app.jinja_env.get_template(name)
+    timings[name] = (time.perf_counter() - started) * 1000
+print(json.dumps(timings))
+"""
+
+
+def _run_templates_child(env_overrides):
+    env = dict(os.environ, LOG_LEVEL='WARNING', **env_overrides)
+    result = subprocess.run(
+        [sys.executable, '-c', TEMPLATES_CHILD_CODE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_templates(args):
+    """Compare each template's first load in a fresh process: compiled from source vs precompiled bytecode."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cached_env = {'TEMPLATE_CACHE_DIR': cache_dir, 'TEMPLATE_CACHE_RUNTIME_DIR': cache_dir}
+        subprocess.run(
+            [sys.executable, '-m', 'flask', '--app', 'app', 'precompile-templates'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=dict(os.environ, LOG_LEVEL='WARNING', **cached_env),
+            capture_output=True,
+            check=True,
+        )
+        cold = [_run_templates_child({'TEMPLATE_BYTECODE_CACHE': '0'}) for _ in range(args.runs)]
+        warm = [_run_templates_child(cached_env) for _ in range(args.runs)]
+
+    print(f"template first load in a fresh process: runs={args.runs} (median ms)")
+    print(f"  {'template':<26} {'compile':>8} {'bytecode':>9} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for name in sorted(cold[0]):
+        compiled_ms = statistics.median(run[name] for run in cold)
+        cached_ms = statistics.median(run[name] for run in warm)
+        totals[0] += compiled_ms
+        totals[1] += cached_ms
+        print(f"  {name:<26} {compiled_ms:>8.1f} {cached_ms:>9.1f} {compiled_ms / max(cached_ms, 0.001):>7.1f}x")
+    print(f"  {'total':<26} {totals[0]:>8.1f} {totals[1]:>9.1f} {totals[0] / max(totals[1], 0.001):>7.1f}x")
+    return 0
+
+
+def _seed_replay_database(first_payload, user_count):
+    """Recreate the schema with the First Round from the first recording and random picks."""
+    db.drop_all()
+    db.create_all()
+    games_by_round, _ = build_henrygd_games_by_round(first_payload)
+    first_round = Round(name='First Round (Round of 64)', point_value=2, closed=False, closed_for_selection=False)
+    db.session.add(first_round)
+    db.session.flush()
+    games = [
+        Game(round_id=first_round.id, team1=game['team1'], team2=game['team2'])
+        for game in games_by_round.get(first_round.name, [])
+    ]
+    db.session.add_all(games)
+    password_hash = hash_password('benchmark-password')
+    users = [User(username=f'bench{index}', password_hash=password_hash) for index in range(user_count)]
+    db.session.add_all(users)
+    db.session.flush()
+    chooser = random.Random(2025)
+    db.session.add_all(
+        Pick(user_id=user.id, game_id=game.id, picked_team=chooser.choice((game.team1, game.team2)))
+        for user in users
+        for game in games
+    )
+    db.session.commit()
+    return len(games)
+
+
+def bench_replay(args):
+    """Replay archived HenryGD payloads through the full sync against a scratch database."""
+    directory = args.dir or app.config['HENRYGD_RECORD_DIR']
+    if not directory:
+        print('No recording directory: pass --dir or set HENRYGD_RECORD_DIR.', file=sys.stderr)
+        return 1
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            print('replay resets the database; point DATABASE_URL at a scratch SQLite file.', file=sys.stderr)
+            return 1
+        first = next(iter_recorded_henrygd_payloads(directory), None)
+        if first is None:
+            print(f'No recorded payloads in {directory}.', file=sys.stderr)
+            return 1
+        game_count = _seed_replay_database(first[1], args.users)
+        print(f"replay: dir={directory} users={args.users} first_round_games={game_count}")
+        print(f"{'ms':>8} {'winners':>7} {'closed':>6} {'created':>7}  payload")
+        results = replay_henrygd_sync(directory, limit=args.limit)
+        for name, elapsed_ms, summary in results:
+            print(f"{elapsed_ms:>8.1f} {summary['winners_updated']:>7} {len(summary['rounds_closed']):>6} "
+                  f"{len(summary['rounds_created']):>7}  {name}")
+        total_ms = sum(elapsed_ms for _, elapsed_ms, _ in results)
+        print(f"{len(results)} payloads replayed in {total_ms:.1f}ms")
+    return 0
+
+
+def _percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _concurrency_worker(work, deadline, latencies, errors):
+    with app.app_context():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                work()
+            except OperationalError:
+                db.session.rollback()
+                errors.append(1)
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+        db.session.remove()
+
+
+def bench_concurrency(args):
+    """Pick-write throughput while other threads keep reading the leaderboard standings."""
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            print('concurrency resets the database; point DATABASE_URL at a scratch SQLite file.', file=sys.stderr)
+            return 1
+        db.drop_all()
+        db.create_all()
+        first_round = Round(name='First Round (Round of 64)', point_value=2, closed=False, closed_for_selection=False)
+        db.session.add(first_round)
+        db.session.flush()
+        db.session.add_all(Game(round_id=first_round.id, team1=f'T{2 * n + 1}', team2=f'T{2 * n + 2}') for n in range(32))
+        db.session.add_all(User(username=f'bench{n}', password_hash='x') for n in range(args.users))
+        db.session.commit()
+        games = [(game.id, game.team1, game.team2) for game in Game.query.all()]
+        user_ids = [user.id for user in User.query.all()]
+        journal_mode = db.session.execute(text('PRAGMA journal_mode')).scalar()
+        pool = type(db.engine.pool).__name__
+
+    chooser = random.Random(2025)
+    chooser_lock = threading.Lock()
+
+    def write_pick():
+        with chooser_lock:
+            user_id = chooser.choice(user_ids)
+            game_id, team1, team2 = chooser.choice(games)
+            picked_team = chooser.choice((team1, team2))
+        pick = Pick.query.filter_by(user_id=user_id, game_id=game_id).first()
+        if pick:
+            pick.picked_team = picked_team
+        else:
+            db.session.add(Pick(user_id=user_id, game_id=game_id, picked_team=picked_team))
+        db.session.commit()
+
+    def read_standings():
+        get_ranked_standings()
+        db.session.rollback()
+
+    write_latencies, read_latencies, write_errors, read_errors = [], [], [], []
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=_concurrency_worker, args=(write_pick, deadline, write_latencies, write_errors))
+        for _ in range(args.writers)
+    ] + [
+        threading.Thread(target=_concurrency_worker, args=(read_standings, deadline, read_latencies, read_errors))
+        for _ in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"concurrency: journal_mode={journal_mode} pool={pool} writers={args.writers} "
+          f"readers={args.readers} users={args.users} seconds={args.seconds}")
+    print(f"{'':>7} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    for label, latencies, errors in (('writes', write_latencies, write_errors), ('reads', read_latencies, read_errors)):
+        print(f"{label:>7} {len(latencies) / args.seconds:>8.1f} {_percentile(latencies, 0.5):>8.2f} "
+              f"{_percentile(latencies, 0.95):>8.2f} {len(errors):>7}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='March Madness performance benchmarks.')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    bcrypt_parser = subparsers.add_parser('bcrypt', help='Login throughput at each bcrypt cost.')
+    bcrypt_parser.add_argument('--costs', type=int, nargs='+', default=[8, 10, 12])
+    bcrypt_parser.add_argument('--seconds', type=float, default=2.0)
+    bcrypt_parser.set_defaults(func=bench_bcrypt)
+
+    coldstart_parser = subparsers.add_parser('coldstart', help='Import-time breakdown for the Vercel entry point.')
+    coldstart_parser.add_argument('--runs', type=int, default=5)
+    coldstart_parser.add_argument('--top', type=int, default=15)
+    coldstart_parser.add_argument(
+        '--max-ms',
+        type=float,
+        default=float(os.getenv('COLDSTART_MAX_MS', COLDSTART_MAX_MS)),
+        help=f'Fail when the median import time exceeds this budget; 0 disables '
+             f'(default: $COLDSTART_MAX_MS or {COLDSTART_MAX_MS:g}).',
+    )
+    coldstart_parser.add_argument(
+        '--max-app-ms',
+        type=float,
+        default=float(os.getenv('COLDSTART_APP_MAX_MS', COLDSTART_APP_MAX_MS)),
+        help=f'Fail when the app module body\'s median self time exceeds this budget; 0 disables '
+             f'(default: $COLDSTART_APP_MAX_MS or {COLDSTART_APP_MAX_MS:g}).',
+    )
+    coldstart_parser.set_defaults(func=bench_coldstart)
+
+    templates_parser = subparsers.add_parser(
+        'templates',
+        help='Per-template first-load time, compiled from source vs precompiled bytecode.',
+    )
+    templates_parser.add_argument('--runs', type=int, default=5)
+    templates_parser.set_defaults(func=bench_templates)
+
+    replay_parser = subparsers.add_parser('replay', help='Time the full sync over recorded HenryGD payloads.')
+    replay_parser.add_argument('--dir', help='Recording directory (default: $HENRYGD_RECORD_DIR or instance/henrygd_payloads).')
+    replay_parser.add_argument('--users', type=int, default=50, help='Users seeded with random First Round picks.')
+    replay_parser.add_argument('--limit', type=int, help='Stop after this many payloads.')
+    replay_parser.set_defaults(func=bench_replay)
+
+    concurrency_parser = subparsers.add_parser(
+        'concurrency',
+        help='Pick writes per second alongside concurrent leaderboard reads (compare with SQLITE_TUNING=0).',
+    )
+    concurrency_parser.add_argument('--writers', type=int, default=4)
+    concurrency_parser.add_argument('--readers', type=int, default=4)
+    concurrency_parser.add_argument('--users', type=int, default=100)
+    concurrency_parser.add_argument('--seconds', type=float, default=3.0)
+    concurrency_parser.set_defaults(func=bench_concurrency)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
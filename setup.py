@@ -6,7 +6,7 @@ import urllib.error
 import urllib.parse
 import urllib.request
 
-from app import app, db, User, Round, Game
+from app import app, db, hash_passwords, User, Round, Game
 
 try:
     import certifi
@@ -126,9 +126,9 @@ def setup_with_sqlalchemy():
         db.drop_all()
         db.create_all()
 
-        for username, password, is_admin, fun_name, picture in USERS:
-            user = User(username=username, is_admin=is_admin, fun_name=fun_name, picture=picture)
-            user.set_password(password)
+        password_hashes = hash_passwords([password for _, password, _, _, _ in USERS])
+        for (username, password, is_admin, fun_name, picture), password_hash in zip(USERS, password_hashes):
+            user = User(username=username, is_admin=is_admin, fun_name=fun_name, picture=picture, password_hash=password_hash)
             db.session.add(user)
             print(f"User created: username={username}, password={password}, fun_name={fun_name}, picture={picture}{' (Admin)' if is_admin else ''}")
         db.session.commit()
@@ -167,13 +167,12 @@ def setup_with_supabase_api():
         client.delete_all_rows(table)
 
     user_rows = []
-    for username, password, is_admin, fun_name, picture in USERS:
-        user = User(username=username, is_admin=is_admin, fun_name=fun_name, picture=picture)
-        user.set_password(password)
+    password_hashes = hash_passwords([password for _, password, _, _, _ in USERS])
+    for (username, password, is_admin, fun_name, picture), password_hash in zip(USERS, password_hashes):
         user_rows.append(
             {
                 'username': username,
-                'password_hash': user.password_hash,
+                'password_hash': password_hash,
                 'points': 0,
                 'is_admin': is_admin,
                 'fun_name': fun_name,
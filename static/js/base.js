@@ -0,0 +1,6 @@
+function showLoading() {
+    const indicator = document.getElementById('loading-indicator');
+    if (indicator) {
+        indicator.classList.remove('d-none');
+    }
+}
@@ -0,0 +1,13 @@
+(function() {
+    // Region filter tabs; the bracket itself is rendered on the server.
+    document.querySelectorAll('.bracket-region-tabs .btn').forEach(btn => {
+        btn.addEventListener('click', function() {
+            document.querySelectorAll('.bracket-region-tabs .btn').forEach(b => b.classList.remove('active'));
+            this.classList.add('active');
+            const region = this.getAttribute('data-region');
+            document.querySelectorAll('.bracket-region').forEach(r => {
+                r.style.display = region === 'all' || r.getAttribute('data-section') === region ? '' : 'none';
+            });
+        });
+    });
+})();
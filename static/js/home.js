@@ -0,0 +1,443 @@
+const court = document.getElementById('ballCourt');
+const ball = document.getElementById('basketball');
+const rimHitbox = document.getElementById('rimHitbox');
+const backboard = document.getElementById('courtBackboard');
+const rim = document.getElementById('courtRim');
+const modeSegmented = document.getElementById('courtModeSegmented');
+const modeButtons = modeSegmented ? Array.from(modeSegmented.querySelectorAll('[data-mode]')) : [];
+const proReleaseLine = document.getElementById('proReleaseLine');
+const noobMemeOverlay = document.getElementById('noobMemeOverlay');
+const courtLabel = court ? court.querySelector('.court-label') : null;
+const scoreDigits = Array.from(document.querySelectorAll('[data-score-digit]'));
+
+if (court && ball) {
+    const DIGIT_SEGMENTS = {
+        "0": ["a", "b", "c", "d", "e", "f"],
+        "1": ["b", "c"],
+        "2": ["a", "b", "d", "e", "g"],
+        "3": ["a", "b", "c", "d", "g"],
+        "4": ["b", "c", "f", "g"],
+        "5": ["a", "c", "d", "f", "g"],
+        "6": ["a", "c", "d", "e", "f", "g"],
+        "7": ["a", "b", "c"],
+        "8": ["a", "b", "c", "d", "e", "f", "g"],
+        "9": ["a", "b", "c", "d", "f", "g"]
+    };
+    const radius = 32;
+    const gravity = 0.58;
+    const floorBounce = 0.72;
+    const wallBounce = 0.82;
+    const groundFriction = 0.985;
+    const airDrag = 0.998;
+    const spinDrag = 0.985;
+    const maxSpeed = 25;
+    const radToDeg = 180 / Math.PI;
+
+    let bounds = court.getBoundingClientRect();
+    let x = Math.min(bounds.width * 0.26, bounds.width - radius);
+    let y = radius + 8;
+    let vx = 2.6;
+    let vy = 0;
+    let angle = 0;
+    let angularVelocity = 2.2;
+    let score = 0;
+    let scoreCooldown = 0;
+    let rimBounds = null;
+    let backboardBounds = null;
+    let rimCaps = [];
+    let noviceLineY = bounds.height * 0.38;
+    let proLineY = bounds.height * 0.55;
+    let mode = null;
+    let initialLoad = true;
+    let memeTimeout = null;
+
+    let dragging = false;
+    let activePointerId = null;
+    let dragTrail = [];
+
+    function clamp(value, min, max) {
+        return Math.max(min, Math.min(max, value));
+    }
+
+    function setBallPosition() {
+        ball.style.transform = `translate(${x - radius}px, ${y - radius}px) rotate(${angle}deg)`;
+    }
+
+    function minDragY() {
+        if (mode === 'noob') {
+            return radius;
+        }
+        const releaseLineY = mode === 'pro' ? proLineY : noviceLineY;
+        return clamp(releaseLineY, radius, bounds.height - radius);
+    }
+
+    function getCurrentLineY() {
+        if (mode === 'noob') {
+            return null;
+        }
+        return mode === 'pro' ? proLineY : noviceLineY;
+    }
+
+    function applyModeClasses() {
+        modeButtons.forEach(function(button) {
+            const isActive = button.dataset.mode === mode;
+            button.classList.toggle('is-active', isActive);
+            button.setAttribute('aria-pressed', String(isActive));
+            button.setAttribute('tabindex', isActive ? '0' : '-1');
+        });
+
+        court.classList.toggle('noob-mode', mode === 'noob');
+        court.classList.toggle('novice-mode', mode === 'novice');
+        court.classList.toggle('pro-mode', mode === 'pro');
+
+        const lineY = getCurrentLineY();
+        if (proReleaseLine && lineY !== null) {
+            proReleaseLine.style.top = `${lineY}px`;
+        }
+
+        if (courtLabel) {
+            if (mode === 'noob') {
+                courtLabel.textContent = 'Warmup Mode: Noob';
+            } else if (mode === 'novice') {
+                courtLabel.textContent = 'Warmup Mode: Novice';
+            } else {
+                courtLabel.textContent = 'Warmup Mode: Pro';
+            }
+        }
+    }
+
+    function playNoobMeme() {
+        if (!noobMemeOverlay) {
+            return;
+        }
+        if (memeTimeout) {
+            clearTimeout(memeTimeout);
+            memeTimeout = null;
+        }
+        noobMemeOverlay.hidden = false;
+        noobMemeOverlay.classList.remove('animate');
+        void noobMemeOverlay.offsetWidth;
+        noobMemeOverlay.classList.add('animate');
+        memeTimeout = window.setTimeout(function() {
+            noobMemeOverlay.hidden = true;
+            noobMemeOverlay.classList.remove('animate');
+            memeTimeout = null;
+        }, 1950);
+    }
+
+    function stopNoobMeme() {
+        if (!noobMemeOverlay) {
+            return;
+        }
+        if (memeTimeout) {
+            clearTimeout(memeTimeout);
+            memeTimeout = null;
+        }
+        noobMemeOverlay.hidden = true;
+        noobMemeOverlay.classList.remove('animate');
+    }
+
+    function setMode(nextMode) {
+        if (!['noob', 'novice', 'pro'].includes(nextMode)) {
+            return;
+        }
+        if (nextMode === mode) {
+            return;
+        }
+        mode = nextMode;
+        score = 0;
+        scoreCooldown = 0;
+        applyModeClasses();
+        if (mode === 'noob' && !initialLoad) {
+            playNoobMeme();
+        } else {
+            stopNoobMeme();
+        }
+        y = clamp(y, minDragY(), bounds.height - radius);
+        renderScore();
+        setBallPosition();
+    }
+
+    function updateCourtFeatures() {
+        const courtRect = court.getBoundingClientRect();
+        if (rimHitbox) {
+            const rect = rimHitbox.getBoundingClientRect();
+            rimBounds = {
+                left: rect.left - courtRect.left,
+                right: rect.right - courtRect.left,
+                top: rect.top - courtRect.top,
+                bottom: rect.bottom - courtRect.top
+            };
+        }
+        if (backboard) {
+            const rect = backboard.getBoundingClientRect();
+            backboardBounds = {
+                left: rect.left - courtRect.left,
+                right: rect.right - courtRect.left,
+                top: rect.top - courtRect.top,
+                bottom: rect.bottom - courtRect.top
+            };
+        }
+        if (rim) {
+            const rect = rim.getBoundingClientRect();
+            const centerY = rect.top - courtRect.top + rect.height / 2;
+            noviceLineY = Math.max(radius + 10, (rect.top - courtRect.top) - 6);
+            if (rimBounds) {
+                proLineY = Math.max(noviceLineY + 22, rimBounds.top + ((rimBounds.bottom - rimBounds.top) * 0.7));
+            } else {
+                proLineY = noviceLineY + 42;
+            }
+            if (proReleaseLine && mode !== 'noob') {
+                proReleaseLine.style.top = `${getCurrentLineY()}px`;
+            }
+            rimCaps = [
+                { x: rect.left - courtRect.left + 11, y: centerY, r: 8 },
+                { x: rect.right - courtRect.left - 11, y: centerY, r: 8 }
+            ];
+        } else if (proReleaseLine) {
+            noviceLineY = bounds.height * 0.38;
+            proLineY = bounds.height * 0.55;
+            if (mode !== 'noob') {
+                proReleaseLine.style.top = `${getCurrentLineY()}px`;
+            }
+        }
+    }
+
+    function refreshBounds() {
+        bounds = court.getBoundingClientRect();
+        x = clamp(x, radius, bounds.width - radius);
+        updateCourtFeatures();
+        y = clamp(y, minDragY(), bounds.height - radius);
+        setBallPosition();
+    }
+
+    function pointerToCourt(evt) {
+        const rect = court.getBoundingClientRect();
+        return {
+            x: evt.clientX - rect.left,
+            y: evt.clientY - rect.top
+        };
+    }
+
+    function addTrailSample(timestamp) {
+        dragTrail.push({ x, y, t: timestamp });
+        if (dragTrail.length > 10) {
+            dragTrail.shift();
+        }
+    }
+
+    function releaseBall(evt) {
+        if (!dragging || evt.pointerId !== activePointerId) {
+            return;
+        }
+
+        dragging = false;
+        ball.classList.remove('dragging');
+
+        const first = dragTrail[0];
+        const last = dragTrail[dragTrail.length - 1];
+        if (first && last && last.t > first.t) {
+            const dt = last.t - first.t;
+            vx = clamp(((last.x - first.x) / dt) * 14, -maxSpeed, maxSpeed);
+            vy = clamp(((last.y - first.y) / dt) * 14, -maxSpeed, maxSpeed);
+            angularVelocity = (vx / radius) * radToDeg * 0.8;
+        }
+
+        if (ball.hasPointerCapture(activePointerId)) {
+            ball.releasePointerCapture(activePointerId);
+        }
+        activePointerId = null;
+        dragTrail = [];
+    }
+
+    function collideWithRimCap(cap) {
+        const dx = x - cap.x;
+        const dy = y - cap.y;
+        const minDistance = radius + cap.r;
+        const distance = Math.hypot(dx, dy);
+        if (!distance || distance >= minDistance) {
+            return;
+        }
+
+        const nx = dx / distance;
+        const ny = dy / distance;
+        x = cap.x + nx * minDistance;
+        y = cap.y + ny * minDistance;
+
+        const velocityAlongNormal = vx * nx + vy * ny;
+        if (velocityAlongNormal < 0) {
+            const restitution = 0.64;
+            vx -= (1 + restitution) * velocityAlongNormal * nx;
+            vy -= (1 + restitution) * velocityAlongNormal * ny;
+            angularVelocity += (vx / radius) * radToDeg * 0.16;
+        }
+    }
+
+    function addBasket() {
+        score += 2;
+        renderScore();
+        court.classList.add('score-pop');
+        window.setTimeout(function() {
+            court.classList.remove('score-pop');
+        }, 170);
+    }
+
+    function renderDigit(digitEl, value) {
+        const active = DIGIT_SEGMENTS[value] || DIGIT_SEGMENTS["0"];
+        digitEl.querySelectorAll('.seg').forEach(function(segEl) {
+            const segmentName = Array.from(segEl.classList).find(function(cls) {
+                return cls.length === 1 && cls >= 'a' && cls <= 'g';
+            });
+            if (segmentName && active.includes(segmentName)) {
+                segEl.classList.add('on');
+            } else {
+                segEl.classList.remove('on');
+            }
+        });
+    }
+
+    function renderScore() {
+        if (!scoreDigits.length) {
+            return;
+        }
+        const formatted = String(score).padStart(scoreDigits.length, '0').slice(-scoreDigits.length);
+        scoreDigits.forEach(function(digitEl, index) {
+            renderDigit(digitEl, formatted[index]);
+        });
+    }
+
+    ball.addEventListener('pointerdown', function(evt) {
+        dragging = true;
+        activePointerId = evt.pointerId;
+        dragTrail = [];
+        ball.setPointerCapture(activePointerId);
+        ball.classList.add('dragging');
+
+        const point = pointerToCourt(evt);
+        x = clamp(point.x, radius, bounds.width - radius);
+        y = clamp(point.y, minDragY(), bounds.height - radius);
+        vx = 0;
+        vy = 0;
+        addTrailSample(performance.now());
+        setBallPosition();
+    });
+
+    ball.addEventListener('pointermove', function(evt) {
+        if (!dragging || evt.pointerId !== activePointerId) {
+            return;
+        }
+
+        const prevX = x;
+        const point = pointerToCourt(evt);
+        x = clamp(point.x, radius, bounds.width - radius);
+        y = clamp(point.y, minDragY(), bounds.height - radius);
+
+        const dx = x - prevX;
+        angle += (dx / radius) * radToDeg;
+        addTrailSample(performance.now());
+        setBallPosition();
+    });
+
+    ball.addEventListener('pointerup', releaseBall);
+    ball.addEventListener('pointercancel', releaseBall);
+    modeButtons.forEach(function(button) {
+        button.addEventListener('click', function() {
+            const nextMode = button.dataset.mode || 'pro';
+            setMode(nextMode);
+        });
+    });
+
+    function animate() {
+        if (!dragging) {
+            const floor = bounds.height - radius;
+            const right = bounds.width - radius;
+            const prevY = y;
+
+            vy += gravity;
+            x += vx;
+            y += vy;
+
+            if (x >= right) {
+                x = right;
+                vx = -Math.abs(vx) * wallBounce;
+                angularVelocity *= 0.82;
+            } else if (x <= radius) {
+                x = radius;
+                vx = Math.abs(vx) * wallBounce;
+                angularVelocity *= 0.82;
+            }
+
+            if (backboardBounds) {
+                const intersectsBoard =
+                    x + radius > backboardBounds.left &&
+                    x - radius < backboardBounds.right &&
+                    y + radius > backboardBounds.top &&
+                    y - radius < backboardBounds.bottom;
+                if (intersectsBoard && vx > 0) {
+                    x = backboardBounds.left - radius;
+                    vx = -Math.abs(vx) * 0.72;
+                    angularVelocity *= 0.86;
+                }
+            }
+
+            if (rimCaps.length) {
+                rimCaps.forEach(collideWithRimCap);
+            }
+
+            if (y >= floor) {
+                y = floor;
+                if (Math.abs(vy) > 0.55) {
+                    vy = -Math.abs(vy) * floorBounce;
+                } else {
+                    vy = 0;
+                }
+
+                vx *= groundFriction;
+                if (Math.abs(vx) < 0.03) {
+                    vx = 0;
+                }
+
+                const targetSpin = (vx / radius) * radToDeg;
+                angularVelocity += (targetSpin - angularVelocity) * 0.2;
+            } else {
+                vx *= airDrag;
+                vy *= 0.999;
+                angularVelocity *= 0.996;
+            }
+
+            if (y <= radius) {
+                y = radius;
+                vy = Math.abs(vy) * 0.52;
+            }
+
+            if (scoreCooldown > 0) {
+                scoreCooldown -= 1;
+            } else if (rimBounds) {
+                const passedDownThroughHoop =
+                    prevY < rimBounds.top &&
+                    y >= rimBounds.top &&
+                    x > rimBounds.left &&
+                    x < rimBounds.right &&
+                    vy > 0.6;
+                if (passedDownThroughHoop) {
+                    addBasket();
+                    scoreCooldown = 22;
+                }
+            }
+
+            angularVelocity *= spinDrag;
+            angle += angularVelocity;
+            setBallPosition();
+        }
+
+        requestAnimationFrame(animate);
+    }
+
+    window.addEventListener('resize', refreshBounds);
+    updateCourtFeatures();
+    setMode('noob');
+    initialLoad = false;
+    renderScore();
+    setBallPosition();
+    requestAnimationFrame(animate);
+}
@@ -0,0 +1,40 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const standingsCanvas = document.getElementById('standingsChart');
+    if (standingsCanvas && window.Chart) {
+        const history = JSON.parse(document.getElementById('standingsHistoryData').textContent);
+        new Chart(standingsCanvas, {
+            type: 'line',
+            data: {
+                labels: history.rounds.map(function(round) { return round.name; }),
+                datasets: history.users.map(function(user) {
+                    return { label: user.name, data: user.points, tension: 0.25, spanGaps: true };
+                })
+            },
+            options: {
+                maintainAspectRatio: false,
+                plugins: { legend: { position: 'bottom', labels: { boxWidth: 10 } } },
+                scales: { y: { beginAtZero: true, title: { display: true, text: 'Points' } } }
+            }
+        });
+    }
+
+    document.querySelectorAll('.leader-round-buttons button[data-user-id]').forEach(function(button) {
+        button.addEventListener('click', function() {
+            const userId = button.getAttribute('data-user-id');
+            const roundId = button.getAttribute('data-round-id');
+
+            document.querySelectorAll('.leader-round-buttons button[data-user-id="' + userId + '"]').forEach(function(btn) {
+                btn.classList.remove('active');
+            });
+            button.classList.add('active');
+
+            document.querySelectorAll('.leader-round-panel[data-user-id="' + userId + '"]').forEach(function(panel) {
+                panel.classList.add('d-none');
+            });
+            const target = document.getElementById('leaderRound' + userId + '_' + roundId);
+            if (target) {
+                target.classList.remove('d-none');
+            }
+        });
+    });
+});
@@ -0,0 +1,44 @@
+// Toggle Rounds
+function toggleRound(roundId) {
+    const allRounds = document.querySelectorAll('[id^="round"]');
+    allRounds.forEach(round => {
+        round.classList.remove('show');
+    });
+    document.querySelector(`#round${roundId}.detailed-round`).classList.add('show');
+    document.querySelector(`#round${roundId}.summary-round`).classList.add('show');
+
+    // Update active round button
+    document.querySelectorAll('.btn-group[role="group"] button[data-round-id]').forEach(btn => {
+        btn.classList.remove('active');
+        if (btn.getAttribute('data-round-id') === roundId) {
+            btn.classList.add('active');
+        }
+    });
+}
+
+// Toggle Views
+document.querySelectorAll('.view-tab').forEach(tab => {
+    tab.addEventListener('click', function() {
+        document.querySelectorAll('.view-tab').forEach(t => t.classList.remove('active'));
+        this.classList.add('active');
+
+        const view = this.getAttribute('data-view');
+        document.querySelectorAll('.view-content').forEach(content => {
+            content.classList.add('hidden');
+        });
+        document.getElementById(`${view}-view`).classList.remove('hidden');
+
+        // Ensure the currently visible round stays in sync
+        const visibleRound = document.querySelector('.detailed-round.show, .summary-round.show');
+        if (visibleRound) {
+            const roundId = visibleRound.id.replace('round', '');
+            toggleRound(roundId);
+        }
+    });
+});
+
+// Show most recent round by default
+if (document.querySelector('[id^="round"]')) {
+    const mostRecentRoundId = document.querySelector('[id^="round"]').id.replace('round', '');
+    toggleRound(mostRecentRoundId);
+}
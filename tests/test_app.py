@@ -1,31 +1,116 @@
+import base64
+import hashlib
+import io
+import json
+import logging
 import os
+import re
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch
 
+from flask import g
+from sqlalchemy import event, text
+from sqlalchemy.pool import QueuePool
+
 
 TEST_DB_PATH = Path(tempfile.gettempdir()) / "march_madness_2026_test_suite.db"
 os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_PATH}"
 os.environ["TOURNAMENT_YEAR"] = "2026"
+os.environ["BCRYPT_LOG_ROUNDS"] = "4"
+os.environ["HENRYGD_MAX_ATTEMPTS"] = "1"
+os.environ["HENRYGD_RECORD_DIR"] = str(Path(tempfile.gettempdir()) / "march_madness_test_payloads")
+os.environ["LIVE_SCORES_ENABLED"] = "0"
+os.environ["SEASON_ARCHIVE_DIR"] = str(Path(tempfile.gettempdir()) / "march_madness_test_seasons")
+os.environ["TEMPLATE_CACHE_DIR"] = str(Path(tempfile.gettempdir()) / "march_madness_test_templates")
 
 from app import (  # noqa: E402
+    AppSetting,
     Game,
+    HenryGDClient,
+    JsonLogFormatter,
+    MetricsRegistry,
+    PasswordHasherBusy,
+    TOURNAMENT_VERSION_KEY,
+    TemplateBytecodeCache,
     Pick,
     Round,
     User,
     app,
+    archive_season,
+    asset_url,
+    bcrypt_cost,
     build_henrygd_games_by_round,
+    bump_cache_version,
     calculate_points,
+    configure_read_replica,
     create_next_round,
     db,
+    fingerprint_static_assets,
+    get_bracket_model,
+    get_leader_and_trailer_groups,
+    get_live_scores,
+    get_pick_distribution,
+    get_rank_movement,
+    get_ranked_standings,
     get_users_with_points,
+    invalidate_pick_distribution,
+    invalidate_tournament_structure,
+    iter_recorded_henrygd_payloads,
+    load_standings_history,
+    load_user,
+    metrics,
+    migrate_pick_unique_index,
     parse_non_negative_int,
+    pick_upsert_available,
+    precompile_templates,
+    read_replica_available,
+    record_henrygd_payload,
+    replay_henrygd_sync,
+    restart_log_queue,
+    run_password_task,
+    snapshot_standings,
+    start_log_queue,
+    subset_font_awesome_css,
+    subset_google_fonts_css,
+    vendor_static_assets,
     sync_round_matchups,
     sync_tournament_from_henrygd,
+    _live_scores,
 )
 
 
+def build_tournament_payload(decided_rounds):
+    """Return a 64-team HenryGD payload where the first ``decided_rounds`` rounds have winners.
+
+    Team ``Tn`` beats every higher-numbered team, so each round's winners are predictable.
+    """
+    games = []
+    teams = [f"T{number}" for number in range(1, 65)]
+    for round_index in range(6):
+        winners = []
+        for game_index in range(len(teams) // 2):
+            pair = teams[game_index * 2:game_index * 2 + 2]
+            known = [team for team in pair if team]
+            winner = min(known, key=lambda team: int(team[1:])) if round_index < decided_rounds and len(known) == 2 else None
+            winners.append(winner)
+            games.append(
+                {
+                    "bracketPositionId": (round_index + 1) * 100 + game_index,
+                    "victorBracketPositionId": (round_index + 2) * 100 + game_index // 2 if round_index < 5 else None,
+                    "teams": [{"nameShort": team, "isWinner": team == winner} for team in known],
+                }
+            )
+        teams = winners
+    return {"championships": [{"games": games}]}
+
+
 class BaseTestCase(unittest.TestCase):
     def setUp(self):
         app.config.update(TESTING=True)
@@ -34,6 +119,8 @@ class BaseTestCase(unittest.TestCase):
         db.session.remove()
         db.drop_all()
         db.create_all()
+        invalidate_pick_distribution()
+        invalidate_tournament_structure()
         self.client = app.test_client()
 
     def tearDown(self):
@@ -181,6 +268,41 @@ class HelperTests(BaseTestCase):
         self.assertEqual(users[0].points, 8)
         self.assertEqual(users[1].points, 0)
 
+    def test_ranked_standings_match_python_fallback(self):
+        round_obj = self.create_round("Elite Eight", point_value=8, closed=True, closed_for_selection=True)
+        open_round = self.create_round("Final Four", point_value=16, closed=False, closed_for_selection=False)
+        game = self.create_game(round_obj, "A", "B", winner="A")
+        open_game = self.create_game(open_round, "A", "C")
+        alpha = self.create_user("alpha")
+        bravo = self.create_user("bravo")
+        charlie = self.create_user("charlie")
+        self.create_user("delta")
+        self.create_pick(alpha, game, "A")
+        self.create_pick(bravo, game, "A")
+        self.create_pick(charlie, game, "B")
+        self.create_pick(charlie, open_game, "A")
+        calculate_points(round_obj)
+
+        standings = get_ranked_standings()
+
+        self.assertEqual(
+            [(row.username, row.points, row.rank, row.dense_rank) for row in standings],
+            [("alpha", 8, 1, 1), ("bravo", 8, 1, 1), ("charlie", 0, 3, 2), ("delta", 0, 3, 2)],
+        )
+        with patch("app.supports_window_functions", return_value=False):
+            self.assertEqual(get_ranked_standings(), standings)
+
+        winners, losers = get_leader_and_trailer_groups()
+        self.assertEqual([row.username for row in winners], ["alpha", "bravo"])
+        self.assertEqual([row.username for row in losers], ["charlie", "delta"])
+        with patch("app.supports_window_functions", return_value=False):
+            self.assertEqual(get_leader_and_trailer_groups(), (winners, losers))
+
+    def test_leader_and_trailer_groups_empty_when_everyone_tied(self):
+        self.create_user("alpha")
+        self.create_user("bravo")
+        self.assertEqual(get_leader_and_trailer_groups(), ([], []))
+
     def test_build_henrygd_games_by_round_maps_round_depths_and_skips_first_four(self):
         payload = {
             "championships": [
@@ -232,6 +354,54 @@ class HelperTests(BaseTestCase):
             [("Early", 100), ("Late", 300)],
         )
 
+    def test_sqlite_engine_uses_wal_profile_and_connection_pool(self):
+        self.assertIsInstance(db.engine.pool, QueuePool)
+        self.assertEqual(db.session.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+        self.assertEqual(db.session.execute(text("PRAGMA synchronous")).scalar(), 1)
+        self.assertEqual(db.session.execute(text("PRAGMA busy_timeout")).scalar(), app.config["SQLITE_BUSY_TIMEOUT_MS"])
+        self.assertEqual(db.session.execute(text("PRAGMA cache_size")).scalar(), -app.config["SQLITE_CACHE_SIZE_KB"])
+
+    def test_get_bracket_model_parses_each_distinct_payload_once(self):
+        payload = build_tournament_payload(2)
+        model = get_bracket_model(payload)
+
+        self.assertIs(get_bracket_model(json.loads(json.dumps(payload))), model)
+        self.assertIsNot(get_bracket_model(build_tournament_payload(3)), model)
+        # A payload changed in place is a different bracket, not the cached one.
+        payload["championships"][0]["games"][0]["teams"][0]["nameShort"] = "Renamed"
+        self.assertIsNot(get_bracket_model(payload), model)
+        # Fetched payloads are keyed by their response-body digest without re-serializing.
+        with patch("app.henrygd_payload_digest") as canonical_digest:
+            fetched = get_bracket_model(build_tournament_payload(2), "body-digest-2")
+            self.assertIs(get_bracket_model({}, "body-digest-2"), fetched)
+        canonical_digest.assert_not_called()
+        self.assertEqual(len(model.games_by_round["First Round (Round of 64)"]), 32)
+        self.assertEqual(model.games_by_position["100"].depth, 5)
+        self.assertEqual([game.round_name for game in model.games_by_team["t1"]], [
+            "First Round (Round of 64)",
+            "Second Round (Round of 32)",
+            "Sweet 16",
+        ])
+
+    def test_bracket_model_walks_long_victor_chains_without_recursion(self):
+        games = [
+            {
+                "bracketPositionId": position,
+                "victorBracketPositionId": position + 1 if position < 2999 else None,
+                "teams": [{"nameShort": f"A{position}"}, {"nameShort": f"B{position}"}],
+            }
+            for position in range(3000)
+        ]
+        games.append({"bracketPositionId": 5000, "victorBracketPositionId": 5001, "teams": []})
+        games.append({"bracketPositionId": 5001, "victorBracketPositionId": 5000, "teams": []})
+
+        model = get_bracket_model({"championships": [{"games": games}]})
+
+        self.assertEqual(model.games_by_position["0"].depth, 2999)
+        self.assertEqual(model.games_by_position["2999"].depth, 0)
+        self.assertEqual(model.games_by_round["Championship"][0].teams, ["A2999", "B2999"])
+        self.assertEqual({model.games_by_position["5000"].depth, model.games_by_position["5001"].depth}, {1, 2})
+
     def test_sync_round_matchups_updates_existing_round_games(self):
         first_round = self.create_round("First Round (Round of 64)", closed=True, closed_for_selection=True)
         self.create_game(first_round, "A", "B", winner="A")
@@ -323,6 +493,135 @@ class HelperTests(BaseTestCase):
         self.assertEqual(scored_pick.points, 2)
         self.assertEqual(missed_pick.points, 0)
 
+    def test_recorded_payloads_replay_a_whole_tournament(self):
+        self.create_first_round_of_64(self.create_user("nate"))
+
+        with tempfile.TemporaryDirectory() as record_dir:
+            for decided_rounds in range(7):
+                self.assertIsNotNone(record_henrygd_payload(build_tournament_payload(decided_rounds), record_dir))
+            self.assertIsNone(record_henrygd_payload(build_tournament_payload(6), record_dir))
+            self.assertEqual(len(list(iter_recorded_henrygd_payloads(record_dir))), 7)
+
+            results = replay_henrygd_sync(record_dir)
+
+        self.assertEqual(len(results), 7)
+        self.assertEqual(results[1][2]["rounds_closed"], ["First Round (Round of 64)"])
+        self.assertEqual(results[-2][2]["rounds_created"], ["Championship"])
+        self.assertEqual(results[-1][2]["winners_updated"], 1)
+        self.assertTrue(all(round_obj.closed for round_obj in Round.query.all()))
+        championship = Round.query.filter_by(name="Championship").one()
+        self.assertEqual(championship.games[0].winner, "T1")
+        self.assertEqual(get_users_with_points()[0].points, 64)
+
+    def create_first_round_of_64(self, user=None):
+        first_round = self.create_round("First Round (Round of 64)", point_value=2)
+        for game_index in range(32):
+            game = self.create_game(first_round, f"T{game_index * 2 + 1}", f"T{game_index * 2 + 2}")
+            if user:
+                self.create_pick(user, game, game.team1)
+        return first_round
+
+    def test_sync_applies_multi_round_diff_in_one_commit(self):
+        user = self.create_user("nate")
+        self.create_first_round_of_64(user)
+        commits = []
+        listener = lambda session: commits.append(session)  # noqa: E731
+        event.listen(db.session, "after_commit", listener)
+        try:
+            summary = sync_tournament_from_henrygd(payload=build_tournament_payload(3))
+        finally:
+            event.remove(db.session, "after_commit", listener)
+
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(summary["winners_updated"], 32 + 16 + 8)
+        self.assertEqual(summary["rounds_closed"], ["First Round (Round of 64)"])
+        self.assertEqual(summary["rounds_created"], ["Second Round (Round of 32)", "Sweet 16", "Elite Eight"])
+        self.assertEqual(len(summary["point_changes"]), 32)
+        self.assertTrue(summary["team_info_changed"])
+        elite_eight = Round.query.filter_by(name="Elite Eight").one()
+        self.assertEqual([(game.team1, game.team2) for game in elite_eight.games][:2], [("T1", "T9"), ("T17", "T25")])
+        self.assertIsNone(elite_eight.games[0].winner)
+        self.assertEqual(sorted(load_standings_history()), [r.id for r in Round.query.order_by(Round.id)])
+
+    def test_sync_with_unchanged_payload_writes_nothing(self):
+        self.create_first_round_of_64(self.create_user("nate"))
+        sync_tournament_from_henrygd(payload=build_tournament_payload(2))
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            summary = sync_tournament_from_henrygd(payload=build_tournament_payload(2))
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(summary["winners_updated"], 0)
+        self.assertEqual(summary["rounds_created"], [])
+        self.assertEqual(summary["point_changes"], [])
+        self.assertFalse(summary["team_info_changed"])
+        self.assertFalse([statement for statement in statements if not statement.lstrip().upper().startswith("SELECT")])
+
+    def test_sync_failure_rolls_back_the_whole_diff(self):
+        first_round = self.create_first_round_of_64(self.create_user("nate"))
+        with patch("app.snapshot_standings", side_effect=RuntimeError("boom")):
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                sync_tournament_from_henrygd(payload=build_tournament_payload(1))
+
+        db.session.expire_all()
+        self.assertFalse(db.session.get(Round, first_round.id).closed)
+        self.assertEqual(Game.query.filter(Game.winner.isnot(None)).count(), 0)
+        self.assertEqual(Round.query.count(), 1)
+        self.assertEqual(Pick.query.filter(Pick.points != 0).count(), 0)
+
+    def test_recorded_payload_with_mismatched_hash_is_rejected(self):
+        with tempfile.TemporaryDirectory() as record_dir:
+            path = record_henrygd_payload(build_tournament_payload(1), record_dir)
+            os.replace(path, path.replace(path.rsplit("-", 1)[-1], "0" * 64 + ".json.z"))
+            with self.assertRaisesRegex(RuntimeError, "does not match its content hash"):
+                list(iter_recorded_henrygd_payloads(record_dir))
+
+    def test_snapshot_standings_records_cumulative_ranks_per_round(self):
+        leader = self.create_user("leader")
+        trailer = self.create_user("trailer")
+        sweet16 = self.create_round("Sweet 16", point_value=4, closed=True, closed_for_selection=True)
+        game1 = self.create_game(sweet16, "A", "B", winner="A")
+        self.create_pick(trailer, game1, "A")
+        calculate_points(sweet16)
+        snapshot_standings()
+        elite8 = self.create_round("Elite Eight", point_value=8, closed=True, closed_for_selection=True)
+        game2 = self.create_game(elite8, "A", "C", winner="C")
+        self.create_pick(leader, game2, "C")
+        calculate_points(elite8)
+        snapshot_standings(from_round_id=elite8.id)
+        db.session.commit()
+
+        history = load_standings_history()
+
+        self.assertEqual(list(history), [sweet16.id, elite8.id])
+        self.assertEqual(history[sweet16.id], [[trailer.id, 1, 4], [leader.id, 2, 0]])
+        self.assertEqual(history[elite8.id], [[leader.id, 1, 8], [trailer.id, 2, 4]])
+        self.assertEqual(get_rank_movement(history), {leader.id: 1, trailer.id: -1})
+        self.assertEqual(get_rank_movement(history, sweet16.id), {})
+
+    def test_sync_tournament_snapshots_standings_when_round_closes(self):
+        user = self.create_user("nate")
+        round_obj = self.create_round("Final Four", point_value=16, closed=False, closed_for_selection=False)
+        game = self.create_game(round_obj, "A", "B")
+        self.create_pick(user, game, "A")
+        payload = {
+            "championships": [
+                {
+                    "games": [
+                        {"bracketPositionId": 501, "victorBracketPositionId": 601, "teams": [{"nameShort": "A", "isWinner": True}, {"nameShort": "B", "isWinner": False}]},
+                        {"bracketPositionId": 601, "victorBracketPositionId": None, "teams": [{"nameShort": "A", "isWinner": False}, {"nameShort": "C", "isWinner": False}]},
+                    ]
+                }
+            ]
+        }
+
+        sync_tournament_from_henrygd(payload=payload)
+
+        self.assertEqual(load_standings_history(), {round_obj.id: [[user.id, 1, 16]]})
+
 
 class AuthAndHomeRouteTests(BaseTestCase):
     def test_login_page_loads(self):
@@ -342,6 +641,37 @@ class AuthAndHomeRouteTests(BaseTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertIn("/dashboard", response.headers["Location"])
 
+    def test_login_rehashes_password_when_cost_changes(self):
+        user = self.create_user("nate")
+        self.assertEqual(bcrypt_cost(user.password_hash), 4)
+        original_rounds = app.config["BCRYPT_LOG_ROUNDS"]
+        app.config["BCRYPT_LOG_ROUNDS"] = 5
+        try:
+            response = self.login("nate")
+        finally:
+            app.config["BCRYPT_LOG_ROUNDS"] = original_rounds
+
+        self.assertEqual(response.status_code, 302)
+        refreshed = db.session.get(User, user.id)
+        self.assertEqual(bcrypt_cost(refreshed.password_hash), 5)
+        self.assertTrue(refreshed.check_password("password123"))
+
+    def test_login_returns_503_when_password_pool_is_saturated(self):
+        self.create_user("nate")
+        with patch("app.run_password_task", side_effect=PasswordHasherBusy("Too many logins in progress.")):
+            response = self.login("nate")
+        self.assertEqual(response.status_code, 503)
+        self.assertIn(b"Too many logins in progress.", response.data)
+
+    def test_saturated_password_pool_fails_fast(self):
+        run_password_task(lambda: None)
+        busy_slots = threading.BoundedSemaphore(1)
+        busy_slots.acquire()
+        started = time.perf_counter()
+        with patch("app._password_hash_slots", busy_slots), self.assertRaises(PasswordHasherBusy):
+            run_password_task(lambda: None)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
     def test_logout_redirects_to_home(self):
         self.create_user("nate")
         self.login("nate")
@@ -349,6 +679,54 @@ class AuthAndHomeRouteTests(BaseTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertIn("/", response.headers["Location"])
 
+    def test_load_user_serves_cached_snapshot_without_querying(self):
+        user = self.create_user("nate", is_admin=True)
+        self.assertEqual(load_user(str(user.id)).username, "nate")
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            with app.test_request_context():
+                cached = load_user(str(user.id))
+                load_user(str(user.id))
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        self.assertEqual(statements, [])
+        self.assertEqual((cached.id, cached.username, cached.is_admin), (user.id, "nate", True))
+        self.assertTrue(cached.is_authenticated)
+        self.assertIsNone(load_user("not-a-number"))
+
+    def test_cached_user_invalidated_when_profile_changes(self):
+        user = self.create_user("nate")
+        self.assertFalse(load_user(str(user.id)).is_admin)
+
+        user.is_admin = True
+        user.fun_name = "Net Rippin Nate"
+        db.session.commit()
+
+        cached = load_user(str(user.id))
+        self.assertTrue(cached.is_admin)
+        self.assertEqual(cached.fun_name, "Net Rippin Nate")
+
+    def test_admin_revoked_on_another_instance_takes_effect_on_the_next_request(self):
+        user = self.create_user("nate", is_admin=True)
+        self.login("nate")
+        self.assertEqual(self.client.get("/admin").status_code, 200)
+
+        # Another instance's write leaves this process's cached snapshot in place.
+        load_user(str(user.id))
+        db.session.execute(text("UPDATE user SET is_admin = 0 WHERE id = :id"), {"id": user.id})
+        db.session.commit()
+        self.assertTrue(load_user(str(user.id)).is_admin)
+
+        response = self.client.get("/admin")
+        self.assertEqual(response.status_code, 302)
+
     def test_home_with_no_rounds_shows_empty_state(self):
         response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
@@ -387,6 +765,204 @@ class PickRouteTests(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"No open rounds available for picks", response.data)
 
+    def test_pick_page_reads_rounds_and_team_info_only_when_the_version_moves(self):
+        user = self.create_user("nate")
+        closed_round = self.create_round("First Round (Round of 64)", closed=True, closed_for_selection=True)
+        game = self.create_game(closed_round, "Duke", "Siena", winner="Duke")
+        self.create_pick(user, game, "Duke")
+        calculate_points(closed_round)
+        open_round = self.create_round("Second Round (Round of 32)")
+        open_game = self.create_game(open_round, "Duke", "Baylor")
+        db.session.add(AppSetting(key="team_info", value=json.dumps({"duke": {"name": "Duke", "seed": 1}})))
+        db.session.commit()
+        self.login("nate")
+        self.client.get("/pick")
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            response = self.client.get("/pick")
+            pick_statements = list(statements)
+            self.client.get("/logout")
+            self.client.get("/seasons")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        page = " ".join(response.get_data(as_text=True).split())
+        self.assertIn("nate</strong> 2 pts", page)
+        self.assertIn('<span class="team-seed">(1) </span>Duke', page)
+        # A warm request only checks the version row.
+        self.assertEqual(sum(bool(re.search(r"\bFROM (round|game)\b", statement)) for statement in pick_statements), 0)
+        self.assertEqual(sum("FROM app_setting" in statement for statement in pick_statements), 1)
+        self.assertEqual(sum("sum(pick.points)" in statement for statement in pick_statements), 1)
+        # Signed-out pages that show no rounds or seeds don't touch the database at all.
+        self.assertEqual(statements, pick_statements)
+
+        # Another instance's write moves the version row without touching this process.
+        db.session.execute(text("UPDATE game SET team2 = 'Kansas' WHERE id = :id"), {"id": open_game.id})
+        db.session.execute(
+            text("UPDATE app_setting SET value = 'other-instance' WHERE key = :key"), {"key": TOURNAMENT_VERSION_KEY}
+        )
+        db.session.commit()
+        self.login("nate")
+        self.assertIn(b"Kansas", self.client.get("/pick").data)
+
+    def test_cache_version_bump_is_a_single_upsert(self):
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            bump_cache_version(db.session, "test_version")
+            first = db.session.get(AppSetting, "test_version").value
+            bump_cache_version(db.session, "test_version")
+            db.session.commit()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        db.session.expire_all()
+        self.assertNotEqual(db.session.get(AppSetting, "test_version").value, first)
+        writes = [statement for statement in statements if statement.lstrip().upper().startswith(("INSERT", "UPDATE"))]
+        self.assertEqual(len(writes), 2)
+        self.assertTrue(all("ON CONFLICT" in statement for statement in writes))
+
+    def test_locked_round_shows_cached_pick_distribution(self):
+        users = [self.create_user(name) for name in ("nate", "sam", "alex", "jo")]
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=True)
+        game = self.create_game(round_obj, "UConn", "Purdue")
+        for user, team in zip(users, ("UConn", "UConn", "UConn", "Purdue")):
+            self.create_pick(user, game, team)
+        self.login("nate")
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            first = self.client.get("/pick")
+            second = self.client.get("/pick")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn(b"Picks are locked", first.data)
+        self.assertIn(b"75%", first.data)
+        self.assertIn(b"25%", second.data)
+        self.assertEqual(sum("GROUP BY pick.game_id" in statement for statement in statements), 1)
+
+        self.create_pick(self.create_user("late"), game, "Purdue")
+        distribution = get_pick_distribution(round_obj)
+        self.assertEqual(distribution[game.id]["total"], 5)
+        self.assertEqual(distribution[game.id]["shares"]["purdue"]["percent"], 40)
+
+        # Another instance's edit moves the tournament version row without touching this process.
+        db.session.execute(text("UPDATE pick SET picked_team = 'Purdue' WHERE user_id = :id"), {"id": users[0].id})
+        db.session.execute(
+            text("UPDATE app_setting SET value = 'other-instance' WHERE key = :key"), {"key": TOURNAMENT_VERSION_KEY}
+        )
+        db.session.commit()
+        self.assertEqual(get_pick_distribution(round_obj)[game.id]["shares"]["purdue"]["percent"], 60)
+
+    def test_autosave_upserts_single_pick_atomically(self):
+        user = self.create_user("nate")
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
+        game = self.create_game(round_obj, "UConn", "Purdue")
+        self.login(user.username)
+        self.assertTrue(pick_upsert_available())
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            first = self.client.post("/api/picks", json={"game_id": game.id, "picked_team": "UConn"})
+            second = self.client.post("/api/picks", json={"game_id": game.id, "picked_team": "Purdue"})
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(first.get_json(), {"game_id": game.id, "picked_team": "UConn", "wager": 0})
+        self.assertEqual(second.get_json()["picked_team"], "Purdue")
+        self.assertEqual([pick.picked_team for pick in Pick.query.filter_by(user_id=user.id)], ["Purdue"])
+        writes = [statement for statement in statements if not statement.lstrip().upper().startswith("SELECT")]
+        self.assertEqual(len(writes), 2)
+        self.assertTrue(all("ON CONFLICT (user_id, game_id) DO UPDATE" in statement for statement in writes))
+
+    def test_autosave_rejects_invalid_or_locked_picks(self):
+        user = self.create_user("nate")
+        locked_round = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=True)
+        locked_game = self.create_game(locked_round, "A", "B")
+        open_round = self.create_round("Second Round (Round of 32)", closed=False, closed_for_selection=False)
+        open_game = self.create_game(open_round, "C", "D")
+        self.login(user.username)
+
+        locked = self.client.post("/api/picks", json={"game_id": locked_game.id, "picked_team": "A"})
+        wrong_team = self.client.post("/api/picks", json={"game_id": open_game.id, "picked_team": "A"})
+        missing = self.client.post("/api/picks", json={"picked_team": "C"})
+        wager = self.client.post("/api/picks", json={"game_id": open_game.id, "wager": 5})
+
+        self.assertEqual(locked.status_code, 409)
+        self.assertEqual(wrong_team.status_code, 400)
+        self.assertIn("C or D", wrong_team.get_json()["error"])
+        self.assertEqual(missing.status_code, 400)
+        self.assertEqual(wager.status_code, 400)
+        self.assertEqual(Pick.query.count(), 0)
+
+    def test_autosave_after_sign_out_redirects_to_login_instead_of_json(self):
+        user = self.create_user("nate")
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
+        game = self.create_game(round_obj, "A", "B")
+        self.login(user.username)
+        page = self.client.get("/pick").data
+        self.client.get("/logout")
+
+        response = self.client.post("/api/picks", json={"game_id": game.id, "picked_team": "A"})
+
+        # The pick page script treats a redirect or non-JSON body as an expired session.
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("/login", response.headers["Location"])
+        self.assertIn(b"response.redirected", page)
+        self.assertIn(b"please log in again", page)
+        self.assertEqual(Pick.query.count(), 0)
+
+    def test_autosave_championship_wager_is_clamped_and_needs_a_pick(self):
+        user = self.create_user("nate")
+        closed_round = self.create_round("Elite Eight", point_value=10, closed=True, closed_for_selection=True)
+        scored_game = self.create_game(closed_round, "A", "B", winner="A")
+        self.create_pick(user, scored_game, "A")
+        calculate_points(closed_round)
+        championship = self.create_round("Championship", point_value=16, closed=False, closed_for_selection=False)
+        final = self.create_game(championship, "A", "C")
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX uq_pick_user_game"))
+        self.login(user.username)
+
+        with patch("app._pick_upsert_available", None):
+            early = self.client.post("/api/picks", json={"game_id": final.id, "wager": 5})
+            saved = self.client.post("/api/picks", json={"game_id": final.id, "picked_team": "A", "wager": 50})
+            lowered = self.client.post("/api/picks", json={"game_id": final.id, "wager": 4})
+
+        self.assertEqual(early.status_code, 409)
+        self.assertEqual(saved.get_json(), {"game_id": final.id, "picked_team": "A", "wager": 10})
+        self.assertEqual(lowered.get_json(), {"game_id": final.id, "picked_team": "A", "wager": 4})
+        # Requests never run DDL; the index is left to `flask migrate-pick-index`.
+        with db.engine.connect() as connection:
+            indexes = connection.execute(text("PRAGMA index_list('pick')")).all()
+        self.assertNotIn("uq_pick_user_game", [index[1] for index in indexes])
+
+    def test_pick_index_migration_keeps_the_newest_duplicate(self):
+        user = self.create_user("nate")
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
+        game = self.create_game(round_obj, "UConn", "Purdue")
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX uq_pick_user_game"))
+        self.create_pick(user, game, "UConn")
+        self.create_pick(user, game, "Purdue")
+
+        with patch("app._pick_upsert_available", False):
+            self.assertEqual(migrate_pick_unique_index(), 1)
+            self.assertTrue(pick_upsert_available())
+            self.assertEqual(migrate_pick_unique_index(), 0)
+
+        self.assertEqual([pick.picked_team for pick in Pick.query.all()], ["Purdue"])
+
     def test_pick_page_loads_with_open_round_games(self):
         user = self.create_user("nate")
         round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
@@ -462,6 +1038,31 @@ class AdminRouteTests(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Admin Panel", response.data)
 
+    def test_admin_pick_status_counts_picks_in_one_query(self):
+        admin = self.create_user("admin", is_admin=True)
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
+        games = [self.create_game(round_obj, "A", "B"), self.create_game(round_obj, "C", "D")]
+        for name in ("nate", "sam", "alex"):
+            user = self.create_user(name)
+            for game in games[: 2 if name != "alex" else 1]:
+                self.create_pick(user, game, game.team1)
+        self.login(admin.username)
+        self.client.get("/admin")
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            response = self.client.get(f"/admin?round_id={round_obj.id}")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(response.status_code, 200)
+        pick_statements = [statement for statement in statements if "FROM pick" in statement]
+        self.assertEqual(len(pick_statements), 1)
+        self.assertIn("GROUP BY pick.user_id", pick_statements[0])
+        self.assertFalse(any("FROM game" in statement for statement in statements))
+
     def test_admin_post_updates_round_and_winner(self):
         admin = self.create_user("admin", is_admin=True)
         round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
@@ -629,6 +1230,119 @@ class AdminRouteTests(BaseTestCase):
             response.data,
         )
 
+    def test_admin_import_picks_upserts_csv_rows_and_reports_errors(self):
+        admin = self.create_user("admin", is_admin=True)
+        player = self.create_user("player")
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
+        game1 = self.create_game(round_obj, "Saint Mary's", "Texas A&M")
+        game2 = self.create_game(round_obj, "Duke", "Siena")
+        self.create_pick(player, game2, "Siena")
+        self.login(admin.username)
+
+        csv_body = (
+            "username,matchup,picked_team,wager\n"
+            "player,St. Mary's vs Texas A M,texas a&m,\n"
+            f"Player,{game2.id},Duke,\n"
+            "ghost,Duke vs Siena,Duke,\n"
+            "player,Duke vs Kansas,Duke,\n"
+            "player,Duke vs Siena,Kansas,\n"
+        )
+        response = self.client.post(
+            "/admin_import_picks",
+            data={"picks_file": (io.BytesIO(csv_body.encode("utf-8")), "picks.csv")},
+            content_type="multipart/form-data",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"1 pick(s) created, 1 pick(s) updated, 3 row(s) rejected.", response.data)
+        self.assertIn(b"Unknown user", response.data)
+        self.assertIn(b"No open game matches Duke vs Kansas", response.data)
+        self.assertEqual(Pick.query.filter_by(user_id=player.id, game_id=game1.id).one().picked_team, "Texas A&M")
+        self.assertEqual(Pick.query.filter_by(user_id=player.id, game_id=game2.id).one().picked_team, "Duke")
+        self.assertEqual(Pick.query.filter_by(user_id=player.id).count(), 2)
+
+    def test_admin_import_picks_clamps_championship_wager_from_ndjson(self):
+        admin = self.create_user("admin", is_admin=True)
+        player = self.create_user("player")
+        closed_round = self.create_round("Final Four", point_value=10, closed=True, closed_for_selection=True)
+        scored_game = self.create_game(closed_round, "A", "B", winner="A")
+        self.create_pick(player, scored_game, "A")
+        calculate_points(closed_round)
+        championship = self.create_round("Championship", point_value=16, closed=False, closed_for_selection=False)
+        final_game = self.create_game(championship, "X", "Y")
+        self.login(admin.username)
+
+        body = (
+            '{"username": "player", "game_id": %d, "picked_team": "X", "wager": 999}\n'
+            "not json\n"
+        ) % final_game.id
+        response = self.client.post(
+            "/admin_import_picks",
+            data={"picks_file": (io.BytesIO(body.encode("utf-8")), "picks.ndjson")},
+            content_type="multipart/form-data",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Invalid JSON", response.data)
+        saved_pick = Pick.query.filter_by(user_id=player.id, game_id=final_game.id).one()
+        self.assertEqual(saved_pick.picked_team, "X")
+        self.assertEqual(saved_pick.wager, 10)
+
+    def test_admin_export_picks_streams_filtered_csv(self):
+        admin = self.create_user("admin", is_admin=True)
+        player = self.create_user("player")
+        sweet16 = self.create_round("Sweet 16", point_value=4, closed=True, closed_for_selection=True)
+        elite8 = self.create_round("Elite Eight", point_value=8, closed=True, closed_for_selection=True)
+        game1 = self.create_game(sweet16, "A", "B", winner="A")
+        game2 = self.create_game(elite8, "A", "C", winner="C")
+        self.create_pick(player, game1, "A")
+        self.create_pick(player, game2, "A")
+        self.create_pick(admin, game1, "B")
+        calculate_points(sweet16)
+        self.login(admin.username)
+
+        response = self.client.get(f"/admin_export_picks?format=csv&round_id={sweet16.id}&user_id={player.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertIn("text/csv", response.content_type)
+        lines = response.get_data(as_text=True).strip().splitlines()
+        self.assertEqual(lines[0], "username,round,game_id,game,picked_team,winner,points,wager")
+        self.assertEqual(lines[1:], [f"player,Sweet 16,{game1.id},A vs B,A,A,4,0"])
+
+    def test_admin_export_standings_ndjson_ranks_cumulative_points(self):
+        admin = self.create_user("admin", is_admin=True)
+        player = self.create_user("player")
+        sweet16 = self.create_round("Sweet 16", point_value=4, closed=True, closed_for_selection=True)
+        elite8 = self.create_round("Elite Eight", point_value=8, closed=True, closed_for_selection=True)
+        game1 = self.create_game(sweet16, "A", "B", winner="A")
+        game2 = self.create_game(elite8, "A", "C", winner="C")
+        self.create_pick(player, game1, "A")
+        self.create_pick(admin, game2, "C")
+        calculate_points(sweet16)
+        calculate_points(elite8)
+        self.login(admin.username)
+
+        response = self.client.get("/admin_export_standings?format=ndjson")
+
+        self.assertEqual(response.status_code, 200)
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(
+            [(row["round"], row["username"], row["rank"], row["total_points"]) for row in rows],
+            [
+                ("Sweet 16", "player", 1, 4),
+                ("Sweet 16", "admin", 2, 0),
+                ("Elite Eight", "admin", 1, 8),
+                ("Elite Eight", "player", 2, 4),
+            ],
+        )
+
+    def test_admin_export_requires_admin(self):
+        user = self.create_user("player")
+        self.login(user.username)
+        response = self.client.get("/admin_export_picks", follow_redirects=True)
+        self.assertIn(b"Access denied", response.data)
+
 
 class ViewAndLeaderboardRouteTests(BaseTestCase):
     def test_leaderboard_page_loads(self):
@@ -655,6 +1369,152 @@ class ViewAndLeaderboardRouteTests(BaseTestCase):
         self.assertIn(b"Round Total", response.data)
         self.assertNotIn(b">Result<", response.data)
 
+    def test_leaderboard_serves_standings_as_of_round_with_movement(self):
+        leader = self.create_user("leader")
+        trailer = self.create_user("trailer")
+        sweet16 = self.create_round("Sweet 16", point_value=4, closed=True, closed_for_selection=True)
+        game1 = self.create_game(sweet16, "A", "B", winner="A")
+        self.create_pick(trailer, game1, "A")
+        calculate_points(sweet16)
+        snapshot_standings()
+        elite8 = self.create_round("Elite Eight", point_value=8, closed=True, closed_for_selection=True)
+        game2 = self.create_game(elite8, "A", "C", winner="C")
+        self.create_pick(leader, game2, "C")
+        calculate_points(elite8)
+        snapshot_standings()
+        db.session.commit()
+
+        response = self.client.get("/leaderboard")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Up 1 since last round", response.data)
+        self.assertIn(b"Down 1 since last round", response.data)
+        self.assertIn(b"standingsChart", response.data)
+        self.assertIn(f'id="leaderRound{leader.id}_{elite8.id}"'.encode(), response.data)
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            response = self.client.get(f"/leaderboard?as_of={sweet16.id}")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+        body = response.get_data(as_text=True)
+        self.assertFalse([statement for statement in statements if not statement.lstrip().upper().startswith("SELECT")])
+        self.assertLess(body.index("Trailer (trailer)"), body.index("Leader (leader)"))
+        # Picks from rounds closed after the as-of round aren't shown.
+        self.assertIn(f'id="leaderRound{leader.id}_{sweet16.id}"', body)
+        self.assertNotIn(f'id="leaderRound{leader.id}_{elite8.id}"', body)
+
+        history = self.client.get("/standings_history").get_json()
+        self.assertEqual([r["name"] for r in history["rounds"]], ["Sweet 16", "Elite Eight"])
+
+    def test_admin_close_round_snapshots_standings(self):
+        admin = self.create_user("admin", is_admin=True)
+        round_obj = self.create_round("First Round (Round of 64)", closed=False, closed_for_selection=False)
+        game = self.create_game(round_obj, "A", "B")
+        self.create_pick(admin, game, "A")
+        self.login(admin.username)
+
+        self.client.post(
+            "/admin",
+            data={"round_id": round_obj.id, "closed": "on", "point_value": "2", f"game{game.id}_winner": "A"},
+        )
+
+        self.assertEqual(load_standings_history(), {round_obj.id: [[admin.id, 1, 2]]})
+
+        self.client.post(
+            "/admin",
+            data={"round_id": round_obj.id, "point_value": "2", f"game{game.id}_winner": "A"},
+        )
+
+        self.assertEqual(load_standings_history(), {})
+
+    def test_dashboard_shows_leaders_and_trailers(self):
+        round_obj = self.create_round("Sweet 16", point_value=4, closed=True, closed_for_selection=True)
+        game = self.create_game(round_obj, "A", "B", winner="A")
+        leader = self.create_user("leader")
+        trailer = self.create_user("trailer")
+        self.create_pick(leader, game, "A")
+        calculate_points(round_obj)
+        self.login(trailer.username)
+
+        response = self.client.get("/dashboard")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_data(as_text=True)
+        self.assertIn("@leader", body)
+        self.assertIn("@trailer", body)
+        self.assertLess(body.index("@leader"), body.index("@trailer"))
+
+    def test_bracket_page_renders_parsed_bracket(self):
+        user = self.create_user("nate")
+        self.login(user.username)
+
+        with patch("app.fetch_henrygd_bracket", return_value=(build_tournament_payload(1), None)):
+            response = self.client.get("/bracket")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'data-position="100"', response.data)
+        self.assertIn(b'<span class="bracket-team-name">T64</span>', response.data)
+        self.assertNotIn(b"bracketPositionId", response.data)
+
+    def test_only_syncs_record_fetched_payloads(self):
+        user = self.create_user("nate")
+        self.login(user.username)
+        payload = build_tournament_payload(1)
+
+        with patch("app.fetch_henrygd_bracket", return_value=(payload, None)), patch(
+            "app.record_henrygd_payload"
+        ) as record:
+            self.client.get("/bracket")
+            record.assert_not_called()
+            sync_tournament_from_henrygd()
+
+        record.assert_called_once_with(payload)
+
+    def test_bracket_page_skips_malformed_positions_and_falls_back_to_stored_seeds(self):
+        user = self.create_user("nate")
+        db.session.add(AppSetting(key="team_info", value=json.dumps({"t2": {"name": "T2", "seed": 16}})))
+        db.session.commit()
+        self.login(user.username)
+        payload = build_tournament_payload(1)
+        payload["championships"][0]["games"][1]["bracketPositionId"] = "play-in"
+
+        with patch("app.fetch_henrygd_bracket", return_value=(payload, None)):
+            response = self.client.get("/bracket")
+
+        page = response.get_data(as_text=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('data-position="100"', page)
+        self.assertNotIn('data-position="play-in"', page)
+        self.assertRegex(page, r'<span class="bracket-seed">\(16\)</span>\s*<span class="bracket-team-name">T2</span>')
+
+    def test_bracket_projection_is_laid_out_once_per_payload(self):
+        payload = build_tournament_payload(1)
+        payload["championships"][0]["games"][0]["teams"][0]["seed"] = 1
+        model = get_bracket_model(payload)
+
+        projection = model.projection()
+
+        self.assertIs(model.projection(), projection)
+        self.assertEqual([section["id"] for section in projection["sections"]], ["CC"])
+        rounds = projection["sections"][0]["rounds"]
+        self.assertEqual([len(round_["slots"]) for round_ in rounds], [32, 16, 8, 4, 2, 1])
+        self.assertEqual(rounds[0]["label"], "First Four")
+        self.assertEqual(
+            rounds[0]["slots"][0],
+            {
+                "position_id": 100,
+                "matchup_key": "t1|t2",
+                "teams": [
+                    {"name": "T1", "key": "t1", "seed": 1, "score": None, "winner": True},
+                    {"name": "T2", "key": "t2", "seed": None, "score": None, "winner": False},
+                ],
+            },
+        )
+        self.assertEqual(rounds[1]["slots"][0]["teams"][0]["name"], "T1")
+        self.assertEqual(rounds[-1]["slots"][0]["matchup_key"], None)
+
     def test_view_picks_requires_login(self):
         response = self.client.get("/view_picks")
         self.assertEqual(response.status_code, 302)
@@ -677,12 +1537,287 @@ class ViewAndLeaderboardRouteTests(BaseTestCase):
         calculate_points(closed_round)
 
         self.login(user.username)
-        response = self.client.get("/view_picks")
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            response = self.client.get("/view_picks")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+        self.assertFalse([statement for statement in statements if not statement.lstrip().upper().startswith("SELECT")])
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"View Picks", response.data)
         self.assertIn(b"Round Total", response.data)
         self.assertIn(user.username.encode("utf-8"), response.data)
 
+    def test_closed_round_pick_share_on_view_picks_and_bracket(self):
+        user = self.create_user("nate")
+        other = self.create_user("other")
+        closed_round = self.create_round("First Round (Round of 64)", closed=True, closed_for_selection=True)
+        game = self.create_game(closed_round, "T1", "T2", winner="T1")
+        self.create_pick(user, game, "T1")
+        self.create_pick(other, game, "T2")
+        self.login(user.username)
+
+        response = self.client.get("/view_picks")
+        self.assertIn("Pool split:", response.get_data(as_text=True))
+        self.assertIn("T1 50%", " ".join(response.get_data(as_text=True).split()))
+
+        with patch("app.fetch_henrygd_bracket", return_value=(build_tournament_payload(1), None)):
+            response = self.client.get("/bracket")
+        self.assertIn('T1</span> <span class="bracket-share" title="Share of the pool that picked this team">50%</span>',
+                      " ".join(response.get_data(as_text=True).split()))
+
+    def test_admin_can_profile_a_request_and_download_it(self):
+        admin = self.create_user("admin", is_admin=True)
+        self.create_user("nate")
+        with tempfile.TemporaryDirectory() as profile_dir, patch.dict(app.config, PROFILE_DIR=profile_dir), patch(
+            "app._profiler_last_started", [0.0]
+        ):
+            self.login("nate")
+            response = self.client.get("/leaderboard?profile=1")
+            self.assertNotIn("X-Profile", response.headers)
+            self.assertEqual(os.listdir(profile_dir), [])
+
+            self.client.get("/logout")
+            self.login(admin.username)
+            response = self.client.get("/leaderboard", headers={"X-Profile": "1", "X-Request-ID": "../evil"})
+            profile_url = response.headers["X-Profile"]
+            profile_id = response.headers["X-Request-ID"]
+            self.assertEqual(profile_url, f"/admin_profiles/{profile_id}")
+            self.assertEqual(os.listdir(profile_dir), [f"{profile_id}.prof"])
+
+            response = self.client.get("/leaderboard?profile=1")
+            self.assertEqual(response.headers["X-Profile"], "skipped: rate-limited")
+
+            report = self.client.get(f"{profile_url}?format=text").get_data(as_text=True)
+            self.assertIn("leaderboard", report)
+            self.assertEqual(self.client.get(profile_url).status_code, 200)
+            self.assertEqual(self.client.get("/admin_profiles/missing").status_code, 404)
+
+    def test_metrics_endpoint_is_off_by_default(self):
+        self.assertFalse(app.config["METRICS_ENABLED"])
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+    def test_metrics_endpoint_reports_route_latency_db_time_and_cache_hits(self):
+        metrics.reset()
+        user = self.create_user("nate")
+        self.login(user.username)
+        with patch.dict(app.config, METRICS_ENABLED=True):
+            self.client.get("/leaderboard")
+            self.client.get("/leaderboard")
+        load_user(user.id)
+        load_user(user.id)
+
+        with patch.dict(app.config, METRICS_ENABLED=True, METRICS_TOKEN="secret"):
+            self.assertEqual(self.client.get("/metrics").status_code, 401)
+            response = self.client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+        body = response.get_data(as_text=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE march_madness_http_request_duration_seconds histogram", body)
+        self.assertIn('march_madness_http_requests_total{method="GET",route="/leaderboard",status="200"} 2', body)
+        self.assertIn('march_madness_http_request_duration_seconds_count{method="GET",route="/leaderboard"} 2', body)
+        self.assertRegex(body, r'march_madness_request_db_queries_total\{route="/leaderboard"\} [1-9]')
+        self.assertIn('march_madness_request_db_queries_total{route="/metrics"} 0', body)
+        self.assertIn('march_madness_cache_lookups_total{cache="user",result="hit"}', body)
+
+    def test_metrics_registry_sums_other_worker_snapshots(self):
+        worker = MetricsRegistry()
+        worker.inc("march_madness_syncs_total")
+        worker.observe("march_madness_henrygd_fetch_duration_seconds", 0.3, outcome="ok")
+        local = MetricsRegistry()
+        local.inc("march_madness_syncs_total", 2)
+        local.observe("march_madness_henrygd_fetch_duration_seconds", 12.0, outcome="ok")
+
+        with tempfile.TemporaryDirectory() as metrics_dir:
+            with open(os.path.join(metrics_dir, "1.json"), "w") as worker_file:
+                json.dump(worker.snapshot(), worker_file)
+            body = local.render(metrics_dir)
+
+        self.assertIn("march_madness_syncs_total 3", body)
+        self.assertIn('march_madness_henrygd_fetch_duration_seconds_bucket{outcome="ok",le="0.5"} 1', body)
+        self.assertIn('march_madness_henrygd_fetch_duration_seconds_bucket{outcome="ok",le="+Inf"} 2', body)
+        self.assertIn('march_madness_henrygd_fetch_duration_seconds_sum{outcome="ok"} 12.3', body)
+
+    def test_exited_worker_totals_move_to_the_dead_workers_file(self):
+        with tempfile.TemporaryDirectory() as metrics_dir:
+            for pid, count in ((1, 2), (2, 3)):
+                worker = MetricsRegistry()
+                worker.inc("march_madness_syncs_total", count)
+                with open(os.path.join(metrics_dir, f"{pid}.json"), "w") as worker_file:
+                    json.dump(worker.snapshot(), worker_file)
+                worker.mark_process_dead(metrics_dir, pid)
+            # A new worker reusing pid 1 starts a fresh file without losing the old totals.
+            reused = MetricsRegistry()
+            reused.inc("march_madness_syncs_total")
+            with open(os.path.join(metrics_dir, "1.json"), "w") as worker_file:
+                json.dump(reused.snapshot(), worker_file)
+            files = sorted(name for name in os.listdir(metrics_dir) if name.endswith(".json"))
+            body = MetricsRegistry().render(metrics_dir)
+
+        self.assertEqual(files, ["1.json", "dead-workers.json"])
+        self.assertIn("march_madness_syncs_total 6", body)
+
+    def test_one_summary_line_per_request_with_successes_sampled(self):
+        with patch.dict(app.config, LOG_SAMPLE_RATE=0.0), self.assertLogs("app", level="INFO") as logs:
+            self.client.get("/")
+            self.client.get("/missing-page")
+
+        summaries = [record for record in logs.records if hasattr(record, "request_fields")]
+        self.assertEqual(len(summaries), 1)
+        fields = summaries[0].request_fields
+        self.assertEqual((fields["path"], fields["status"], fields["route"]), ("/missing-page", 404, None))
+        self.assertIn("duration_ms", fields)
+
+    def test_queued_json_log_keeps_request_id_and_fields(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JsonLogFormatter())
+        queue_handler, listener = start_log_queue([handler])
+        test_logger = logging.getLogger("march_madness.test_queue")
+        test_logger.propagate = False
+        test_logger.addHandler(queue_handler)
+        try:
+            with app.test_request_context("/leaderboard"):
+                g.request_id = "req123"
+                test_logger.warning("Request %s done", "GET", extra={"request_fields": {"status": 200}})
+        finally:
+            test_logger.removeHandler(queue_handler)
+            listener.stop()
+
+        entry = json.loads(stream.getvalue())
+        self.assertEqual(entry["request_id"], "req123")
+        self.assertEqual(entry["message"], "Request GET done")
+        self.assertEqual(entry["status"], 200)
+
+    def test_restarted_log_queue_writes_through_a_new_thread(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        queue_handler, listener = start_log_queue([handler])
+        test_logger = logging.getLogger("march_madness.test_fork")
+        test_logger.propagate = False
+        test_logger.addHandler(queue_handler)
+        new_listener = restart_log_queue(queue_handler, listener)
+        try:
+            test_logger.warning("after fork")
+        finally:
+            test_logger.removeHandler(queue_handler)
+            new_listener.stop()
+            listener.stop()
+
+        self.assertIsNot(new_listener, listener)
+        self.assertIs(queue_handler.queue, new_listener.queue)
+        self.assertEqual(new_listener.handlers, (handler,))
+        self.assertIn("after fork", stream.getvalue())
+
+    def test_archived_seasons_are_served_without_the_live_database(self):
+        nate = self.create_user("nate")
+        other = self.create_user("other")
+        final_four = self.create_round("Final Four", point_value=16, closed=True, closed_for_selection=True)
+        championship = self.create_round("Championship", point_value=16, closed=True, closed_for_selection=True)
+        semifinal = self.create_game(final_four, "Duke", "Houston", winner="Duke")
+        final = self.create_game(championship, "Duke", "Florida", winner="Florida")
+        self.create_pick(nate, semifinal, "Duke")
+        self.create_pick(other, semifinal, "Houston")
+        self.create_pick(nate, final, "Duke", wager=10)
+        self.create_pick(other, final, "Florida", wager=5)
+        calculate_points(final_four)
+        calculate_points(championship)
+
+        with tempfile.TemporaryDirectory() as season_dir, patch.dict(app.config, SEASON_ARCHIVE_DIR=season_dir):
+            self.assertIsNone(app.test_cli_runner().invoke(args=["archive-season", "--year", "2025"]).exception)
+            archive_season(2026)
+
+            db.session.query(Pick).delete()
+            db.session.query(Game).delete()
+            db.session.query(Round).delete()
+            db.session.commit()
+
+            season = " ".join(self.client.get("/seasons/2025").get_data(as_text=True).split())
+            all_time = " ".join(self.client.get("/seasons").get_data(as_text=True).split())
+            missing = self.client.get("/seasons/1999")
+
+        self.assertIn("2025 Final Standings", season)
+        self.assertIn("Florida won it all.", season)
+        self.assertIn('<td class="text-center">#1</td> <td>Nate (nate)</td> <td class="text-center">16</td> '
+                      '<td class="text-center">-10</td> <td class="text-end"><strong>6</strong></td>', season)
+        self.assertIn('<td>Nate (nate)</td> <td class="text-center">2</td> <td class="text-center">#1</td> '
+                      '<td class="text-center">2</td> <td class="text-end">12</td>', all_time)
+        self.assertIn("2026 · Florida", all_time)
+        self.assertEqual(missing.status_code, 302)
+
+    def test_pages_link_versioned_assets_and_only_leaderboard_loads_chartjs(self):
+        with patch("app._asset_manifest", {}):
+            home = self.client.get("/").get_data(as_text=True)
+            leaderboard = self.client.get("/leaderboard").get_data(as_text=True)
+
+        self.assertRegex(home, r'href="/static/css/base\.css\?v=[0-9a-f]{12}"')
+        self.assertRegex(home, r'src="/static/js/home\.js\?v=[0-9a-f]{12}"')
+        self.assertNotIn("<style>", home)
+        self.assertNotIn("chart.js", home)
+        self.assertIn("chart.js@4.4.1", leaderboard)
+        self.assertIn('id="standingsHistoryData"', leaderboard)
+
+        asset = self.client.get(re.search(r'href="(/static/css/base\.css\?v=[0-9a-f]+)"', home).group(1))
+        stale = self.client.get("/static/css/base.css?v=000000000000")
+        try:
+            self.assertEqual(asset.headers["Cache-Control"], "public, max-age=31536000, immutable")
+            self.assertNotIn("immutable", stale.headers.get("Cache-Control", ""))
+        finally:
+            asset.close()
+            stale.close()
+
+    def test_build_assets_fingerprints_and_subsets(self):
+        with tempfile.TemporaryDirectory() as static_dir:
+            for source_dir in ("css", "js"):
+                os.makedirs(os.path.join(static_dir, source_dir))
+            Path(static_dir, "css", "base.css").write_text("body { color: red; }\n")
+            Path(static_dir, "js", "base.js").write_text("function showLoading() {}\n")
+            with patch.object(app, "_static_folder", static_dir), patch("app._asset_manifest", None):
+                manifest = fingerprint_static_assets()
+                with app.test_request_context():
+                    url = asset_url("css/base.css")
+                self.assertEqual(url, f"/static/dist/{manifest['files']['css/base.css']}")
+                self.assertRegex(manifest["files"]["js/base.js"], r"^base\.[0-9a-f]{12}\.js$")
+                self.assertTrue(os.path.exists(os.path.join(static_dir, "dist", "manifest.json")))
+                built = self.client.get(url)
+                unbuilt = self.client.get("/static/css/base.css")
+                try:
+                    self.assertEqual(built.headers["Cache-Control"], "public, max-age=31536000, immutable")
+                    self.assertNotIn("immutable", unbuilt.headers.get("Cache-Control", ""))
+                finally:
+                    built.close()
+                    unbuilt.close()
+
+        font_awesome = '.fa-lock:before{content:"\\f023"}.fa-fire:before,.fa-burn:before{content:"\\f06d"}.fa-spin{animation:x}'
+        self.assertEqual(
+            subset_font_awesome_css(font_awesome, {"lock", "burn"}),
+            '.fa-lock:before{content:"\\f023"}.fa-burn:before{content:"\\f06d"}.fa-spin{animation:x}',
+        )
+        google_fonts = "/* cyrillic */\n@font-face { src: url(a.woff2); }\n/* latin */\n@font-face { src: url(b.woff2); }\n"
+        self.assertEqual(subset_google_fonts_css(google_fonts), "/* latin */\n@font-face { src: url(b.woff2); }\n")
+
+    def test_build_assets_rejects_vendor_downloads_that_miss_their_pin(self):
+        content = b"console.log('bootstrap');"
+        pinned = "sha384-" + base64.b64encode(hashlib.sha384(content).digest()).decode("ascii")
+        assets = {
+            "bootstrap_js": ("vendor/bootstrap.js", "https://cdn.example/bootstrap.js", pinned),
+            "chart_js": ("vendor/chart.js", "https://cdn.example/chart.js", None),
+        }
+        with tempfile.TemporaryDirectory() as static_dir:
+            with patch.object(app, "_static_folder", static_dir), patch("app.VENDOR_ASSETS", assets):
+                with patch("app._download", return_value=content) as download:
+                    written = vendor_static_assets(force=True)
+                self.assertEqual([os.path.relpath(path, static_dir) for path in written], [os.path.join("vendor", "bootstrap.js")])
+                # Unpinned libraries are never downloaded; they keep loading from the CDN.
+                download.assert_called_once_with("https://cdn.example/bootstrap.js")
+
+                with patch("app._download", return_value=content + b"tampered"):
+                    with self.assertRaisesRegex(RuntimeError, "does not match its pinned digest"):
+                        vendor_static_assets(force=True)
+                self.assertEqual(Path(static_dir, "vendor", "bootstrap.js").read_bytes(), content)
+
     def test_static_images_send_cache_headers(self):
         response = self.client.get("/static/nate.png")
         try:
@@ -694,5 +1829,295 @@ class ViewAndLeaderboardRouteTests(BaseTestCase):
             response.close()
 
 
+class TemplateBytecodeCacheTests(unittest.TestCase):
+    def test_precompiled_templates_load_without_compiling(self):
+        with tempfile.TemporaryDirectory() as build_dir, tempfile.TemporaryDirectory() as runtime_dir:
+            timings = precompile_templates(build_dir)
+            self.assertIn("base.html", [name for name, _ in timings])
+
+            env = app.jinja_env.overlay(bytecode_cache=TemplateBytecodeCache(build_dir, runtime_dir), cache_size=0)
+            with patch.object(env, "compile", side_effect=AssertionError("template was recompiled")):
+                env.get_template("base.html")
+            self.assertEqual(os.listdir(runtime_dir), [])
+
+    def test_runtime_compiles_are_written_to_the_runtime_directory(self):
+        with tempfile.TemporaryDirectory() as runtime_dir:
+            missing_build_dir = os.path.join(runtime_dir, "not-shipped")
+            env = app.jinja_env.overlay(
+                bytecode_cache=TemplateBytecodeCache(missing_build_dir, runtime_dir),
+                cache_size=0,
+            )
+            env.get_template("login.html")
+            self.assertEqual(len([name for name in os.listdir(runtime_dir) if name.endswith(".jinja")]), 1)
+
+            with patch.object(env, "compile", side_effect=AssertionError("template was recompiled")):
+                env.get_template("login.html")
+
+
+class ReadReplicaRoutingTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.replica_dir = tempfile.TemporaryDirectory()
+        replica_engine = configure_read_replica(f"sqlite:///{Path(self.replica_dir.name) / 'replica.db'}")
+        db.metadata.create_all(replica_engine)
+        with replica_engine.begin() as connection:
+            connection.execute(
+                User.__table__.insert(),
+                {"username": "replica_only", "password_hash": "x", "fun_name": "Replica Only", "picture": "nate.png"},
+            )
+
+    def tearDown(self):
+        configure_read_replica(None)
+        self.replica_dir.cleanup()
+        super().tearDown()
+
+    def get_leaderboard(self):
+        # Each real request gets a fresh session and g; the shared test app context does not.
+        db.session.remove()
+        g.pop("_login_user", None)
+        return self.client.get("/leaderboard")
+
+    def test_get_reads_replica_until_the_user_writes(self):
+        self.create_user("nate")
+        round_obj = self.create_round("First Round (Round of 64)")
+        game_id = self.create_game(round_obj, "A", "B").id
+
+        response = self.get_leaderboard()
+        self.assertIn(b"replica_only", response.data)
+        self.assertNotIn(b"(nate)", response.data)
+
+        self.login("nate")
+        with self.client.session_transaction() as session:
+            self.assertNotIn("db_primary_until", session)
+        self.client.post("/pick", data={f"game{game_id}": "A"})
+        with self.client.session_transaction() as session:
+            self.assertIn("db_primary_until", session)
+        response = self.get_leaderboard()
+        self.assertIn(b"(nate)", response.data)
+        self.assertNotIn(b"replica_only", response.data)
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        configure_read_replica(f"sqlite:///{Path(self.replica_dir.name) / 'missing' / 'replica.db'}")
+        self.create_user("nate")
+
+        response = self.get_leaderboard()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"(nate)", response.data)
+        self.assertFalse(read_replica_available())
+
+
+class StandInHenryGDServer:
+    """Local HTTP/1.1 stand-in for the HenryGD API.
+
+    ``routes`` maps a path to a JSON body; ``statuses`` queues status codes for the next
+    responses; ``delay`` slows every response down to expose sequential fetching.
+    """
+
+    def __init__(self, routes=None, delay=0):
+        self.routes = routes or {}
+        self.statuses = []
+        self.delay = delay
+        self.connections = 0
+        self.requests = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                stand_in.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                stand_in.requests.append(self.path)
+                if stand_in.delay:
+                    time.sleep(stand_in.delay)
+                status = stand_in.statuses.pop(0) if stand_in.statuses else 200
+                body = json.dumps(stand_in.routes.get(self.path, {"path": self.path})).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    def client(self, **kwargs):
+        kwargs.setdefault("backoff_seconds", 0)
+        return HenryGDClient(base_url=self.url, **kwargs)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class LiveScoresTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        payload = build_tournament_payload(0)
+        for contest_id, game in enumerate(payload["championships"][0]["games"][:4], start=9001):
+            game.update(contestId=contest_id, gameState="I")
+        routes = {"/brackets/basketball-men/d1/2026": payload}
+        for contest_id, (team1, team2) in enumerate([("T1", "T2"), ("T3", "T4"), ("T5", "T6"), ("T7", "T8")], start=9001):
+            routes[f"/game/{contest_id}"] = {
+                "contests": [{
+                    "gameState": "I",
+                    "currentPeriod": "2nd",
+                    "contestClock": "10:31",
+                    "teams": [{"nameShort": team2, "score": 45}, {"nameShort": team1, "score": 40}],
+                }]
+            }
+        self.stand_in = StandInHenryGDServer(routes, delay=0.2)
+        self.client_patch = patch("app.get_henrygd_client", return_value=self.stand_in.client())
+        self.client_patch.start()
+        self.config_patch = patch.dict(app.config, LIVE_SCORES_ENABLED=True)
+        self.config_patch.start()
+        self.cache_patch = patch.dict(
+            "app._live_scores", {"expires_at": 0.0, "scores": [], "loaded": False, "refresh_started": None}
+        )
+        self.cache_patch.start()
+
+        self.user = self.create_user("nate")
+        first_round = self.create_round("First Round (Round of 64)", point_value=2, closed=True, closed_for_selection=True)
+        for game_index in range(32):
+            game = self.create_game(first_round, f"T{game_index * 2 + 1}", f"T{game_index * 2 + 2}")
+            if game_index < 4:
+                self.create_pick(self.user, game, game.team2)
+
+    def tearDown(self):
+        self.cache_patch.stop()
+        self.config_patch.stop()
+        self.client_patch.stop()
+        self.stand_in.close()
+        super().tearDown()
+
+    def test_live_scores_are_fetched_concurrently_and_cached(self):
+        started = time.perf_counter()
+        scores = get_live_scores()
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(scores), 4)
+        self.assertEqual((scores[0].team1, scores[0].score1, scores[0].score2, scores[0].clock), ("T1", 40, 45, "10:31"))
+        # Four 0.2s game fetches plus the bracket fetch would take a second back to back.
+        self.assertLess(elapsed, 0.8)
+        requests_made = len(self.stand_in.requests)
+        self.assertIs(get_live_scores(), scores)
+        self.assertEqual(len(self.stand_in.requests), requests_made)
+
+    def test_expired_live_scores_are_served_while_one_thread_refreshes(self):
+        stale = [object()]
+        _live_scores.update(expires_at=0.0, scores=stale, loaded=True)
+
+        started = time.perf_counter()
+        self.assertIs(get_live_scores(), stale)
+        self.assertIs(get_live_scores(), stale)
+        # Neither caller waited on the 0.2s HenryGD responses.
+        self.assertLess(time.perf_counter() - started, 0.2)
+
+        deadline = time.monotonic() + 5
+        while _live_scores["scores"] is stale and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(len(_live_scores["scores"]), 4)
+        # One refresh: a bracket fetch plus the four games.
+        self.assertEqual(len(self.stand_in.requests), 5)
+
+    def test_cold_start_waits_at_most_the_wait_budget_for_live_scores(self):
+        with patch.dict(app.config, LIVE_SCORES_WAIT_SECONDS=0.05):
+            started = time.perf_counter()
+            self.assertEqual(get_live_scores(), [])
+            self.assertLess(time.perf_counter() - started, 0.2)
+
+            deadline = time.monotonic() + 5
+            while not _live_scores["loaded"] and time.monotonic() < deadline:
+                time.sleep(0.02)
+        self.assertEqual(len(get_live_scores()), 4)
+
+    def test_leaderboard_shows_live_scores_and_provisional_points(self):
+        self.create_user("chris")
+
+        response = self.client.get("/leaderboard")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Live now", response.data)
+        self.assertIn(b"+8 live", response.data)
+        self.assertIn(b"Projected #1 with 8 pts", response.data)
+
+    def test_live_scores_skip_fetching_when_no_locked_games_are_undecided(self):
+        Game.query.update({"winner": Game.team1})
+        db.session.commit()
+
+        self.assertEqual(get_live_scores(), [])
+        self.assertEqual(self.stand_in.requests, [])
+
+
+class HenryGDClientTests(unittest.TestCase):
+    def setUp(self):
+        self.stand_in = StandInHenryGDServer()
+        self.client = self.stand_in.client(max_attempts=3)
+
+    def tearDown(self):
+        self.client.close()
+        self.stand_in.close()
+
+    def test_get_json_reuses_keep_alive_connection(self):
+        self.assertEqual(self.client.get_json("/brackets/a"), {"path": "/brackets/a"})
+        self.assertFalse(self.client.last_timing["reused"])
+        self.assertEqual(self.client.get_json("/brackets/b"), {"path": "/brackets/b"})
+        self.assertTrue(self.client.last_timing["reused"])
+        self.assertEqual(self.client.last_timing["connect_ms"], 0.0)
+        self.assertEqual(self.stand_in.connections, 1)
+
+    def test_get_json_retries_server_errors_then_gives_up(self):
+        self.stand_in.statuses = [503, 502]
+        self.assertEqual(self.client.get_json("/brackets/a"), {"path": "/brackets/a"})
+        self.assertEqual(self.client.last_timing["attempts"], 3)
+
+        self.stand_in.statuses = [503, 503, 503]
+        with self.assertRaisesRegex(RuntimeError, "HenryGD API error 503"):
+            self.client.get_json("/brackets/a")
+
+        self.stand_in.statuses = [404]
+        with self.assertRaisesRegex(RuntimeError, "HenryGD API error 404"):
+            self.client.get_json("/brackets/a")
+        self.assertEqual(self.client.last_timing["attempts"], 1)
+
+
+class ColdStartTests(unittest.TestCase):
+    def test_vercel_entry_point_defers_sync_only_imports(self):
+        code = (
+            "import json, sys\n"
+            "baseline = set(sys.modules)\n"
+            "import index\n"
+            "print(json.dumps(sorted(set(sys.modules) - baseline)))\n"
+        )
+        env = dict(os.environ, VERCEL="1", LOG_LEVEL="WARNING")
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported = set(json.loads(result.stdout.strip().splitlines()[-1]))
+        self.assertIn("app", imported)
+        self.assertNotIn("urllib.request", imported)
+        self.assertNotIn("dotenv", imported)
+
+    def test_cold_start_stays_within_the_default_budgets(self):
+        import bench
+
+        output = io.StringIO()
+        with patch("sys.stdout", output), patch("sys.stderr", output):
+            exit_code = bench.main(["coldstart", "--runs", "3", "--top", "0"])
+        self.assertEqual(exit_code, 0, output.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()